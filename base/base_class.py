@@ -2,22 +2,54 @@ import datetime
 import time
 import re
 import os
+import sys
 import allure
 
-from selenium import webdriver
-from selenium.common import TimeoutException
+from selenium.common import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import Select
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver import Keys
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from typing import Dict, Type, Optional
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type, Optional
 
-# Путь к драйверу
-WINDOWS_DRIVER_PATH = os.path.join('resource', 'windows', 'chromedriver.exe')
+from base.driver_service import DriverServiceManager, service_manager
+from base.launch_profile import LaunchProfile, get_profile
+from base.metrics import timed
+from base.profile_template import profile_template
+from base.request_filter import RequestFilterProfile, request_filter
+from base.screenshot_writer import screenshot_writer
+from base.step_log import step_log
+from base.timeout_policy import TimeoutPolicy, timeout_policy
+from base.scripts import (CLEAR_FIELD_SCRIPT, ELEMENT_STATE_SCRIPT, FILL_FIELDS_SCRIPT, READ_FIELDS_SCRIPT,
+                          WAIT_FOR_CONDITION_SCRIPT)
+
+# Способы очистки поля в backspace_all_and_input:
+# 'select_all' - выделение всего текста и удаление одним аккордом клавиш,
+# 'native_clear' - WebElement.clear() с повторной генерацией событий,
+# 'js' - сброс значения скриптом с генерацией событий,
+# 'backspace' - посимвольное нажатие Backspace (прежнее поведение)
+CLEAR_STRATEGIES = ('select_all', 'native_clear', 'js', 'backspace')
+
+# Движки ожидания: 'observer' - ожидание в браузере через MutationObserver (execute_async_script),
+# 'webdriver' - опрос через WebDriverWait (прежнее поведение)
+WAIT_ENGINES = ('observer', 'webdriver')
+
+# Условия движка 'observer' для типов ожидания get_element
+OBSERVER_WAIT_CONDITIONS = {
+    'clickable': 'clickable',
+    'visible': 'visible',
+    'located': 'located',
+    'invisibility': 'invisible',
+}
+
+# Типы ожидания, результат которых можно кэшировать
+CACHEABLE_WAIT_TYPES = ('clickable', 'visible', 'located', 'find')
+
+# Таймаут асинхронных скриптов драйвера, должен быть больше любого таймаута ожидания
+ASYNC_SCRIPT_TIMEOUT = 120
 
 
 class Base:
@@ -25,6 +57,23 @@ class Base:
     Базовый класс, содержащий методы для взаимодействия с веб-драйвером.
     """
     driver: WebDriver
+    # Способ очистки поля по умолчанию, задается переменной окружения CELLLIST_CLEAR_STRATEGY
+    clear_strategy: str = os.environ.get('CELLLIST_CLEAR_STRATEGY', 'select_all')
+    # Движок ожидания, задается переменной окружения CELLLIST_WAIT_ENGINE
+    wait_engine: str = os.environ.get('CELLLIST_WAIT_ENGINE', 'observer')
+    # Сколько секунд flexible_assert_word ждет совпадения текста перед проверкой
+    assert_timeout: float = 5.0
+    # Интервал дополнительной проверки условия в браузере, мс
+    observer_poll_ms: int = 25
+    # Кэш найденных элементов страницы, включается переменной окружения CELLLIST_ELEMENT_CACHE=1
+    element_cache_enabled: bool = os.environ.get('CELLLIST_ELEMENT_CACHE') == '1'
+    # Сброс открытой страницы без перезагрузки между тестами, включается переменной окружения CELLLIST_PAGE_RESET=1:
+    # браузер из пула не уходит на about:blank, страница сбрасывается при следующем открытии
+    page_reset_enabled: bool = os.environ.get('CELLLIST_PAGE_RESET') == '1'
+    # Профиль блокировки запросов страницы (RequestFilter), задается в классах страниц
+    request_profile: Optional[RequestFilterProfile] = None
+    # Политика таймаутов и интервала опроса get_element
+    timeout_policy: TimeoutPolicy = timeout_policy
     
     def __init__(self, driver: WebDriver) -> None:
         """
@@ -36,45 +85,219 @@ class Base:
             Драйвер для управления браузером.
         """
         self.driver = driver
+        self._element_cache: Dict[Tuple[str, str], WebElement] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     """ Get driver """
     
     @classmethod
-    def get_driver(cls: Type['Base']) -> 'Base':
+    @timed('driver_startup')
+    def get_driver(cls: Type['Base'], manager: Optional[DriverServiceManager] = None,
+                   profile: Optional[LaunchProfile] = None, user_data_dir: Optional[str] = None) -> 'Base':
         """
         Создает и возвращает экземпляр драйвера и класса.
+        Сессия браузера открывается на общем для воркера процессе chromedriver.
+        Если включен шаблон профиля (profile_template), браузер запускается с копией прогретого шаблона.
+
+        Parameters
+        ----------
+        manager : DriverServiceManager, optional
+            Менеджер сервиса chromedriver. По умолчанию общий менеджер процесса.
+        profile : LaunchProfile, optional
+            Профиль запуска браузера. По умолчанию профиль из CELLLIST_LAUNCH_PROFILE.
+        user_data_dir : str, optional
+            Папка профиля Chrome. По умолчанию копия шаблона профиля или временный пустой профиль.
 
         Returns
         -------
         Base
             Экземпляр класса Base с инициализированным веб-драйвером.
         """
-        options = webdriver.ChromeOptions()
-        
-        # Настройки для Windows
-        chrome_driver_path = WINDOWS_DRIVER_PATH
-        options.add_argument('--window-size=1920x1080')
+        profile = profile or get_profile()
+        warm_profile = False
+        if user_data_dir is None and profile_template.enabled:
+            user_data_dir = profile_template.clone(
+                lambda path: cls._build_profile_template(path, manager, profile))
+            warm_profile = user_data_dir is not None
+        options = profile.build_options(user_data_dir)
         
-        service = Service(chrome_driver_path)
-        driver = webdriver.Chrome(options=options, service=service)
+        start = time.perf_counter()
+        driver = (manager or service_manager).new_driver(options)
+        profile.record_startup(time.perf_counter() - start)
+        driver.launch_profile = profile
+        driver.warm_profile = warm_profile
+        driver.set_script_timeout(ASYNC_SCRIPT_TIMEOUT)
         
-        with allure.step("Start test"):
-            print("Start test")
+        step_log.info("Start test")
         
         return cls(driver)
     
+    @classmethod
+    def _build_profile_template(cls: Type['Base'], path: str, manager: Optional[DriverServiceManager],
+                                profile: LaunchProfile) -> None:
+        """
+        Собирает шаблон профиля: запускает браузер с пустым профилем в папке path, дважды выполняет прогрев
+        profile_template.warm_up (вторая загрузка сохраняет скомпилированный код JS) и закрывает браузер,
+        чтобы Chrome записал кэши на диск.
+
+        Parameters
+        ----------
+        path : str
+            Папка шаблона профиля.
+        manager : DriverServiceManager or None
+            Менеджер сервиса chromedriver.
+        profile : LaunchProfile
+            Профиль запуска браузера.
+        """
+        base = cls.get_driver(manager, profile, user_data_dir=path)
+        try:
+            if profile_template.warm_up is not None:
+                for _ in range(2):
+                    profile_template.warm_up(base)
+        finally:
+            base.test_finish()
+    
     """ Test finish """
     
+    @timed('driver_quit')
     def test_finish(self) -> None:
         """
         Завершает тест и закрывает браузер.
         """
-        with allure.step("Test finish"):
-            print("Test finish")
+        with step_log.step("Test finish"):
             self.driver.quit()
     
+    """ Check browser health """
+    
+    @timed('is_alive')
+    def is_alive(self) -> bool:
+        """
+        Проверяет, что браузер отвечает на команды.
+
+        Returns
+        -------
+        bool
+            True, если браузер отвечает, иначе False.
+        """
+        try:
+            self.driver.execute_script("return document.readyState")
+            return True
+        except WebDriverException:
+            return False
+    
+    """ Reset browser state """
+    
+    @timed('reset_state')
+    def reset_state(self) -> bool:
+        """
+        Сбрасывает состояние браузера для повторного использования: закрывает лишние вкладки,
+        очищает localStorage, sessionStorage и cookies, затем открывает about:blank.
+        С page_reset_enabled открытая страница остается, чтобы следующий тест сбросил ее без перезагрузки.
+
+        Returns
+        -------
+        bool
+            True, если сброс прошел успешно, иначе False.
+        """
+        try:
+            handles = self.driver.window_handles
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(handles[0])
+            self.driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+            self.driver.delete_all_cookies()
+            if not self.page_reset_enabled:
+                self.driver.get('about:blank')
+            return True
+        except WebDriverException as error:
+            step_log.info("Reset browser state failed: %s", error)
+            return False
+    
+    """ Navigate with request filter """
+    
+    def navigate(self, url: str, ready: Optional[Callable[[], None]] = None) -> None:
+        """
+        Открывает адрес; если фильтр запросов включен и у страницы есть request_profile, запросы
+        по профилю блокируются через CDP, а загруженное и сэкономленное выводится в журнал шагов.
+        В режиме 'verify' при первом открытии адреса страница сначала загружается без фильтра
+        для замера, затем с фильтром, и проверяется функцией ready.
+
+        Parameters
+        ----------
+        url : str
+            Адрес страницы.
+        ready : callable, optional
+            Проверка, что страница загрузилась и работает; должна бросать исключение при ошибке.
+            Вызывается перед замером запросов страницы.
+
+        Raises
+        ------
+        AssertionError
+            В режиме 'verify', если страница не работает с фильтром или профиль блокирует нужный странице запрос.
+        """
+        profile = self.request_profile if request_filter.mode != 'off' else None
+        if profile is None:
+            request_filter.apply(self.driver, None)
+            self.driver.get(url)
+            return
+        
+        page = None
+        if request_filter.needs_baseline(url):
+            with step_log.step("Load %s without request filter", url):
+                request_filter.apply(self.driver, None)
+                self.driver.get(url)
+                if ready is not None:
+                    ready()
+                page = request_filter.record_baseline(url, profile, request_filter.measure(self.driver))
+        
+        request_filter.apply(self.driver, profile)
+        self.driver.get(url)
+        if page is None:
+            request_filter.record_navigation(url, request_filter.measure(self.driver))
+            return
+        
+        # Режим 'verify': страница должна работать с фильтром, а профиль не должен блокировать нужные запросы
+        with step_log.step("Verify page with request filter '%s'", profile.name):
+            try:
+                if ready is not None:
+                    ready()
+            except Exception as error:
+                request_filter.record_navigation(url, request_filter.measure(self.driver), verified=False)
+                raise AssertionError(f"Page {url} does not work with request filter '{profile.name}': "
+                                     f"{type(error).__name__}: {error}") from error
+            request_filter.record_navigation(url, request_filter.measure(self.driver), verified=not page['conflicts'])
+            assert not page['conflicts'], \
+                f"Request filter '{profile.name}' blocks allowed requests: {page['conflicts']}"
+    
+    """ Browser metrics """
+    
+    def browser_metrics(self, collect_garbage: bool = False) -> Dict[str, float]:
+        """
+        Возвращает метрики вкладки браузера через CDP (Performance.getMetrics):
+        JSHeapUsedSize, JSHeapTotalSize, Nodes, JSEventListeners и другие.
+
+        Parameters
+        ----------
+        collect_garbage : bool, optional
+            Запустить сборку мусора перед замером, чтобы размер кучи был стабильнее. По умолчанию False.
+
+        Returns
+        -------
+        dict
+            Имя метрики -> значение (размеры в байтах).
+        """
+        if collect_garbage:
+            self.driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+        self.driver.execute_cdp_cmd('Performance.enable', {})
+        metrics = self.driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+        return {metric['name']: metric['value'] for metric in metrics}
+    
     """ Get element with choosing a method for obtaining an element """
     
+    @timed('get_element', split_by='wait_type')
     def get_element(self, element_info: Dict[str, str], wait_type: str = 'clickable') \
             -> Dict[str, Optional[WebElement]]:
         """
@@ -83,43 +306,185 @@ class Base:
         Parameters
         ----------
         element_info : dict
-            Информация о локаторе элемента.
+            Информация о локаторе элемента. Необязательные ключи: "timeout" - таймаут в секундах (число
+            или словарь по типам ожидания) и "poll" - интервал опроса WebDriverWait в секундах.
         wait_type : str, optional
             Тип ожидания: 'clickable', 'visible', 'located', 'find', или 'invisibility'. По умолчанию 'clickable'.
+            Таймаут выбирает timeout_policy (см. TimeoutPolicy).
 
         Returns
         -------
         dict
             Словарь с информацией о найденном элементе или None, если элемент не найден.
         """
+        cache_key = (element_info['xpath'], wait_type)
+        use_cache = self.element_cache_enabled and wait_type in CACHEABLE_WAIT_TYPES
+        if use_cache:
+            element = self._get_cached_element(cache_key)
+            if element is not None:
+                return {'name': element_info['name'], 'element': element}
+        
+        # Таймаут и интервал опроса выбираются политикой: по локатору, истории ожиданий или типу ожидания
+        timeout = self.timeout_policy.timeout(element_info, wait_type)
+        poll = self.timeout_policy.poll(element_info)
+        start = time.perf_counter()
         try:
-            if wait_type == 'clickable':
-                element = WebDriverWait(self.driver, 60).until(
+            if self.wait_engine == 'observer' and wait_type in OBSERVER_WAIT_CONDITIONS:
+                element = self.wait_for_condition(element_info, OBSERVER_WAIT_CONDITIONS[wait_type], timeout=timeout)
+            elif wait_type == 'clickable':
+                element = WebDriverWait(self.driver, timeout, poll_frequency=poll).until(
                     EC.element_to_be_clickable((By.XPATH, element_info['xpath'])))
             elif wait_type == 'visible':
-                element = WebDriverWait(self.driver, 15).until(
+                element = WebDriverWait(self.driver, timeout, poll_frequency=poll).until(
                     EC.visibility_of_element_located((By.XPATH, element_info['xpath'])))
             elif wait_type == 'located':
-                element = WebDriverWait(self.driver, 60).until(
+                element = WebDriverWait(self.driver, timeout, poll_frequency=poll).until(
                     EC.presence_of_element_located((By.XPATH, element_info['xpath'])))
             elif wait_type == 'find':
                 element = self.driver.find_element(By.XPATH, element_info['xpath'])
             elif wait_type == 'invisibility':
-                WebDriverWait(self.driver, 60).until(
+                WebDriverWait(self.driver, timeout, poll_frequency=poll).until(
                     EC.invisibility_of_element_located((By.XPATH, element_info['xpath'])))
                 element = None
             else:
                 raise ValueError(f"Unsupported wait type: {wait_type}")
             
+            if wait_type != 'find':
+                self.timeout_policy.record(element_info, wait_type, time.perf_counter() - start)
+            if use_cache and element is not None:
+                self._element_cache[cache_key] = element
             return {'name': element_info['name'], 'element': element}
         
         except TimeoutException:
-            message = f"Element '{element_info['name']}' is not {wait_type}"
-            with allure.step(message):
-                print(message)
+            step_log.info("Element '%s' is not %s in %ss", element_info['name'], wait_type, timeout)
             if wait_type == 'visible':
                 return {'name': element_info['name'], 'element': None}
-            raise TimeoutException(message)
+            raise TimeoutException(f"Element '{element_info['name']}' is not {wait_type} in {timeout}s")
+    
+    """ Element cache """
+    
+    def _get_cached_element(self, cache_key: Tuple[str, str]) -> Optional[WebElement]:
+        """
+        Возвращает закэшированный элемент, если он все еще в DOM и удовлетворяет типу ожидания.
+        Устаревший элемент удаляется из кэша.
+
+        Parameters
+        ----------
+        cache_key : tuple
+            Пара (xpath, тип ожидания).
+
+        Returns
+        -------
+        WebElement or None
+            Элемент из кэша или None при промахе.
+        """
+        element = self._element_cache.get(cache_key)
+        if element is not None:
+            try:
+                if self.driver.execute_script(ELEMENT_STATE_SCRIPT, element, cache_key[1]):
+                    self.cache_hits += 1
+                    return element
+            except WebDriverException:
+                pass
+            del self._element_cache[cache_key]
+        self.cache_misses += 1
+        return None
+    
+    def invalidate_element_cache(self) -> None:
+        """
+        Очищает кэш элементов страницы (после навигации или изменения DOM).
+        """
+        self._element_cache.clear()
+    
+    def element_cache_stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику кэша элементов.
+
+        Returns
+        -------
+        dict
+            Количество попаданий (hits), промахов (misses) и элементов в кэше (size).
+        """
+        return {'hits': self.cache_hits, 'misses': self.cache_misses, 'size': len(self._element_cache)}
+    
+    """ Run async script """
+    
+    def run_async_script(self, script: str, *args: Any, timeout: float) -> Any:
+        """
+        Выполняет execute_async_script, который сам ограничивает время работы таймаутом timeout.
+        Если timeout не меньше ASYNC_SCRIPT_TIMEOUT, таймаут асинхронных скриптов драйвера на время
+        вызова увеличивается до timeout + 10 секунд, затем восстанавливается прежнее значение.
+
+        Parameters
+        ----------
+        script : str
+            Текст скрипта.
+        *args
+            Аргументы скрипта.
+        timeout : float
+            Наибольшее время работы скрипта в секундах.
+
+        Returns
+        -------
+        any
+            Результат скрипта.
+        """
+        if timeout < ASYNC_SCRIPT_TIMEOUT:
+            return self.driver.execute_async_script(script, *args)
+        
+        previous = self.driver.timeouts.script
+        self.driver.set_script_timeout(timeout + 10)
+        try:
+            return self.driver.execute_async_script(script, *args)
+        finally:
+            self.driver.set_script_timeout(previous)
+    
+    """ Wait for DOM condition in browser """
+    
+    def wait_for_condition(self, element_dict: Dict[str, str], condition: str, argument: Any = None,
+                           timeout: float = 60) -> Any:
+        """
+        Ожидает условие в DOM внутри браузера одной командой execute_async_script.
+        Условие проверяется при каждой мутации DOM (MutationObserver) и с интервалом observer_poll_ms,
+        поэтому ожидание завершается сразу после выполнения условия.
+
+        Parameters
+        ----------
+        element_dict : dict
+            Словарь с информацией о локаторе элемента.
+        condition : str
+            Условие: 'located', 'visible', 'clickable', 'invisible', 'text_matches' (argument - регулярное
+            выражение), 'count_at_least' (argument - количество узлов по xpath) или 'scroll_height_stable'
+            (argument - сколько мс scrollHeight элемента не должен меняться).
+        argument : any, optional
+            Параметр условия.
+        timeout : float, optional
+            Таймаут в секундах. По умолчанию 60.
+
+        Returns
+        -------
+        any
+            Элемент для условий элемента, текст для 'text_matches', количество для 'count_at_least',
+            scrollHeight для 'scroll_height_stable'.
+
+        Raises
+        ------
+        TimeoutException
+            Если условие не выполнилось за timeout.
+        """
+        try:
+            result = self.run_async_script(WAIT_FOR_CONDITION_SCRIPT, condition, element_dict['xpath'], argument,
+                                           int(timeout * 1000), self.observer_poll_ms, timeout=timeout)
+        except TimeoutException:
+            # Скрипт не вернул результат за таймаут асинхронных скриптов драйвера
+            result = {'ok': False, 'last': None}
+        
+        if 'error' in result:
+            raise ValueError(f"Wait condition '{condition}' failed: {result['error']}")
+        if not result['ok']:
+            raise TimeoutException(f"Element '{element_dict['name']}' did not reach '{condition}' "
+                                   f"in {timeout}s, last value: {result['last']}")
+        return result['value']
     
     """ Get timestamp with dot """
     
@@ -137,6 +502,7 @@ class Base:
     
     """ Assert word input reference """
     
+    @timed('flexible_assert_word')
     def flexible_assert_word(self, element_dict: Dict[str, str], reference_value: str,
                              wait_type: str = 'clickable') -> None:
         """
@@ -157,46 +523,49 @@ class Base:
             Если текст элемента или его атрибут 'value' не соответствует ожидаемому значению.
         """
         element = self.get_element(element_dict, wait_type=wait_type)['element']
-        time.sleep(0.1)
-        actual_text = element.text or element.get_attribute('value')
-        with allure.step(f"Assert \"{actual_text}\" == \"{reference_value}\""):
+        if self.wait_engine == 'observer':
+            # Ждем совпадения текста в браузере; при таймауте или выражении, несовместимом с JS,
+            # проверяем текущее значение
+            try:
+                actual_text = self.wait_for_condition(element_dict, 'text_matches', reference_value,
+                                                      timeout=self.assert_timeout)
+            except (TimeoutException, ValueError):
+                actual_text = element.text or element.get_attribute('value')
+        else:
+            time.sleep(0.1)
+            actual_text = element.text or element.get_attribute('value')
+        with step_log.step('Assert "%s" == "%s"', actual_text, reference_value):
             assert re.fullmatch(reference_value,
                                 actual_text), f"Expected '{reference_value}', but found '{actual_text}'."
-            print(f"Assert \"{actual_text}\" == \"{reference_value}\"")
     
     """ Get screenshot """
     
+    @timed('get_screenshot')
     def get_screenshot(self, test_name: str = None) -> None:
         """
-        Сохраняет скриншот текущего состояния браузера в базовую папку.
-        Если тест запускается с Allure, прикрепляет скриншот к отчету Allure.
+        Делает скриншот текущего состояния браузера в память и прикрепляет его к отчету Allure.
+        Запись файла в папку screens/ выполняется в фоне (screenshot_writer).
 
         Parameters
         ----------
         test_name : str, optional
             Имя теста, используется для именования скриншота. Если не указано, используется только таймштамп.
         """
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        screenshot_dir = os.path.join(base_dir, '..', 'screens')
-        
-        if not os.path.exists(screenshot_dir):
-            os.makedirs(screenshot_dir)
-        
-        print(f"Saving screenshot to default directory: {screenshot_dir}")
+        png = self.driver.get_screenshot_as_png()
         
         timestamp = self.get_timestamp_dot()
         name_screenshot = f'{test_name}_{timestamp}.png' if test_name else f'{timestamp}.png'
-        screenshot_path = os.path.join(screenshot_dir, name_screenshot)
+        screenshot_path = screenshot_writer.submit(png, name_screenshot)
         
-        self.driver.save_screenshot(screenshot_path)
-        
-        with allure.step(f"Screen taken: {name_screenshot}"):
-            print(f"Screenshot saved successfully at: {screenshot_path}")
-            allure.attach.file(screenshot_path, name="Screenshot", attachment_type=allure.attachment_type.PNG)
+        with step_log.step("Screen taken: %s", name_screenshot):
+            step_log.debug("Screenshot queued for saving at: %s", screenshot_path)
+            allure.attach(png, name="Screenshot", attachment_type=allure.attachment_type.PNG)
     
     """ Click button """
     
-    def click_button(self, element_dict: Dict[str, str], wait_type: str = 'clickable') -> None:
+    @timed('click_button')
+    def click_button(self, element_dict: Dict[str, str], wait_type: str = 'clickable',
+                     mutates_dom: Optional[bool] = None) -> None:
         """
         Кликает по кнопке с заданным типом ожидания.
 
@@ -206,14 +575,19 @@ class Base:
             Словарь с информацией о кнопке для клика.
         wait_type : str, optional
             Тип ожидания элемента перед кликом ('clickable', 'visible', 'located', 'find'). По умолчанию 'clickable'.
+        mutates_dom : bool, optional
+            Клик перестраивает DOM, кэш элементов очищается. По умолчанию берется из ключа 'mutates_dom'
+            словаря элемента.
         """
-        with allure.step(f"Click on {element_dict['name']}"):
+        with step_log.step("Click on %s", element_dict['name']):
             button_dict = self.get_element(element_dict, wait_type)
             button_dict['element'].click()
-            print(f"Click on {button_dict['name']}")
+            if mutates_dom if mutates_dom is not None else element_dict.get('mutates_dom', False):
+                self.invalidate_element_cache()
     
     """ Input in field with optional click and enter """
     
+    @timed('input_in_field')
     def input_in_field(self, element_dict: Dict[str, str], value: str, click_first: bool = False,
                        press_enter: bool = False, wait_type: str = 'clickable') -> None:
         """
@@ -232,17 +606,17 @@ class Base:
         wait_type : str, optional
             Тип ожидания элемента ('clickable', 'visible', 'located', 'find'). По умолчанию 'clickable'.
         """
-        with allure.step(f"{'Click and ' if click_first else ''}Input in {element_dict['name']}: {value}"):
+        with step_log.step("%sInput in %s: %s", 'Click and ' if click_first else '', element_dict['name'], value):
             field_dict = self.get_element(element_dict, wait_type)
             if click_first:
                 field_dict['element'].click()
             field_dict['element'].send_keys(value)
             if press_enter:
                 field_dict['element'].send_keys(Keys.ENTER)
-            print(f"{'Click and ' if click_first else ''}Input in {element_dict['name']}: {value}")
     
     """ Select option in dropdown by text, value or index """
     
+    @timed('select_option')
     def select_option(self, element_dict: Dict[str, str], option: str, by: str = 'text',
                       wait_type: str = 'clickable') -> None:
         """
@@ -259,9 +633,7 @@ class Base:
         wait_type : str, optional
             Тип ожидания элемента перед выбором ('clickable', 'visible', 'located', 'find'). По умолчанию 'clickable'.
         """
-        step_title = f"Selected option '{option}' from dropdown '{element_dict['name']}' by {by}"
-        
-        with allure.step(step_title):
+        with step_log.step("Select option '%s' from dropdown '%s' by %s", option, element_dict['name'], by):
             select_element = self.get_element(element_dict, wait_type)['element']
             select = Select(select_element)
             
@@ -272,17 +644,57 @@ class Base:
             elif by == 'index':
                 select.select_by_index(int(option))
             else:
-                raise ValueError(f"Недопустимый критерий выбора опции: выберите 'text', 'value' или 'index'.")
-            
-            print(f"Selected option '{option}' from dropdown '{element_dict['name']}' by {by}")
+                raise ValueError("Недопустимый критерий выбора опции: выберите 'text', 'value' или 'index'.")
+    
+    """ Clear field with selected strategy """
+    
+    def clear_field(self, element: WebElement, strategy: Optional[str] = None) -> None:
+        """
+        Очищает поле ввода выбранным способом.
+
+        Parameters
+        ----------
+        element : WebElement
+            Поле ввода.
+        strategy : str, optional
+            Способ очистки из CLEAR_STRATEGIES. По умолчанию Base.clear_strategy.
+        """
+        strategy = strategy or self.clear_strategy
+        if strategy == 'select_all':
+            element.send_keys(self.select_all_chord() + Keys.DELETE)
+        elif strategy == 'native_clear':
+            element.clear()
+            self.driver.execute_script(CLEAR_FIELD_SCRIPT, element, False)
+        elif strategy == 'js':
+            self.driver.execute_script(CLEAR_FIELD_SCRIPT, element, True)
+        elif strategy == 'backspace':
+            current_value = element.get_attribute('value')
+            for _ in range(len(current_value)):
+                element.send_keys(Keys.BACKSPACE)
+        else:
+            raise ValueError(f"Unsupported clear strategy: {strategy}")
+    
+    @staticmethod
+    def select_all_chord() -> str:
+        """
+        Возвращает аккорд клавиш «выделить все» для текущей платформы.
+
+        Returns
+        -------
+        str
+            Ctrl+A (Cmd+A в macOS) с отпусканием модификатора.
+        """
+        modifier = Keys.COMMAND if sys.platform == 'darwin' else Keys.CONTROL
+        return modifier + 'a' + Keys.NULL
     
     """ Backspace all and input with optional click, enter, and wait type """
     
+    @timed('backspace_all_and_input')
     def backspace_all_and_input(self, element_dict: Dict[str, str], value: str,
                                 click_first: bool = False, press_enter: bool = False,
-                                wait_type: str = 'clickable') -> None:
+                                wait_type: str = 'clickable', clear_strategy: Optional[str] = None) -> None:
         """
-        Очищает поле ввода путем нажатий клавиши Backspace для каждого символа в поле, затем вводит новое значение.
+        Очищает поле ввода выбранным способом, затем вводит новое значение.
 
         Parameters
         ----------
@@ -297,16 +709,80 @@ class Base:
         wait_type : str, optional
             Тип ожидания элемента. По умолчанию 'clickable'.
             Доступные варианты: 'clickable', 'visible', 'located', 'find', 'invisibility'.
+        clear_strategy : str, optional
+            Способ очистки из CLEAR_STRATEGIES. По умолчанию Base.clear_strategy.
+            'backspace' сохраняет прежнее посимвольное удаление.
         """
-        with allure.step(
-                f"{'Click and ' if click_first else ''}Backspace and input in {element_dict['name']}: {value}"):
+        strategy = clear_strategy or self.clear_strategy
+        with step_log.step("%sBackspace (%s) and input in %s: %s", 'Click and ' if click_first else '', strategy,
+                           element_dict['name'], value):
             field_dict = self.get_element(element_dict, wait_type=wait_type)
             if click_first:
                 field_dict['element'].click()
-            current_value = field_dict['element'].get_attribute('value')
-            for _ in range(len(current_value)):
-                field_dict['element'].send_keys(Keys.BACKSPACE)
-            field_dict['element'].send_keys(value)
-            if press_enter:
-                field_dict['element'].send_keys(Keys.ENTER)
-            print(f"{'Click and ' if click_first else ''}Backspaced and input in {element_dict['name']}: {value}")
+            if strategy == 'select_all':
+                # Очистка, ввод и Enter одной командой
+                keys = self.select_all_chord() + Keys.DELETE + value + (Keys.ENTER if press_enter else '')
+                field_dict['element'].send_keys(keys)
+            else:
+                self.clear_field(field_dict['element'], strategy)
+                field_dict['element'].send_keys(value)
+                if press_enter:
+                    field_dict['element'].send_keys(Keys.ENTER)
+    
+    """ Fill several fields in one round trip """
+    
+    @timed('fill_fields')
+    def fill_fields(self, fields: Sequence[Tuple[Dict[str, str], str]],
+                    press_enter: Sequence[Dict[str, str]] = ()) -> Dict[str, str]:
+        """
+        Заполняет несколько полей одной командой execute_script и возвращает значения, оказавшиеся в DOM.
+        Для каждого поля генерируются события input/keyup/change/blur, для <select> опция выбирается по тексту.
+
+        Parameters
+        ----------
+        fields : sequence
+            Пары (словарь с информацией о поле, значение) в порядке заполнения.
+        press_enter : sequence, optional
+            Словари полей, после заполнения которых генерируется нажатие Enter.
+
+        Returns
+        -------
+        dict
+            Итоговые значения полей по имени поля ('name' из словаря локатора).
+
+        Raises
+        ------
+        NoSuchElementException
+            Если поле или опция выпадающего списка не найдены.
+        """
+        enter_names = {element_dict['name'] for element_dict in press_enter}
+        payload = [{'name': element_dict['name'], 'xpath': element_dict['xpath'], 'value': value,
+                    'enter': element_dict['name'] in enter_names} for element_dict, value in fields]
+        
+        with step_log.step("Fill fields: %s", [field['name'] for field in payload]):
+            result = self.driver.execute_script(FILL_FIELDS_SCRIPT, payload)
+            if 'missing' in result:
+                raise NoSuchElementException(f"Element '{result['missing']}' is not found")
+            step_log.debug("Filled fields: %s", result['values'])
+            return result['values']
+    
+    """ Read several fields in one round trip """
+    
+    @timed('read_fields')
+    def read_fields(self, element_dicts: List[Dict[str, str]]) -> Dict[str, Optional[str]]:
+        """
+        Читает значения нескольких полей одной командой execute_script.
+        Для <select> возвращается текст выбранной опции.
+
+        Parameters
+        ----------
+        element_dicts : list
+            Словари с информацией о полях.
+
+        Returns
+        -------
+        dict
+            Значения полей по имени поля; None для отсутствующих элементов.
+        """
+        payload = [{'name': element_dict['name'], 'xpath': element_dict['xpath']} for element_dict in element_dicts]
+        return self.driver.execute_script(READ_FIELDS_SCRIPT, payload)
@@ -0,0 +1,189 @@
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from base.metrics import active_calls
+
+# Имя метода для команд, отправленных вне методов Base и CellList (например, напрямую из теста)
+UNATTRIBUTED = '<direct>'
+
+
+def round_trip_budget(limit: int):
+    """
+    Маркер теста с бюджетом команд WebDriver: тест падает, если за время его выполнения
+    отправлено больше limit команд.
+
+    Parameters
+    ----------
+    limit : int
+        Допустимое количество команд WebDriver.
+
+    Returns
+    -------
+    MarkDecorator
+        Маркер pytest round_trip_budget.
+    """
+    return pytest.mark.round_trip_budget(limit)
+
+
+class CommandTrace:
+    """
+    Команды WebDriver одного теста: (метод, команда) -> [количество, суммарное время в секундах].
+    """
+    
+    def __init__(self, test_name: str) -> None:
+        """
+        Инициализирует трассу теста.
+
+        Parameters
+        ----------
+        test_name : str
+            Идентификатор теста (nodeid).
+        """
+        self.test_name = test_name
+        self.calls: Dict[Tuple[str, str], List[float]] = {}
+        self.total_commands = 0
+        self.total_seconds = 0.0
+    
+    def record(self, method: str, command: str, seconds: float) -> None:
+        """
+        Сохраняет выполненную команду.
+
+        Parameters
+        ----------
+        method : str
+            Метод Base или CellList, отправивший команду.
+        command : str
+            Имя команды WebDriver, например 'findElement'.
+        seconds : float
+            Время выполнения команды в секундах.
+        """
+        entry = self.calls.setdefault((method, command), [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        self.total_commands += 1
+        self.total_seconds += seconds
+    
+    def by_method(self) -> Dict[str, int]:
+        """
+        Возвращает количество команд по методам.
+
+        Returns
+        -------
+        dict
+            Метод -> количество команд.
+        """
+        counts: Dict[str, int] = {}
+        for (method, _), (count, _) in self.calls.items():
+            counts[method] = counts.get(method, 0) + count
+        return counts
+    
+    def format_table(self) -> str:
+        """
+        Форматирует трассу в текстовую таблицу, отсортированную по количеству команд.
+
+        Returns
+        -------
+        str
+            Таблица с колонками method, command, count, total (мс) и итоговой строкой.
+        """
+        lines = [f"{'method':<40} {'command':<28} {'count':>7} {'total':>11}"]
+        for (method, command), (count, seconds) in sorted(self.calls.items(), key=lambda item: -item[1][0]):
+            lines.append(f"{method:<40} {command:<28} {count:>7} {seconds * 1000:>11.1f}")
+        lines.append(f"{'total':<40} {'':<28} {self.total_commands:>7} {self.total_seconds * 1000:>11.1f}")
+        return "\n".join(lines)
+
+
+class CommandTracer:
+    """
+    Трассировщик команд WebDriver: оборачивает command_executor драйвера, считает и замеряет
+    каждую команду и относит ее к текущему тесту и к методу Base/CellList, вызванному из теста
+    (нижний элемент стека active_calls() потока, отправившего команду). Команды вне теста (до start_test
+    и после finish_test) не учитываются.
+    """
+    
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Инициализирует трассировщик.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Трассировать все тесты, а не только тесты с бюджетом команд. По умолчанию False.
+        """
+        self.enabled = enabled
+        self.current: Optional[CommandTrace] = None
+    
+    """ Attach to driver """
+    
+    def attach(self, driver) -> None:
+        """
+        Подключает трассировщик к command_executor драйвера. Исполнитель оборачивается один раз
+        и хранит список подключенных трассировщиков, поэтому повторный вызов и поочередное подключение
+        нескольких трассировщиков (общего и бенчмарков) не добавляют новых оберток.
+
+        Parameters
+        ----------
+        driver : WebDriver
+            Драйвер браузера.
+        """
+        executor = driver.command_executor
+        tracers = getattr(executor, '_command_tracers', None)
+        if tracers is None:
+            tracers = executor._command_tracers = []
+            original_execute = executor.execute
+            
+            def traced_execute(command, params):
+                traces = [tracer.current for tracer in tracers if tracer.current is not None]
+                if not traces:
+                    return original_execute(command, params)
+                start = time.perf_counter()
+                try:
+                    return original_execute(command, params)
+                finally:
+                    seconds = time.perf_counter() - start
+                    calls = active_calls()
+                    method = calls[0] if calls else UNATTRIBUTED
+                    for trace in traces:
+                        trace.record(method, command, seconds)
+            
+            executor.execute = traced_execute
+        if self not in tracers:
+            tracers.append(self)
+    
+    """ Test boundaries """
+    
+    def start_test(self, test_name: str) -> CommandTrace:
+        """
+        Начинает трассировку теста.
+
+        Parameters
+        ----------
+        test_name : str
+            Идентификатор теста (nodeid).
+
+        Returns
+        -------
+        CommandTrace
+            Трасса теста.
+        """
+        self.current = CommandTrace(test_name)
+        return self.current
+    
+    def finish_test(self) -> Optional[CommandTrace]:
+        """
+        Завершает трассировку теста.
+
+        Returns
+        -------
+        CommandTrace or None
+            Трасса теста или None, если трассировка не начиналась.
+        """
+        trace, self.current = self.current, None
+        return trace
+
+
+# Общий трассировщик процесса, для всех тестов включается переменной окружения CELLLIST_TRACE_COMMANDS=1
+command_tracer = CommandTracer(enabled=os.environ.get('CELLLIST_TRACE_COMMANDS') == '1')
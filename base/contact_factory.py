@@ -0,0 +1,230 @@
+import datetime
+import random
+import zlib
+from typing import Dict, List, Optional
+
+from faker import Faker
+
+# Категории контактов в выпадающем списке формы
+CONTACT_CATEGORIES = ('Family', 'Friends', 'Coworkers', 'Businesses', 'Contacts')
+
+# Границы дат рождения: фиксированные, чтобы данные не зависели от текущей даты
+BIRTHDAY_START = datetime.date(1955, 1, 1)
+BIRTHDAY_END = datetime.date(2006, 12, 31)
+
+
+class ContactRecord:
+    """
+    Запись контакта с заранее подготовленными вариантами форматирования.
+    """
+    __slots__ = ('index', 'first_name', 'last_name', 'category', 'birthday_input', 'birthday', 'address',
+                 'address_flat')
+    
+    def __init__(self, index: int, first_name: str, last_name: str, category: str, birthday_input: str,
+                 birthday: str, address: str, address_flat: str) -> None:
+        self.index = index
+        self.first_name = first_name
+        self.last_name = last_name
+        self.category = category
+        # Дата для ввода в форму: "Month DD, YYYY" с ведущим нулем в дне
+        self.birthday_input = birthday_input
+        # Дата в формате GWT DateBox: "Month D, YYYY" без ведущего нуля
+        self.birthday = birthday
+        self.address = address
+        # Адрес, как он отображается в карточке: переводы строк заменены пробелами
+        self.address_flat = address_flat
+    
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+    
+    def form(self, birthday: bool = True) -> Dict[str, str]:
+        """
+        Возвращает данные контакта для CellList.fill_contact.
+
+        Parameters
+        ----------
+        birthday : bool, optional
+            Включать дату рождения (False - для негативного сценария). По умолчанию True.
+
+        Returns
+        -------
+        dict
+            Значения по ключам CONTACT_FIELDS.
+        """
+        data = {'first_name': self.first_name, 'last_name': self.last_name, 'category': self.category,
+                'address': self.address}
+        if birthday:
+            data['birthday'] = self.birthday_input
+        return data
+    
+    def category_other_than(self, current: str) -> str:
+        """
+        Возвращает категорию, отличную от current, детерминированно для записи.
+
+        Parameters
+        ----------
+        current : str
+            Текущая категория контакта.
+
+        Returns
+        -------
+        str
+            Другая категория из CONTACT_CATEGORIES.
+        """
+        others = [category for category in CONTACT_CATEGORIES if category != current]
+        return others[self.index % len(others)]
+    
+    def __repr__(self) -> str:
+        return (f"ContactRecord({self.index}, {self.full_name!r}, {self.category!r}, {self.birthday!r}, "
+                f"{self.address_flat!r})")
+
+
+class ContactFactory:
+    """
+    Фабрика тестовых контактов с воспроизводимым зерном. Записи генерируются пакетами заранее
+    и хранятся по столбцам; тест получает последовательность записей, начало которой зависит
+    только от зерна и идентификатора теста, поэтому данные теста воспроизводятся по зерну
+    независимо от порядка тестов и распределения по воркерам xdist.
+    """
+    
+    def __init__(self, seed: Optional[int] = None, batch_size: int = 500) -> None:
+        """
+        Инициализирует фабрику и генерирует первый пакет записей.
+
+        Parameters
+        ----------
+        seed : int, optional
+            Зерно генерации. None - случайное зерно.
+        batch_size : int, optional
+            Размер пакета записей. По умолчанию 500.
+        """
+        self.seed = seed if seed is not None else random.randrange(2 ** 31)
+        self.batch_size = batch_size
+        self._fake = Faker()
+        self._fake.seed_instance(self.seed)
+        self._random = random.Random(self.seed)
+        self._columns: Dict[str, List[str]] = {name: [] for name in ContactRecord.__slots__[1:]}
+        self.generate(batch_size)
+    
+    def __len__(self) -> int:
+        return len(self._columns['first_name'])
+    
+    """ Generate """
+    
+    def generate(self, count: int) -> None:
+        """
+        Генерирует и сохраняет count новых записей.
+
+        Parameters
+        ----------
+        count : int
+            Количество записей.
+        """
+        columns = self._columns
+        for _ in range(count):
+            birthday = self._fake.date_between_dates(BIRTHDAY_START, BIRTHDAY_END)
+            address = self._fake.address()
+            columns['first_name'].append(self._fake.first_name())
+            columns['last_name'].append(self._fake.last_name())
+            columns['category'].append(self._random.choice(CONTACT_CATEGORIES))
+            columns['birthday_input'].append(birthday.strftime('%B %d, %Y'))
+            columns['birthday'].append(f"{birthday.strftime('%B')} {birthday.day}, {birthday.year}")
+            columns['address'].append(address)
+            columns['address_flat'].append(address.replace('\n', ' '))
+    
+    def ensure(self, count: int) -> None:
+        """
+        Догенерирует пакеты, пока в хранилище не будет хотя бы count записей.
+
+        Parameters
+        ----------
+        count : int
+            Необходимое количество записей.
+        """
+        while len(self) < count:
+            self.generate(self.batch_size)
+    
+    """ Hand out records """
+    
+    def record(self, index: int) -> ContactRecord:
+        """
+        Возвращает запись по индексу, догенерируя пакеты при необходимости.
+
+        Parameters
+        ----------
+        index : int
+            Индекс записи.
+
+        Returns
+        -------
+        ContactRecord
+            Запись контакта.
+        """
+        self.ensure(index + 1)
+        return ContactRecord(index, *(self._columns[name][index] for name in ContactRecord.__slots__[1:]))
+    
+    def records(self, count: int, start: int = 0) -> List[ContactRecord]:
+        """
+        Возвращает count записей подряд, начиная с start (для массовых сценариев).
+
+        Parameters
+        ----------
+        count : int
+            Количество записей.
+        start : int, optional
+            Индекс первой записи. По умолчанию 0.
+
+        Returns
+        -------
+        list
+            Записи контактов.
+        """
+        self.ensure(start + count)
+        return [self.record(index) for index in range(start, start + count)]
+    
+    def for_test(self, test_name: str) -> 'TestContacts':
+        """
+        Возвращает последовательность записей теста: начало зависит только от зерна и имени теста.
+
+        Parameters
+        ----------
+        test_name : str
+            Идентификатор теста (nodeid).
+
+        Returns
+        -------
+        TestContacts
+            Выдача записей для теста.
+        """
+        return TestContacts(self, test_name, zlib.crc32(test_name.encode('utf-8')) % self.batch_size)
+
+
+class TestContacts:
+    """
+    Выдача записей фабрики одному тесту; запоминает выданные индексы для вывода при падении теста.
+    """
+    __test__ = False
+    
+    def __init__(self, factory: ContactFactory, test_name: str, start: int) -> None:
+        self.factory = factory
+        self.test_name = test_name
+        self._next_index = start
+        self.used: List[int] = []
+    
+    def next(self) -> ContactRecord:
+        """
+        Возвращает следующую запись теста.
+
+        Returns
+        -------
+        ContactRecord
+            Запись контакта.
+        """
+        record = self.factory.record(self._next_index)
+        self.used.append(self._next_index)
+        self._next_index += 1
+        return record
+    
+    def describe(self) -> str:
+        return f"Contact data seed {self.factory.seed}, records {self.used} (test {self.test_name})"
@@ -0,0 +1,125 @@
+from typing import Callable, Dict, List, Optional
+
+from base.base_class import Base
+from base.step_log import step_log
+
+
+class DriverPool:
+    """
+    Пул «прогретых» экземпляров Base для повторного использования браузера между тестами.
+
+    Экземпляры выдаются на время теста через checkout() и возвращаются через checkin().
+    При возврате браузер сбрасывается (cookies, storage, about:blank). Экземпляр пересоздается
+    после max_uses использований, а также если он не прошел проверку здоровья или сброс.
+    """
+    
+    def __init__(self, size: int = 1, max_uses: int = 20,
+                 factory: Optional[Callable[[], Base]] = None) -> None:
+        """
+        Инициализирует пул.
+
+        Parameters
+        ----------
+        size : int, optional
+            Максимальное количество простаивающих браузеров в пуле. По умолчанию 1.
+        max_uses : int, optional
+            Количество тестов, после которого браузер пересоздается. По умолчанию 20.
+        factory : callable, optional
+            Функция создания нового экземпляра Base. По умолчанию Base.get_driver.
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self._factory = factory or Base.get_driver
+        self._idle: List[Base] = []
+        self._uses: Dict[int, int] = {}
+    
+    """ Checkout browser """
+    
+    def checkout(self) -> Base:
+        """
+        Выдает живой экземпляр Base из пула или создает новый.
+
+        Returns
+        -------
+        Base
+            Экземпляр Base с рабочим браузером.
+        """
+        while self._idle:
+            base = self._idle.pop()
+            if base.is_alive():
+                step_log.info("Checkout browser from pool (uses: %s)", self._uses[id(base)])
+                return base
+            self._discard(base, "health check failed")
+        
+        base = self._factory()
+        self._uses[id(base)] = 0
+        return base
+    
+    """ Checkin browser """
+    
+    def checkin(self, base: Base) -> None:
+        """
+        Возвращает экземпляр Base в пул, сбрасывая состояние браузера.
+        Экземпляр закрывается, если исчерпан лимит использований, сброс не удался или пул заполнен.
+
+        Parameters
+        ----------
+        base : Base
+            Экземпляр, ранее выданный методом checkout().
+        """
+        uses = self._uses.get(id(base), 0) + 1
+        self._uses[id(base)] = uses
+        
+        if uses >= self.max_uses:
+            self._discard(base, f"reached {uses} uses")
+        elif len(self._idle) >= self.size:
+            self._discard(base, "pool is full")
+        elif not base.reset_state():
+            self._discard(base, "reset failed")
+        else:
+            self._idle.append(base)
+    
+    """ Check ownership """
+    
+    def owns(self, base: Base) -> bool:
+        """
+        Проверяет, что экземпляр Base выдан пулом (методом checkout()) и еще не закрыт.
+
+        Parameters
+        ----------
+        base : Base
+            Проверяемый экземпляр.
+
+        Returns
+        -------
+        bool
+            True, если браузер учитывается пулом.
+        """
+        return id(base) in self._uses
+    
+    """ Close pool """
+    
+    def close(self) -> None:
+        """
+        Закрывает все простаивающие браузеры пула.
+        """
+        while self._idle:
+            self._discard(self._idle.pop(), "pool closed")
+    
+    def _discard(self, base: Base, reason: str) -> None:
+        """
+        Закрывает браузер и удаляет его из учета пула.
+
+        Parameters
+        ----------
+        base : Base
+            Экземпляр для закрытия.
+        reason : str
+            Причина пересоздания, выводится в лог.
+        """
+        self._uses.pop(id(base), None)
+        with step_log.step("Recycle browser: %s", reason):
+            try:
+                base.test_finish()
+            except Exception as error:
+                step_log.info("Browser quit failed: %s", error)
@@ -0,0 +1,188 @@
+import atexit
+import os
+import shutil
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.common.driver_finder import DriverFinder
+
+from base.launch_profile import LaunchProfile
+from base.step_log import step_log
+
+# Папка с драйверами относительно корня проекта
+RESOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resource')
+
+# Пути к драйверу для разных платформ
+WINDOWS_DRIVER_PATH = os.path.join(RESOURCE_DIR, 'windows', 'chromedriver.exe')
+LINUX_DRIVER_PATH = os.path.join(RESOURCE_DIR, 'linux', 'chromedriver')
+MAC_DRIVER_PATH = os.path.join(RESOURCE_DIR, 'mac', 'chromedriver')
+
+PLATFORM_DRIVER_PATHS = {
+    'win32': WINDOWS_DRIVER_PATH,
+    'linux': LINUX_DRIVER_PATH,
+    'darwin': MAC_DRIVER_PATH,
+}
+
+
+def resolve_driver_path() -> Optional[str]:
+    """
+    Определяет путь к chromedriver для текущей платформы.
+
+    Порядок поиска: переменная окружения CHROMEDRIVER_PATH, папка resource/ для текущей платформы,
+    chromedriver в PATH. Если ничего не найдено, возвращает None и драйвер подбирается Selenium Manager.
+
+    Returns
+    -------
+    str or None
+        Путь к исполняемому файлу chromedriver или None.
+    """
+    env_path = os.environ.get('CHROMEDRIVER_PATH')
+    if env_path:
+        return env_path
+    
+    platform_path = PLATFORM_DRIVER_PATHS.get(sys.platform)
+    if platform_path and os.path.isfile(platform_path):
+        return platform_path
+    
+    return shutil.which('chromedriver')
+
+
+class SharedService(Service):
+    """
+    Сервис chromedriver, общий для сессий браузера воркера. webdriver.Chrome запускает сервис при создании
+    и останавливает его при quit(): здесь start() запускает процесс, только если он еще не запущен,
+    а stop() оставляет его работать. Процесс останавливается методом shutdown() в конце сессии тестов.
+    """
+    
+    def start(self) -> None:
+        """
+        Запускает процесс chromedriver, если он еще не запущен.
+        """
+        process = getattr(self, 'process', None)
+        if process is not None and process.poll() is None:
+            return
+        super().start()
+    
+    def stop(self) -> None:
+        """
+        Оставляет процесс chromedriver запущенным при закрытии сессии браузера.
+        """
+    
+    def shutdown(self) -> None:
+        """
+        Останавливает процесс chromedriver.
+        """
+        super().stop()
+
+
+class SharedServiceChrome(webdriver.Chrome):
+    """
+    Chrome-драйвер, открывающий сессию на уже запущенном процессе chromedriver (SharedService):
+    создается публичным конструктором webdriver.Chrome, сервис не перезапускается при создании
+    и не останавливается при quit().
+    """
+    launch_profile: Optional[LaunchProfile] = None
+    navigated: bool = False
+    # Шаблоны адресов, заблокированных через CDP (RequestFilter.apply)
+    blocked_urls: Tuple[str, ...] = ()
+    # Запущен ли браузер с копией прогретого шаблона профиля (ProfileTemplate)
+    warm_profile: bool = False
+    # Карточки списка после последней полной загрузки страницы: эталон проверки сброса без перезагрузки
+    reset_baseline: Optional[Dict[str, Any]] = None
+
+
+class DriverServiceManager:
+    """
+    Управляет одним процессом chromedriver на воркер: запускает его при первом запросе,
+    открывает на нем новые сессии браузера и останавливает в конце сессии тестов.
+    """
+    
+    def __init__(self, driver_path: Optional[str] = None) -> None:
+        """
+        Инициализирует менеджер сервиса.
+
+        Parameters
+        ----------
+        driver_path : str, optional
+            Путь к chromedriver. По умолчанию определяется через resolve_driver_path().
+        """
+        self.driver_path = driver_path
+        self.browser_path: Optional[str] = None
+        self.service: Optional[SharedService] = None
+    
+    """ Start service """
+    
+    def start(self) -> None:
+        """
+        Запускает процесс chromedriver, если он еще не запущен.
+        """
+        if self.is_running():
+            return
+        
+        service = SharedService(self.driver_path or resolve_driver_path())
+        if not service.path:
+            # Драйвер не найден локально - подбираем драйвер и браузер через Selenium Manager
+            finder = DriverFinder(service, webdriver.ChromeOptions())
+            service.path = finder.get_driver_path()
+            self.browser_path = finder.get_browser_path() or None
+        
+        with step_log.step("Start chromedriver service"):
+            service.start()
+            self.service = service
+            step_log.info("Started chromedriver service: %s at %s", service.path, service.service_url)
+    
+    """ Check service """
+    
+    def is_running(self) -> bool:
+        """
+        Проверяет, что процесс chromedriver запущен.
+
+        Returns
+        -------
+        bool
+            True, если сервис запущен и процесс не завершился.
+        """
+        return (self.service is not None and self.service.process is not None
+                and self.service.process.poll() is None)
+    
+    """ New driver """
+    
+    def new_driver(self, options: webdriver.ChromeOptions) -> WebDriver:
+        """
+        Открывает новую сессию браузера на общем процессе chromedriver, запуская его при необходимости.
+
+        Parameters
+        ----------
+        options : ChromeOptions
+            Настройки браузера.
+
+        Returns
+        -------
+        WebDriver
+            Драйвер новой сессии браузера.
+        """
+        self.start()
+        if self.browser_path and not options.binary_location:
+            options.binary_location = self.browser_path
+        return SharedServiceChrome(service=self.service, options=options)
+    
+    """ Stop service """
+    
+    def stop(self) -> None:
+        """
+        Останавливает процесс chromedriver.
+        """
+        if self.service is None:
+            return
+        with step_log.step("Stop chromedriver service"):
+            self.service.shutdown()
+            self.service = None
+            step_log.info("Stopped chromedriver service")
+
+
+# Общий менеджер сервиса для текущего процесса (воркера xdist)
+service_manager = DriverServiceManager()
+atexit.register(service_manager.stop)
@@ -0,0 +1,253 @@
+import heapq
+import json
+import os
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence
+
+from xdist.scheduler import LoadScheduling
+
+# Файл истории длительности тестов, задается переменной окружения CELLLIST_DURATIONS_STORE
+DEFAULT_DURATIONS_PATH = os.environ.get('CELLLIST_DURATIONS_STORE', 'test_durations.json')
+
+
+def predict_makespan(durations: Sequence[float], workers: int) -> float:
+    """
+    Время выполнения набора тестов на workers воркерах при выдаче тестов по одному от длинных к коротким:
+    очередной тест получает воркер, который освободился первым.
+
+    Parameters
+    ----------
+    durations : sequence
+        Длительности тестов в секундах в порядке выдачи.
+    workers : int
+        Количество воркеров.
+
+    Returns
+    -------
+    float
+        Наибольшая загрузка воркера в секундах.
+    """
+    loads = [0.0] * max(1, workers)
+    for duration in durations:
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads)
+
+
+class DurationStore:
+    """
+    История длительности тестов (setup, call и teardown) по nodeid и замеры текущего прогона.
+
+    Оценка теста - медиана последних max_samples прогонов: первый тест воркера дольше остальных на запуск
+    браузера пула, медиана не дает редким холодным запускам завышать оценку. Тест без истории оценивается
+    медианой известных тестов. Упавшие тесты в историю не записываются: их время определяют таймауты.
+    """
+    
+    def __init__(self, enabled: bool = False, default: float = 10.0, max_samples: int = 20) -> None:
+        """
+        Инициализирует хранилище.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Записывать длительности и распределять тесты по воркерам по истории. По умолчанию False.
+        default : float, optional
+            Оценка теста в секундах, если история пуста. По умолчанию 10.0.
+        max_samples : int, optional
+            Сколько последних длительностей теста хранится в истории. По умолчанию 20.
+        """
+        self.enabled = enabled
+        self.default = default
+        self.max_samples = max_samples
+        # nodeid -> длительности прошлых прогонов и текущего прогона, секунды
+        self.history: Dict[str, List[float]] = {}
+        self.current: Dict[str, float] = defaultdict(float)
+        self.failed: set = set()
+        # Воркер -> суммарная длительность его тестов в текущем прогоне
+        self.workers: Dict[str, float] = defaultdict(float)
+        self.planned_workers = 0
+        self.predicted: Optional[float] = None
+        self.unknown = 0
+        self.started: Optional[float] = None
+    
+    """ Estimate """
+    
+    def estimate(self, nodeid: str) -> float:
+        """
+        Возвращает оценку длительности теста.
+
+        Parameters
+        ----------
+        nodeid : str
+            Идентификатор теста.
+
+        Returns
+        -------
+        float
+            Медиана истории теста, медиана известных тестов или default, секунды.
+        """
+        samples = self.history.get(nodeid)
+        if samples:
+            return statistics.median(samples)
+        known = [statistics.median(values) for values in self.history.values() if values]
+        return statistics.median(known) if known else self.default
+    
+    def plan(self, collection: Sequence[str], workers: int) -> List[int]:
+        """
+        Упорядочивает тесты от длинных к коротким и запоминает предсказанное время выполнения.
+
+        Parameters
+        ----------
+        collection : sequence
+            nodeid собранных тестов.
+        workers : int
+            Количество воркеров.
+
+        Returns
+        -------
+        list
+            Индексы тестов в collection в порядке выдачи воркерам.
+        """
+        estimates = [self.estimate(nodeid) for nodeid in collection]
+        order = sorted(range(len(collection)), key=lambda index: -estimates[index])
+        self.planned_workers = workers
+        self.predicted = predict_makespan([estimates[index] for index in order], workers)
+        self.unknown = sum(1 for nodeid in collection if not self.history.get(nodeid))
+        self.started = time.monotonic()
+        return order
+    
+    """ Record """
+    
+    def record(self, report) -> None:
+        """
+        Добавляет длительность фазы теста из отчета pytest.
+
+        Parameters
+        ----------
+        report : TestReport
+            Отчет фазы теста; на контроллере xdist атрибут node - воркер, выполнивший тест.
+        """
+        self.current[report.nodeid] += report.duration
+        if report.failed:
+            self.failed.add(report.nodeid)
+        node = getattr(report, 'node', None)
+        worker = node.gateway.id if node is not None else 'main'
+        self.workers[worker] += report.duration
+    
+    def summary(self) -> str:
+        """
+        Сводка прогона: предсказанное и фактическое время выполнения и загрузка воркеров.
+
+        Returns
+        -------
+        str
+            Предсказанное время (наибольшая оценочная загрузка воркера), фактическое (наибольшая загрузка
+            воркера по длительностям тестов) и время от выдачи первого теста до конца прогона.
+        """
+        actual = max(self.workers.values(), default=0.0)
+        lines = [f"Duration schedule: {len(self.current)} tests on {len(self.workers)} workers, "
+                 f"actual makespan {actual:.1f} s"]
+        if self.predicted is not None:
+            lines[0] += (f", predicted {self.predicted:.1f} s for {self.planned_workers} workers "
+                         f"({self.unknown} tests without history), "
+                         f"wall {time.monotonic() - self.started:.1f} s")
+        lines.append("  " + ", ".join(f"{worker} {busy:.1f} s" for worker, busy in sorted(self.workers.items())))
+        return "\n".join(lines)
+    
+    """ Store file """
+    
+    @staticmethod
+    def _read(path: str) -> Dict[str, List[float]]:
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding='utf-8') as file:
+            return json.load(file).get('tests', {})
+    
+    def load(self, path: str) -> int:
+        """
+        Загружает историю длительности тестов из JSON-файла.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу истории.
+
+        Returns
+        -------
+        int
+            Количество тестов в истории.
+        """
+        self.history.update(self._read(path))
+        return len(self.history)
+    
+    def save(self, path: str) -> None:
+        """
+        Дописывает длительности прошедших тестов текущего прогона в JSON-файл истории
+        (последние max_samples на тест). Файл пишет только контроллер xdist (или процесс без воркеров);
+        история перечитывается, чтобы сохранить тесты, не выбранные в этом прогоне (например, через -k),
+        а запись через временный файл не оставляет обрезанную историю при прерванном прогоне.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу истории.
+        """
+        tests = self._read(path)
+        for nodeid, duration in self.current.items():
+            if nodeid not in self.failed:
+                tests[nodeid] = (tests.get(nodeid, []) + [round(duration, 3)])[-self.max_samples:]
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump({'tests': dict(sorted(tests.items()))}, file, indent=2)
+        os.replace(temporary_path, path)
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    Планировщик xdist: выдает тесты по оценке длительности от длинных к коротким, по одному тесту
+    в очередь воркера сверх выполняемого (воркер xdist запускает тест, когда знает следующий).
+    Освободившийся воркер получает следующий по длительности тест, поэтому короткие тесты в конце
+    заполняют простои воркеров и выполняются на уже запущенном браузере пула воркера.
+    """
+    
+    # Тестов в очереди воркера: выполняемый и следующий
+    queue_size = 2
+    
+    def __init__(self, config, log=None, store: Optional[DurationStore] = None) -> None:
+        super().__init__(config, log)
+        self.store = store or DurationStore(enabled=True)
+    
+    def schedule(self) -> None:
+        """
+        Упорядочивает собранные тесты по оценке длительности и выдает первые тесты воркерам.
+        Повторный вызов (добавлен воркер) выдает тесты новым воркерам.
+        """
+        assert self.collection_is_completed
+        if self.collection is None:
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+            self.collection = next(iter(self.node2collection.values()))
+            self.pending[:] = self.store.plan(self.collection, len(self.nodes))
+        for node in self.nodes:
+            self.check_schedule(node)
+    
+    def check_schedule(self, node, duration: float = 0) -> None:
+        """
+        Дополняет очередь воркера следующим по длительности тестом или завершает воркер,
+        если тестов не осталось.
+        """
+        if node.shutting_down:
+            return
+        if self.pending:
+            self._send_tests(node, max(0, self.queue_size - len(self.node2pending[node])))
+        else:
+            node.shutdown()
+
+
+# Общее хранилище длительности тестов, включается переменной окружения CELLLIST_DURATION_SCHEDULE=1
+duration_store = DurationStore(enabled=os.environ.get('CELLLIST_DURATION_SCHEDULE') == '1')
@@ -0,0 +1,55 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+# Блокировка старше этого времени считается оставленной прерванным процессом и снимается
+STALE_LOCK_SECONDS = 60
+
+
+@contextmanager
+def file_lock(path: str, timeout: float = 30, poll: float = 0.05) -> Iterator[None]:
+    """
+    Межпроцессная блокировка общего файла на время чтения, слияния и записи: файл блокировки
+    path + '.lock' создается с O_EXCL (работает одинаково в Linux, macOS и Windows).
+    Воркеры xdist, дописывающие общий файл в конце сессии, выполняют запись по очереди.
+
+    Parameters
+    ----------
+    path : str
+        Путь к защищаемому файлу.
+    timeout : float, optional
+        Сколько секунд ждать блокировку. По умолчанию 30.
+    poll : float, optional
+        Интервал проверки блокировки в секундах. По умолчанию 0.05.
+
+    Raises
+    ------
+    TimeoutError
+        Если блокировка не получена за timeout.
+    """
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(os.path.abspath(lock_path)), exist_ok=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > STALE_LOCK_SECONDS:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                # Блокировку сняли между проверками
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"File {path} is locked by another process for more than {timeout}s")
+            time.sleep(poll)
+    try:
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
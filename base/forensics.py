@@ -0,0 +1,143 @@
+import io
+import json
+import os
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import allure
+
+from base.scripts import OUTER_HTML_SCRIPT, RESOURCE_TIMINGS_SCRIPT
+from base.screenshot_writer import screenshot_writer
+from base.step_log import step_log
+
+# Общий бюджет сбора артефактов упавшего теста в секундах, задается переменной окружения CELLLIST_FORENSICS_BUDGET
+DEFAULT_FORENSICS_BUDGET = float(os.environ.get('CELLLIST_FORENSICS_BUDGET', '3'))
+
+
+class FailureForensics:
+    """
+    Сбор артефактов упавшего теста: скриншот, outerHTML контейнера списка, логи консоли браузера
+    и записи Performance API. Артефакты собираются параллельно, каждый ограничен по времени,
+    общий сбор не превышает budget секунд. Результат - один zip-архив с manifest.json.
+    """
+    
+    def __init__(self, base, container_xpath: Optional[str] = None, budget: float = DEFAULT_FORENSICS_BUDGET,
+                 artifact_timeout: Optional[float] = None) -> None:
+        """
+        Инициализирует сборщик.
+
+        Parameters
+        ----------
+        base : Base
+            Экземпляр Base с драйвером упавшего теста.
+        container_xpath : str, optional
+            Xpath контейнера, outerHTML которого сохраняется. None - сохраняется вся страница (html).
+        budget : float, optional
+            Общий бюджет сбора в секундах. По умолчанию DEFAULT_FORENSICS_BUDGET.
+        artifact_timeout : float, optional
+            Ограничение времени одного артефакта в секундах. По умолчанию равно budget.
+        """
+        self.base = base
+        self.container_xpath = container_xpath or '/html'
+        self.budget = budget
+        self.artifact_timeout = artifact_timeout or budget
+        self.results: Dict[str, bytes] = {}
+    
+    """ Artifacts """
+    
+    def _artifacts(self) -> Dict[str, Tuple[str, Callable[[], Any]]]:
+        # Имя артефакта -> (имя файла в архиве, функция получения)
+        driver = self.base.driver
+        return {
+            'screenshot': ('screenshot.png', driver.get_screenshot_as_png),
+            'dom': ('container.html', lambda: driver.execute_script(OUTER_HTML_SCRIPT, self.container_xpath)),
+            'console': ('console.json', lambda: driver.get_log('browser')),
+            'timings': ('timings.json', lambda: driver.execute_script(RESOURCE_TIMINGS_SCRIPT)),
+        }
+    
+    @staticmethod
+    def _to_bytes(value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, str):
+            return value.encode('utf-8')
+        return json.dumps(value, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+    
+    """ Collect """
+    
+    def collect(self) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Параллельно собирает артефакты и упаковывает их в zip-архив.
+        Артефакты, не успевшие за отведенное время, отмечаются в манифесте как 'timeout' и не ждутся.
+
+        Returns
+        -------
+        tuple
+            Архив (bytes) и манифест: статус и время сбора каждого артефакта, общее время.
+        """
+        start = time.perf_counter()
+        deadline = start + self.budget
+        artifacts = self._artifacts()
+        manifest: Dict[str, Any] = {'artifacts': {}}
+        self.results = {}
+        
+        executor = ThreadPoolExecutor(max_workers=len(artifacts), thread_name_prefix='forensics')
+        futures = {name: executor.submit(self._timed_call, getter) for name, (_, getter) in artifacts.items()}
+        for name, future in futures.items():
+            remaining = max(0.0, min(self.artifact_timeout, deadline - time.perf_counter()))
+            try:
+                value, elapsed = future.result(timeout=remaining)
+                self.results[name] = self._to_bytes(value)
+                manifest['artifacts'][name] = {'status': 'ok', 'elapsed_ms': round(elapsed * 1000, 1)}
+            except FutureTimeoutError:
+                manifest['artifacts'][name] = {'status': 'timeout'}
+            except Exception as error:
+                manifest['artifacts'][name] = {'status': 'error', 'error': f"{type(error).__name__}: {error}"}
+        # Не дожидаемся зависших артефактов: потоки завершатся сами
+        executor.shutdown(wait=False)
+        manifest['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        manifest['budget_ms'] = self.budget * 1000
+        
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+            for name, data in self.results.items():
+                bundle.writestr(artifacts[name][0], data)
+            bundle.writestr('manifest.json', json.dumps(manifest, indent=2))
+        return buffer.getvalue(), manifest
+    
+    @staticmethod
+    def _timed_call(getter: Callable[[], Any]) -> Tuple[Any, float]:
+        start = time.perf_counter()
+        return getter(), time.perf_counter() - start
+    
+    """ Attach """
+    
+    def attach(self, test_name: str) -> Dict[str, Any]:
+        """
+        Собирает артефакты и прикрепляет к отчету Allure архив и скриншот; копия скриншота записывается
+        в screens/ в фоне.
+
+        Parameters
+        ----------
+        test_name : str
+            Имя теста для именования архива и скриншота.
+
+        Returns
+        -------
+        dict
+            Манифест сбора.
+        """
+        with step_log.step("Collect failure forensics"):
+            bundle, manifest = self.collect()
+            step_log.info("Failure forensics collected in %.0f ms (%s)", manifest['elapsed_ms'],
+                          {name: info['status'] for name, info in manifest['artifacts'].items()})
+            allure.attach(bundle, name="Failure forensics", extension='zip')
+            
+            png = self.results.get('screenshot')
+            if png:
+                name_screenshot = f"{test_name}_{self.base.get_timestamp_dot()}.png"
+                screenshot_writer.submit(png, name_screenshot)
+                allure.attach(png, name="Screenshot", attachment_type=allure.attachment_type.PNG)
+            return manifest
@@ -0,0 +1,210 @@
+import os
+import shutil
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from selenium import webdriver
+
+# Минимальный размер /dev/shm, при котором Chrome может использовать его для разделяемой памяти
+MIN_DEV_SHM_BYTES = 1024 ** 3
+
+
+def dev_shm_is_small() -> bool:
+    """
+    Проверяет, что /dev/shm отсутствует или слишком мал для Chrome (типично для Docker-контейнеров).
+
+    Returns
+    -------
+    bool
+        True, если Chrome следует запускать с --disable-dev-shm-usage.
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        return shutil.disk_usage('/dev/shm').total < MIN_DEV_SHM_BYTES
+    except OSError:
+        return True
+
+
+class LaunchProfile:
+    """
+    Именованный профиль запуска браузера: флаги Chrome, стратегия загрузки страницы, размер окна
+    и бюджет времени запуска. Хранит измеренное время запуска драйвера и первой навигации.
+    """
+    
+    def __init__(self, name: str, headless: bool = False, disable_gpu: bool = False,
+                 disable_extensions: bool = False, dev_shm: str = 'auto', no_sandbox: bool = False,
+                 page_load_strategy: str = 'normal', window_size: Optional[Tuple[int, int]] = (1920, 1080),
+                 maximize: bool = False, extra_args: Sequence[str] = (),
+                 startup_budget: Optional[float] = None) -> None:
+        """
+        Инициализирует профиль запуска.
+
+        Parameters
+        ----------
+        name : str
+            Имя профиля.
+        headless : bool, optional
+            Запуск браузера без окна. По умолчанию False.
+        disable_gpu : bool, optional
+            Отключение GPU. По умолчанию False.
+        disable_extensions : bool, optional
+            Отключение расширений. По умолчанию False.
+        dev_shm : str, optional
+            Использование /dev/shm: 'auto' (отключить, если он мал), 'disable' или 'use'. По умолчанию 'auto'.
+        no_sandbox : bool, optional
+            Запуск без песочницы (нужно в контейнерах под root). По умолчанию False.
+        page_load_strategy : str, optional
+            Стратегия загрузки страницы: 'normal', 'eager' или 'none'. По умолчанию 'normal'.
+        window_size : tuple, optional
+            Фиксированный размер окна (ширина, высота). None - не задавать. По умолчанию (1920, 1080).
+        maximize : bool, optional
+            Разворачивать окно при открытии страницы вместо фиксированного размера. По умолчанию False.
+        extra_args : sequence, optional
+            Дополнительные аргументы командной строки Chrome.
+        startup_budget : float, optional
+            Допустимое время запуска драйвера в секундах. None - без ограничения.
+        """
+        if dev_shm not in ('auto', 'disable', 'use'):
+            raise ValueError(f"Unsupported dev_shm mode: {dev_shm}")
+        self.name = name
+        self.headless = headless
+        self.disable_gpu = disable_gpu
+        self.disable_extensions = disable_extensions
+        self.dev_shm = dev_shm
+        self.no_sandbox = no_sandbox
+        self.page_load_strategy = page_load_strategy
+        self.window_size = window_size
+        self.maximize = maximize
+        self.extra_args = list(extra_args)
+        self.startup_budget = startup_budget
+        self.startup_times: List[float] = []
+        self.first_navigation_times: List[float] = []
+    
+    """ Build Chrome options """
+    
+    def build_options(self, user_data_dir: Optional[str] = None) -> webdriver.ChromeOptions:
+        """
+        Собирает настройки Chrome для профиля.
+
+        Parameters
+        ----------
+        user_data_dir : str, optional
+            Папка профиля Chrome (копия шаблона ProfileTemplate). None - временный пустой профиль.
+
+        Returns
+        -------
+        ChromeOptions
+            Настройки браузера.
+        """
+        options = webdriver.ChromeOptions()
+        options.page_load_strategy = self.page_load_strategy
+        
+        if self.headless:
+            options.add_argument('--headless=new')
+        if self.disable_gpu:
+            options.add_argument('--disable-gpu')
+        if self.disable_extensions:
+            options.add_argument('--disable-extensions')
+        if self.dev_shm == 'disable' or (self.dev_shm == 'auto' and dev_shm_is_small()):
+            options.add_argument('--disable-dev-shm-usage')
+        if self.no_sandbox:
+            options.add_argument('--no-sandbox')
+        if self.window_size:
+            options.add_argument(f'--window-size={self.window_size[0]},{self.window_size[1]}')
+        for argument in self.extra_args:
+            options.add_argument(argument)
+        if user_data_dir:
+            options.add_argument(f'--user-data-dir={user_data_dir}')
+        # Логи консоли браузера для артефактов упавших тестов (driver.get_log('browser'))
+        options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+        
+        return options
+    
+    """ Record timings """
+    
+    def record_startup(self, seconds: float) -> None:
+        """
+        Сохраняет измеренное время запуска драйвера.
+
+        Parameters
+        ----------
+        seconds : float
+            Время запуска в секундах.
+        """
+        self.startup_times.append(seconds)
+    
+    def record_first_navigation(self, seconds: float) -> None:
+        """
+        Сохраняет измеренное время первой навигации драйвера.
+
+        Parameters
+        ----------
+        seconds : float
+            Время навигации в секундах.
+        """
+        self.first_navigation_times.append(seconds)
+    
+    """ Summary """
+    
+    def summary(self) -> str:
+        """
+        Возвращает сводку измерений профиля.
+
+        Returns
+        -------
+        str
+            Строка с количеством запусков, средним и максимальным временем запуска и первой навигации.
+        """
+        def describe(values: List[float]) -> str:
+            if not values:
+                return "n/a"
+            return f"n={len(values)} avg={sum(values) / len(values):.3f}s max={max(values):.3f}s"
+        
+        return (f"Launch profile '{self.name}': startup {describe(self.startup_times)}, "
+                f"first navigation {describe(self.first_navigation_times)}")
+
+
+# Доступные профили запуска
+PROFILES: Dict[str, LaunchProfile] = {
+    # Прежнее поведение: окно разворачивается при открытии страницы
+    'default': LaunchProfile('default', dev_shm='use', window_size=None, maximize=True,
+                             extra_args=['--window-size=1920x1080']),
+    # Быстрый запуск на headless Linux-агентах CI
+    'headless-fast': LaunchProfile('headless-fast', headless=True, disable_gpu=True,
+                                   disable_extensions=True, no_sandbox=True,
+                                   page_load_strategy='eager', startup_budget=10.0,
+                                   extra_args=['--no-first-run', '--no-default-browser-check',
+                                               '--disable-background-networking',
+                                               '--disable-renderer-backgrounding']),
+    # Отладка с видимым окном фиксированного размера
+    'debug-headed': LaunchProfile('debug-headed', disable_extensions=True, startup_budget=30.0),
+}
+
+# Профиль по умолчанию задается переменной окружения CELLLIST_LAUNCH_PROFILE
+DEFAULT_PROFILE_NAME = os.environ.get('CELLLIST_LAUNCH_PROFILE', 'default')
+
+
+def get_profile(name: Optional[str] = None) -> LaunchProfile:
+    """
+    Возвращает профиль запуска по имени.
+
+    Parameters
+    ----------
+    name : str, optional
+        Имя профиля. По умолчанию DEFAULT_PROFILE_NAME.
+
+    Returns
+    -------
+    LaunchProfile
+        Профиль запуска.
+
+    Raises
+    ------
+    ValueError
+        Если профиль с таким именем не существует.
+    """
+    name = name or DEFAULT_PROFILE_NAME
+    if name not in PROFILES:
+        raise ValueError(f"Unknown launch profile: {name}. Available: {', '.join(PROFILES)}")
+    return PROFILES[name]
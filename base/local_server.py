@@ -0,0 +1,90 @@
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from base.step_log import step_log
+
+# Папка с локальной копией страницы CellList
+CELL_LIST_REPLICA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resource', 'cell_list')
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """
+    Обработчик статических файлов без вывода каждого запроса в консоль.
+    """
+    
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class LocalPageServer:
+    """
+    HTTP-сервер в отдельном потоке текущего процесса, раздающий локальную копию страницы CellList.
+    """
+    
+    def __init__(self, root: str = CELL_LIST_REPLICA_DIR, host: str = '127.0.0.1', port: int = 0) -> None:
+        """
+        Инициализирует сервер.
+
+        Parameters
+        ----------
+        root : str, optional
+            Папка со статическими файлами. По умолчанию resource/cell_list.
+        host : str, optional
+            Адрес для прослушивания. По умолчанию '127.0.0.1'.
+        port : int, optional
+            Порт. По умолчанию 0 - свободный порт выбирается автоматически.
+        """
+        self.root = root
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """
+        Базовый адрес запущенного сервера.
+
+        Returns
+        -------
+        str
+            Адрес вида http://127.0.0.1:<порт>.
+        """
+        return f"http://{self.host}:{self.port}"
+    
+    """ Start server """
+    
+    def start(self) -> str:
+        """
+        Запускает сервер в фоновом потоке.
+
+        Returns
+        -------
+        str
+            Базовый адрес сервера.
+        """
+        handler = functools.partial(_QuietHandler, directory=self.root)
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='local-page-server', daemon=True)
+        self._thread.start()
+        step_log.info("Local page server started at %s", self.url)
+        return self.url
+    
+    """ Stop server """
+    
+    def stop(self) -> None:
+        """
+        Останавливает сервер и дожидается завершения потока.
+        """
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+        step_log.info("Local page server stopped")
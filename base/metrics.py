@@ -0,0 +1,251 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+# Границы корзин гистограммы задержек, мс
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    """
+    Возвращает перцентиль методом ближайшего ранга.
+
+    Parameters
+    ----------
+    sorted_samples : list
+        Отсортированные значения.
+    fraction : float
+        Доля от 0 до 1, например 0.95.
+
+    Returns
+    -------
+    float
+        Значение перцентиля или 0.0 для пустого списка.
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, int(-(-fraction * len(sorted_samples) // 1)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    """
+    Считает статистику задержек.
+
+    Parameters
+    ----------
+    samples : list
+        Задержки в секундах.
+
+    Returns
+    -------
+    dict
+        count, total_ms, p50_ms, p95_ms, max_ms и histogram (верхняя граница корзины в мс -> количество).
+    """
+    ordered = sorted(samples)
+    histogram: Dict[str, int] = {}
+    for sample in ordered:
+        sample_ms = sample * 1000
+        bucket = next((str(edge) for edge in HISTOGRAM_BUCKETS_MS if sample_ms <= edge), 'inf')
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+    return {
+        'count': len(ordered),
+        'total_ms': round(sum(ordered) * 1000, 3),
+        'p50_ms': round(percentile(ordered, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(ordered, 0.95) * 1000, 3),
+        'max_ms': round((ordered[-1] if ordered else 0.0) * 1000, 3),
+        'histogram': histogram,
+    }
+
+
+class LatencyRecorder:
+    """
+    Собирает задержки методов Base и CellList за текущий тест и за всю сессию.
+    Запись - это два вызова perf_counter и добавление в список, поэтому сбор можно не отключать.
+    """
+    
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        Инициализирует сборщик.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Включен ли сбор. По умолчанию True.
+        """
+        self.enabled = enabled
+        self.session: Dict[str, List[float]] = defaultdict(list)
+        self.tests: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.current_test: Optional[str] = None
+        self._test_samples: Dict[str, List[float]] = defaultdict(list)
+    
+    """ Record """
+    
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Сохраняет задержку операции.
+
+        Parameters
+        ----------
+        name : str
+            Имя операции, например 'get_element[clickable]'.
+        seconds : float
+            Задержка в секундах.
+        """
+        self.session[name].append(seconds)
+        if self.current_test is not None:
+            self._test_samples[name].append(seconds)
+    
+    """ Test boundaries """
+    
+    def start_test(self, test_name: str) -> None:
+        """
+        Начинает сбор задержек теста.
+
+        Parameters
+        ----------
+        test_name : str
+            Идентификатор теста (nodeid).
+        """
+        self.current_test = test_name
+        self._test_samples = defaultdict(list)
+    
+    def finish_test(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Завершает сбор задержек теста и возвращает его статистику.
+
+        Returns
+        -------
+        dict
+            Имя операции -> статистика summarize().
+        """
+        summary = {name: summarize(samples) for name, samples in self._test_samples.items()}
+        if self.current_test is not None:
+            self.tests[self.current_test] = summary
+        self.current_test = None
+        self._test_samples = defaultdict(list)
+        return summary
+    
+    """ Report """
+    
+    def session_summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Возвращает статистику задержек за сессию.
+
+        Returns
+        -------
+        dict
+            Имя операции -> статистика summarize().
+        """
+        return {name: summarize(samples) for name, samples in self.session.items()}
+    
+    @staticmethod
+    def format_table(summary: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Форматирует статистику в текстовую таблицу, отсортированную по суммарному времени.
+
+        Parameters
+        ----------
+        summary : dict
+            Имя операции -> статистика summarize().
+
+        Returns
+        -------
+        str
+            Таблица с колонками count, total, p50, p95, max (мс).
+        """
+        lines = [f"{'operation':<40} {'count':>7} {'total':>11} {'p50':>9} {'p95':>9} {'max':>9}"]
+        for name, stats in sorted(summary.items(), key=lambda item: item[1]['total_ms'], reverse=True):
+            lines.append(f"{name:<40} {stats['count']:>7} {stats['total_ms']:>11.1f} {stats['p50_ms']:>9.1f} "
+                         f"{stats['p95_ms']:>9.1f} {stats['max_ms']:>9.1f}")
+        return "\n".join(lines)
+    
+    def export_json(self, path: str) -> None:
+        """
+        Записывает статистику сессии и тестов в JSON-файл.
+
+        Parameters
+        ----------
+        path : str
+            Путь к файлу.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'session': self.session_summary(), 'tests': self.tests}, file, indent=2, ensure_ascii=False)
+
+
+# Общий сборщик задержек процесса (воркера xdist), отключается переменной окружения CELLLIST_LATENCY=0
+latency = LatencyRecorder(enabled=os.environ.get('CELLLIST_LATENCY', '1') != '0')
+
+# Стеки выполняемых операций timed по потокам: по стеку трассировщик команд определяет, какой метод отправил
+# команду. Стек у каждого потока свой, так как FailureForensics вызывает методы timed из параллельных потоков
+_call_stacks = threading.local()
+
+
+def active_calls() -> List[str]:
+    """
+    Возвращает стек выполняемых операций timed текущего потока.
+
+    Returns
+    -------
+    list
+        Имена операций от внешней к внутренней.
+    """
+    stack = getattr(_call_stacks, 'stack', None)
+    if stack is None:
+        stack = _call_stacks.stack = []
+    return stack
+
+
+def timed(name: str, split_by: Optional[str] = None) -> Callable:
+    """
+    Декоратор, записывающий задержку вызова метода в общий сборщик latency.
+    На время вызова имя операции помещается в стек active_calls() текущего потока.
+
+    Parameters
+    ----------
+    name : str
+        Имя операции.
+    split_by : str, optional
+        Имя аргумента, значение которого добавляется к имени операции, например wait_type:
+        'get_element[clickable]'. Если аргумент не передан, используется его значение по умолчанию.
+
+    Returns
+    -------
+    callable
+        Декоратор.
+    """
+    def decorator(function: Callable) -> Callable:
+        position = None
+        default = None
+        if split_by is not None:
+            parameters = list(inspect.signature(function).parameters.values())
+            position = [parameter.name for parameter in parameters].index(split_by)
+            default = parameters[position].default
+        
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            operation = name
+            if split_by is not None:
+                value = kwargs.get(split_by, args[position] if len(args) > position else default)
+                operation = f"{name}[{value}]"
+            calls = active_calls()
+            calls.append(operation)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                calls.pop()
+                if latency.enabled:
+                    latency.record(operation, elapsed)
+        
+        return wrapper
+    
+    return decorator
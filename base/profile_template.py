@@ -0,0 +1,276 @@
+import glob
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from base.scripts import FIRST_PAINT_SCRIPT
+from base.step_log import step_log
+
+# Файлы блокировок Chrome, которые не копируются из шаблона профиля
+CHROME_LOCK_FILES = ('SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile', 'LOCK')
+
+# Префикс папок шаблонов во временной папке; шаблоны прошлых сессий старше суток удаляются
+TEMPLATE_PREFIX = 'celllist-profile-'
+STALE_TEMPLATE_SECONDS = 24 * 3600
+
+
+class ProfileTemplate:
+    """
+    Шаблон профиля Chrome (user-data-dir) с прогретыми HTTP-кэшем и кэшем кода JS.
+
+    Шаблон собирается один раз за сессию тестов: первый воркер xdist запускает браузер с пустым профилем,
+    открывает страницу функцией warm_up (дважды, чтобы V8 сохранил скомпилированный код) и закрывает
+    браузер; остальные воркеры ждут готовности шаблона. Каждый новый браузер получает свою копию шаблона,
+    так как Chrome не разделяет user-data-dir между процессами. Для сравнения сохраняется время первой
+    отрисовки (first-contentful-paint) и первой навигации браузеров с пустым профилем и с копией шаблона.
+    Браузер с пустым профилем запускает только воркер, собравший шаблон, поэтому замеры воркеров
+    сохраняются в папку шаблона, а сводку по всем воркерам строит контроллер xdist (merge_samples).
+    """
+    
+    def __init__(self, enabled: bool = False, build_timeout: float = 180) -> None:
+        """
+        Инициализирует шаблон.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Выдавать новым браузерам копии шаблона. По умолчанию False.
+        build_timeout : float, optional
+            Сколько секунд воркер ждет шаблон, который собирает другой воркер. По умолчанию 180.
+        """
+        self.enabled = enabled
+        self.build_timeout = build_timeout
+        # Функция прогрева: открывает страницы в браузере (экземпляр Base) с собираемым шаблоном
+        self.warm_up: Optional[Callable[[Any], None]] = None
+        self.worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        self.set_run(os.environ.get('CELLLIST_PROFILE_TEMPLATE_RUN') or os.environ.get('PYTEST_XDIST_TESTRUNUID')
+                     or uuid.uuid4().hex)
+        self.state: Optional[str] = None
+        # Воркеры, чьи замеры объединены merge_samples
+        self.workers: List[str] = []
+        self.clones = 0
+        self.clone_times: List[float] = []
+        # Время первой отрисовки и первой навигации: 'cold' - пустой профиль, 'warm' - копия шаблона
+        self.first_paint_ms: Dict[str, List[float]] = {'cold': [], 'warm': []}
+        self.first_navigation_ms: Dict[str, List[float]] = {'cold': [], 'warm': []}
+    
+    def set_run(self, run_id: str) -> None:
+        """
+        Задает папку шаблона сессии тестов.
+
+        Parameters
+        ----------
+        run_id : str
+            Идентификатор сессии: общий для контроллера xdist и его воркеров.
+        """
+        self.root = os.path.join(tempfile.gettempdir(), f"{TEMPLATE_PREFIX}{run_id}")
+        self.template_dir = os.path.join(self.root, 'template')
+        self.clones_dir = os.path.join(self.root, f"clones-{self.worker}")
+    
+    """ Build template """
+    
+    def ensure(self, build: Callable[[str], None]) -> bool:
+        """
+        Собирает шаблон, если он еще не собран в этой сессии, или ждет, пока его соберет другой воркер.
+
+        Parameters
+        ----------
+        build : callable
+            Функция сборки: запускает браузер с user-data-dir по переданному пути, прогревает и закрывает его.
+
+        Returns
+        -------
+        bool
+            True, если шаблон готов; False - сборка не удалась, браузеры запускаются с пустым профилем.
+        """
+        if self.state is not None:
+            return self.state == 'ready'
+        
+        os.makedirs(self.root, exist_ok=True)
+        ready_marker = os.path.join(self.root, 'ready')
+        failed_marker = os.path.join(self.root, 'failed')
+        try:
+            # Собирает шаблон воркер, первым создавший файл блокировки
+            os.close(os.open(os.path.join(self.root, 'build.lock'), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            deadline = time.monotonic() + self.build_timeout
+            while not os.path.exists(ready_marker) and not os.path.exists(failed_marker):
+                if time.monotonic() > deadline:
+                    step_log.info("Profile template was not built in %ss, using empty profiles", self.build_timeout)
+                    self.state = 'failed'
+                    return False
+                time.sleep(0.2)
+            self.state = 'ready' if os.path.exists(ready_marker) else 'failed'
+            return self.state == 'ready'
+        
+        self._remove_stale_templates()
+        with step_log.step("Build Chrome profile template: %s", self.template_dir):
+            start = time.perf_counter()
+            try:
+                build(self.template_dir)
+            except Exception as error:
+                step_log.info("Profile template build failed: %s: %s", type(error).__name__, error)
+                open(failed_marker, 'w').close()
+                self.state = 'failed'
+                return False
+            open(ready_marker, 'w').close()
+            self.state = 'ready'
+            step_log.info("Profile template built in %.1f s, %.1f MiB", time.perf_counter() - start,
+                          self._size(self.template_dir) / 1024 ** 2)
+            return True
+    
+    def _remove_stale_templates(self) -> None:
+        # Шаблоны прерванных сессий остаются во временной папке; удаляем старше суток
+        parent = os.path.dirname(self.root)
+        for name in os.listdir(parent):
+            path = os.path.join(parent, name)
+            if name.startswith(TEMPLATE_PREFIX) and path != self.root:
+                try:
+                    if time.time() - os.path.getmtime(path) > STALE_TEMPLATE_SECONDS:
+                        shutil.rmtree(path, ignore_errors=True)
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _size(path: str) -> int:
+        total = 0
+        for directory, _, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(directory, name))
+                except OSError:
+                    pass
+        return total
+    
+    """ Clone template """
+    
+    def clone(self, build: Callable[[str], None]) -> Optional[str]:
+        """
+        Возвращает новую копию шаблона для очередного браузера, собирая шаблон при первом вызове.
+
+        Parameters
+        ----------
+        build : callable
+            Функция сборки шаблона (см. ensure).
+
+        Returns
+        -------
+        str or None
+            Путь к копии профиля или None, если шаблон недоступен.
+        """
+        if not self.enabled or not self.ensure(build):
+            return None
+        start = time.perf_counter()
+        self.clones += 1
+        path = os.path.join(self.clones_dir, str(self.clones))
+        shutil.copytree(self.template_dir, path, ignore=shutil.ignore_patterns(*CHROME_LOCK_FILES))
+        self.clone_times.append(time.perf_counter() - start)
+        return path
+    
+    def cleanup(self) -> None:
+        """
+        Удаляет копии шаблона текущего воркера.
+        """
+        shutil.rmtree(self.clones_dir, ignore_errors=True)
+    
+    def remove(self) -> None:
+        """
+        Удаляет папку шаблона сессии вместе с копиями и замерами воркеров.
+        """
+        shutil.rmtree(self.root, ignore_errors=True)
+    
+    """ First render """
+    
+    def record_first_render(self, driver, navigation_seconds: float) -> None:
+        """
+        Сохраняет время первой отрисовки страницы (Paint Timing) и первой навигации браузера.
+
+        Parameters
+        ----------
+        driver : WebDriver
+            Драйвер после первой навигации; атрибут warm_profile - запущен ли он с копией шаблона.
+        navigation_seconds : float
+            Время первой навигации в секундах.
+        """
+        kind = 'warm' if getattr(driver, 'warm_profile', False) else 'cold'
+        paint = driver.execute_async_script(FIRST_PAINT_SCRIPT, 5000)
+        if paint is not None:
+            self.first_paint_ms[kind].append(paint)
+        self.first_navigation_ms[kind].append(navigation_seconds * 1000)
+        step_log.info("First render (%s profile): first contentful paint %s ms, navigation %.0f ms", kind,
+                      f"{paint:.0f}" if paint is not None else "n/a", navigation_seconds * 1000)
+    
+    def summary(self) -> str:
+        """
+        Сводка времени первой отрисовки с пустым профилем и с копией шаблона.
+
+        Returns
+        -------
+        str
+            Медианы и количество замеров, время копирования шаблона.
+        """
+        def describe(values: List[float]) -> str:
+            return f"median {statistics.median(values):.0f} ms (n={len(values)})" if values else "n/a"
+        
+        workers = f", {len(self.workers)} workers" if self.workers else ""
+        lines = [f"Profile template ({self.state or 'not built'}{workers}, {self.clones} clones"
+                 + (f", clone median {statistics.median(self.clone_times) * 1000:.0f} ms" if self.clone_times else "")
+                 + "):"]
+        for kind, title in (('cold', 'empty profile'), ('warm', 'template copy')):
+            lines.append(f"  {title}: first contentful paint {describe(self.first_paint_ms[kind])}, "
+                         f"first navigation {describe(self.first_navigation_ms[kind])}")
+        return "\n".join(lines)
+    
+    """ Worker samples """
+    
+    def save_samples(self) -> None:
+        """
+        Сохраняет замеры воркера в папку шаблона для сводки контроллера.
+        """
+        if not os.path.isdir(self.root):
+            return
+        path = os.path.join(self.root, f"samples-{self.worker}.json")
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump({'state': self.state, 'clones': self.clones, 'clone_times': self.clone_times,
+                       'first_paint_ms': self.first_paint_ms,
+                       'first_navigation_ms': self.first_navigation_ms}, file)
+        os.replace(temporary_path, path)
+    
+    def merge_samples(self) -> int:
+        """
+        Заменяет замеры процесса объединенными замерами всех воркеров сессии.
+
+        Returns
+        -------
+        int
+            Количество воркеров, сохранивших замеры.
+        """
+        paths = sorted(glob.glob(os.path.join(self.root, 'samples-*.json')))
+        if not paths:
+            return 0
+        self.workers, states = [], []
+        self.clones, self.clone_times = 0, []
+        self.first_paint_ms = {'cold': [], 'warm': []}
+        self.first_navigation_ms = {'cold': [], 'warm': []}
+        for path in paths:
+            with open(path, encoding='utf-8') as file:
+                samples = json.load(file)
+            self.workers.append(os.path.basename(path)[len('samples-'):-len('.json')])
+            states.append(samples['state'])
+            self.clones += samples['clones']
+            self.clone_times.extend(samples['clone_times'])
+            for kind in ('cold', 'warm'):
+                self.first_paint_ms[kind].extend(samples['first_paint_ms'][kind])
+                self.first_navigation_ms[kind].extend(samples['first_navigation_ms'][kind])
+        self.state = 'ready' if 'ready' in states else next((state for state in states if state), None)
+        return len(paths)
+
+
+# Общий шаблон профиля процесса (воркера xdist), включается переменной окружения CELLLIST_PROFILE_TEMPLATE=1
+profile_template = ProfileTemplate(enabled=os.environ.get('CELLLIST_PROFILE_TEMPLATE') == '1')
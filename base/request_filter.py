@@ -0,0 +1,309 @@
+import json
+import os
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Optional, Sequence
+
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from base.file_lock import file_lock
+from base.scripts import RESOURCE_TIMINGS_SCRIPT
+from base.step_log import step_log
+
+# Режимы фильтрации запросов: 'off' - без фильтрации, 'on' - блокировка запросов по профилю страницы,
+# 'verify' - при первом открытии страницы дополнительно загрузка без фильтра, замер сэкономленного
+# и проверка, что страница работает с фильтром
+FILTER_MODES = ('off', 'on', 'verify')
+
+# Файл отчета фильтрации: замеры страниц без фильтра и сэкономленные запросы и байты
+DEFAULT_FILTER_REPORT = os.environ.get('CELLLIST_REQUEST_FILTER_REPORT', 'request_filter_report.json')
+
+
+class RequestFilterProfile:
+    """
+    Профиль фильтрации запросов страницы: шаблоны адресов в формате Network.setBlockedURLs
+    (* - любая последовательность символов). Запрос блокируется, если адрес подходит под шаблон deny
+    и не подходит ни под один шаблон allow.
+    """
+    
+    def __init__(self, name: str, deny: Sequence[str], allow: Sequence[str] = ()) -> None:
+        """
+        Инициализирует профиль.
+
+        Parameters
+        ----------
+        name : str
+            Имя профиля для отчета.
+        deny : sequence
+            Шаблоны блокируемых адресов.
+        allow : sequence, optional
+            Шаблоны адресов, которые нужны странице и не блокируются. По умолчанию пусто.
+        """
+        self.name = name
+        self.deny = tuple(deny)
+        self.allow = tuple(allow)
+    
+    def blocks(self, url: str) -> bool:
+        """
+        Проверяет, блокирует ли профиль запрос.
+
+        Parameters
+        ----------
+        url : str
+            Адрес запроса.
+
+        Returns
+        -------
+        bool
+            True, если адрес подходит под deny и не подходит под allow.
+        """
+        return (any(fnmatchcase(url, pattern) for pattern in self.deny)
+                and not any(fnmatchcase(url, pattern) for pattern in self.allow))
+    
+    def blocked_patterns(self) -> List[str]:
+        """
+        Возвращает шаблоны для Network.setBlockedURLs. CDP не поддерживает исключения, поэтому allow
+        проверяется при верификации: шаблон deny, под который попал нужный странице запрос, - ошибка профиля.
+
+        Returns
+        -------
+        list
+            Шаблоны deny.
+        """
+        return list(self.deny)
+    
+    def __repr__(self) -> str:
+        return f"RequestFilterProfile({self.name!r}, deny={len(self.deny)}, allow={len(self.allow)})"
+
+
+def summarize_resources(timings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Сводка запросов страницы по записям Performance API (RESOURCE_TIMINGS_SCRIPT).
+
+    Parameters
+    ----------
+    timings : dict
+        Результат RESOURCE_TIMINGS_SCRIPT.
+
+    Returns
+    -------
+    dict
+        requests - количество запросов (документ и ресурсы), bytes - переданные байты
+        (для ответов из кэша - размер тела), urls - адрес -> байты.
+    """
+    urls: Dict[str, int] = {}
+    for entry in timings.get('navigation', []) + timings.get('resources', []):
+        urls[entry['name']] = urls.get(entry['name'], 0) + int(entry.get('transferSize')
+                                                                or entry.get('encodedBodySize') or 0)
+    return {'requests': len(urls), 'bytes': sum(urls.values()), 'urls': urls}
+
+
+class RequestFilter:
+    """
+    Блокировка запросов браузера через CDP (Network.setBlockedURLs) по профилю страницы и отчет
+    о сэкономленных запросах и байтах.
+
+    Сэкономленное считается по загрузке страницы без фильтра: запросы, которые блокирует профиль,
+    и их байты. Такой замер выполняется в режиме 'verify' при первом открытии страницы за сессию
+    и сохраняется в файл отчета; в режиме 'on' отчет прошлых прогонов используется для вывода
+    сэкономленного при каждой навигации.
+    """
+    
+    def __init__(self, mode: str = 'off') -> None:
+        """
+        Инициализирует фильтр.
+
+        Parameters
+        ----------
+        mode : str, optional
+            Режим из FILTER_MODES. По умолчанию 'off'.
+        """
+        self.mode = 'off'
+        self.set_mode(mode)
+        # Адрес страницы -> замеры: профиль, без фильтра, блокируемое профилем, с фильтром, проверка страницы
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.measured: List[str] = []
+        self.navigations = 0
+        self.saved_requests = 0
+        self.saved_bytes = 0
+    
+    def set_mode(self, mode: str) -> None:
+        """
+        Переключает режим фильтрации.
+
+        Parameters
+        ----------
+        mode : str
+            'off', 'on' или 'verify'.
+        """
+        if mode not in FILTER_MODES:
+            raise ValueError(f"Unsupported request filter mode: {mode}. Available: {', '.join(FILTER_MODES)}")
+        self.mode = mode
+    
+    """ Apply in browser """
+    
+    @staticmethod
+    def apply(driver: WebDriver, profile: Optional[RequestFilterProfile]) -> None:
+        """
+        Устанавливает блокировку запросов браузера по профилю (None - снимает блокировку).
+        Шаблоны запоминаются в драйвере, повторная установка тех же шаблонов не отправляет команд.
+
+        Parameters
+        ----------
+        driver : WebDriver
+            Chrome-драйвер.
+        profile : RequestFilterProfile or None
+            Профиль фильтрации.
+        """
+        patterns = tuple(profile.blocked_patterns()) if profile is not None else ()
+        if (getattr(driver, 'blocked_urls', None) or ()) == patterns:
+            return
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        driver.blocked_urls = patterns
+    
+    @staticmethod
+    def measure(driver: WebDriver) -> Dict[str, Any]:
+        """
+        Возвращает сводку запросов открытой страницы (summarize_resources).
+
+        Parameters
+        ----------
+        driver : WebDriver
+            Драйвер с открытой страницей.
+
+        Returns
+        -------
+        dict
+            Количество запросов, байты и байты по адресам.
+        """
+        return summarize_resources(driver.execute_script(RESOURCE_TIMINGS_SCRIPT))
+    
+    """ Baseline and report """
+    
+    def needs_baseline(self, url: str) -> bool:
+        """
+        Проверяет, нужно ли в режиме 'verify' загрузить страницу без фильтра (первое открытие за сессию).
+
+        Parameters
+        ----------
+        url : str
+            Адрес страницы.
+
+        Returns
+        -------
+        bool
+            True для режима 'verify', если страница еще не замерена в этой сессии.
+        """
+        return self.mode == 'verify' and url not in self.measured
+    
+    def record_baseline(self, url: str, profile: RequestFilterProfile, baseline: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Сохраняет замер страницы без фильтра и считает, что блокирует профиль.
+
+        Parameters
+        ----------
+        url : str
+            Адрес страницы.
+        profile : RequestFilterProfile
+            Профиль фильтрации страницы.
+        baseline : dict
+            Сводка запросов страницы без фильтра.
+
+        Returns
+        -------
+        dict
+            Запись страницы: requests и bytes без фильтра, blocked - блокируемые запросы и байты,
+            conflicts - нужные странице (allow) адреса, которые заблокировал бы шаблон deny.
+        """
+        blocked = {name: size for name, size in baseline['urls'].items() if profile.blocks(name)}
+        conflicts = [name for name in baseline['urls']
+                     if any(fnmatchcase(name, pattern) for pattern in profile.deny) and not profile.blocks(name)]
+        page = {'profile': profile.name, 'requests': baseline['requests'], 'bytes': baseline['bytes'],
+                'blocked': {'requests': len(blocked), 'bytes': sum(blocked.values()), 'urls': sorted(blocked)},
+                'conflicts': conflicts}
+        self.pages[url] = page
+        self.measured.append(url)
+        step_log.info("Request filter baseline for %s: %s requests, %s bytes; profile '%s' blocks %s requests, "
+                      "%s bytes", url, page['requests'], page['bytes'], profile.name, page['blocked']['requests'],
+                      page['blocked']['bytes'])
+        return page
+    
+    def record_navigation(self, url: str, filtered: Dict[str, Any], verified: Optional[bool] = None) -> None:
+        """
+        Учитывает навигацию с фильтром: загруженные запросы и сэкономленное по замеру страницы без фильтра.
+
+        Parameters
+        ----------
+        url : str
+            Адрес страницы.
+        filtered : dict
+            Сводка запросов страницы с фильтром.
+        verified : bool, optional
+            Результат проверки работы страницы с фильтром (режим 'verify').
+        """
+        self.navigations += 1
+        page = self.pages.get(url)
+        if page is None:
+            step_log.info("Request filter: %s requests, %s bytes loaded (no baseline for %s, run with verify mode)",
+                          filtered['requests'], filtered['bytes'], url)
+            return
+        page['filtered'] = {'requests': filtered['requests'], 'bytes': filtered['bytes']}
+        if verified is not None:
+            page['verified'] = verified
+        self.saved_requests += page['blocked']['requests']
+        self.saved_bytes += page['blocked']['bytes']
+        step_log.info("Request filter: %s requests, %s bytes loaded; saved %s requests, %s bytes",
+                      filtered['requests'], filtered['bytes'], page['blocked']['requests'], page['blocked']['bytes'])
+    
+    def summary(self) -> str:
+        """
+        Сводка фильтрации за сессию.
+
+        Returns
+        -------
+        str
+            Режим, количество навигаций и сэкономленные запросы и байты.
+        """
+        return (f"Request filter ({self.mode}): {self.navigations} navigations, saved {self.saved_requests} requests, "
+                f"{self.saved_bytes / 1024:.1f} KiB")
+    
+    def load(self, path: str) -> None:
+        """
+        Загружает замеры страниц без фильтра из отчета прошлых прогонов.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу отчета.
+        """
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                self.pages.update(json.load(file).get('pages', {}))
+    
+    def save(self, path: str) -> None:
+        """
+        Дописывает замеры страниц этой сессии в JSON-файл отчета. Отчет сохраняет каждый воркер xdist,
+        измеривший страницы: чтение, слияние и замена файла выполняются под файловой блокировкой,
+        чтобы замеры одного воркера не затирали замеры другого.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу отчета.
+        """
+        with file_lock(path):
+            pages = {}
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as file:
+                    pages = json.load(file).get('pages', {})
+            pages.update({url: self.pages[url] for url in self.measured})
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, 'w', encoding='utf-8') as file:
+                json.dump({'pages': pages}, file, indent=2)
+            os.replace(temporary_path, path)
+
+
+# Общий фильтр запросов процесса (воркера xdist), режим задается переменной окружения CELLLIST_REQUEST_FILTER
+request_filter = RequestFilter(os.environ.get('CELLLIST_REQUEST_FILTER', 'off'))
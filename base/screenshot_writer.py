@@ -0,0 +1,128 @@
+import atexit
+import hashlib
+import io
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Optional
+
+from base.step_log import step_log
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow не обязателен: без него скриншоты сохраняются без уменьшения
+    Image = None
+
+# Папка для скриншотов, если не используется Allure
+SCREENS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'screens')
+
+
+class ScreenshotWriter:
+    """
+    Фоновая запись скриншотов на диск: уменьшение и сохранение PNG выполняются в ограниченном пуле потоков,
+    чтобы хук отчета pytest не ждал диска. Одинаковые скриншоты подряд записываются один раз.
+    """
+    
+    def __init__(self, directory: str = SCREENS_DIR, max_workers: int = 2, max_pending: int = 8,
+                 max_width: Optional[int] = None) -> None:
+        """
+        Инициализирует пул записи.
+
+        Parameters
+        ----------
+        directory : str, optional
+            Папка для скриншотов. По умолчанию screens/.
+        max_workers : int, optional
+            Количество потоков записи. По умолчанию 2.
+        max_pending : int, optional
+            Максимальное количество скриншотов в очереди; при заполнении submit ждет освобождения места.
+            По умолчанию 8.
+        max_width : int, optional
+            Ширина, до которой уменьшаются скриншоты (нужен Pillow). None - без уменьшения.
+        """
+        self.directory = directory
+        self.max_width = max_width
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='screenshot-writer')
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+        self._last_digest: Optional[str] = None
+        self._last_path: Optional[str] = None
+        self.written = 0
+        self.duplicates = 0
+    
+    """ Submit screenshot """
+    
+    def submit(self, png: bytes, file_name: str) -> str:
+        """
+        Ставит скриншот в очередь записи. Если он совпадает с предыдущим, запись пропускается.
+
+        Parameters
+        ----------
+        png : bytes
+            Скриншот в формате PNG.
+        file_name : str
+            Имя файла в папке скриншотов.
+
+        Returns
+        -------
+        str
+            Путь к файлу скриншота (для дубликата - путь к ранее записанному файлу).
+        """
+        digest = hashlib.sha1(png).hexdigest()
+        with self._lock:
+            if digest == self._last_digest:
+                self.duplicates += 1
+                return self._last_path
+            path = os.path.join(self.directory, file_name)
+            self._last_digest, self._last_path = digest, path
+        
+        self._slots.acquire()
+        future = self._executor.submit(self._write, png, path)
+        future.add_done_callback(self._on_done)
+        with self._lock:
+            self._pending = [pending for pending in self._pending if not pending.done()] + [future]
+        return path
+    
+    def _write(self, png: bytes, path: str) -> None:
+        if self.max_width and Image is not None:
+            image = Image.open(io.BytesIO(png))
+            if image.width > self.max_width:
+                height = round(image.height * self.max_width / image.width)
+                buffer = io.BytesIO()
+                image.resize((self.max_width, height)).save(buffer, format='PNG', optimize=True)
+                png = buffer.getvalue()
+        os.makedirs(self.directory, exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(png)
+        with self._lock:
+            self.written += 1
+    
+    def _on_done(self, future: Future) -> None:
+        self._slots.release()
+        error = future.exception()
+        if error is not None:
+            step_log.info("Screenshot write failed: %s", error)
+    
+    """ Flush """
+    
+    def flush(self) -> None:
+        """
+        Дожидается записи всех скриншотов из очереди.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        wait(pending)
+    
+    def close(self) -> None:
+        """
+        Дожидается записи очереди и останавливает потоки.
+        """
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+
+# Общий пул записи скриншотов процесса (воркера xdist), очередь дописывается при выходе.
+# Ширина уменьшения задается переменной окружения CELLLIST_SCREENSHOT_MAX_WIDTH
+screenshot_writer = ScreenshotWriter(max_width=int(os.environ.get('CELLLIST_SCREENSHOT_MAX_WIDTH', '0')) or None)
+atexit.register(screenshot_writer.close)
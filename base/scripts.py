@@ -0,0 +1,586 @@
+# JavaScript-скрипты, выполняемые в браузере за одну команду WebDriver
+
+# Общий фрагмент скриптов заполнения формы: fillField(element, value, enter) устанавливает значение поля
+# (для <select> - опцию по видимому тексту) и генерирует события input/keyup/change/blur (и Enter для enter=true),
+# на которые подписаны виджеты GWT. Возвращает false, если опции с таким текстом нет.
+_FILL_FIELD_JS = """
+function fire(element, type) {
+    element.dispatchEvent(new Event(type, {bubbles: true}));
+}
+function key(element, type, name, code) {
+    var event = new KeyboardEvent(type, {key: name, code: name, bubbles: true, cancelable: true});
+    Object.defineProperty(event, 'keyCode', {get: function () { return code; }});
+    Object.defineProperty(event, 'which', {get: function () { return code; }});
+    element.dispatchEvent(event);
+}
+function fillField(element, value, enter) {
+    element.focus();
+    if (element.tagName === 'SELECT') {
+        var index = -1;
+        for (var j = 0; j < element.options.length; j++) {
+            if (element.options[j].text === value) {
+                index = j;
+                break;
+            }
+        }
+        if (index < 0) {
+            return false;
+        }
+        element.selectedIndex = index;
+    } else {
+        var prototype = element.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, value);
+        fire(element, 'input');
+        key(element, 'keyup', 'Unidentified', 0);
+    }
+    fire(element, 'change');
+    if (enter) {
+        key(element, 'keydown', 'Enter', 13);
+        key(element, 'keypress', 'Enter', 13);
+        key(element, 'keyup', 'Enter', 13);
+    }
+    element.blur();
+    fire(element, 'blur');
+    return true;
+}
+"""
+
+# Заполняет поля и возвращает их итоговые значения.
+# arguments[0] - список полей {name, xpath, value, enter}, заполняются функцией fillField (_FILL_FIELD_JS).
+# Возвращает {values: {name: value}} или {missing: name}.
+FILL_FIELDS_SCRIPT = _FILL_FIELD_JS + """
+var fields = arguments[0];
+function find(xpath) {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function read(element) {
+    if (element.tagName === 'SELECT') {
+        return element.selectedIndex < 0 ? '' : element.options[element.selectedIndex].text;
+    }
+    return element.value;
+}
+var elements = [];
+for (var i = 0; i < fields.length; i++) {
+    var field = fields[i];
+    var element = find(field.xpath);
+    if (!element) {
+        return {missing: field.name};
+    }
+    elements.push(element);
+    if (!fillField(element, field.value, field.enter)) {
+        return {missing: field.name + " option '" + field.value + "'"};
+    }
+}
+var values = {};
+for (var k = 0; k < fields.length; k++) {
+    values[fields[k].name] = read(elements[k]);
+}
+return {values: values};
+"""
+
+# Читает значения полей. arguments[0] - список полей {name, xpath}.
+# Возвращает {name: value}; для отсутствующих элементов значение null.
+READ_FIELDS_SCRIPT = """
+var fields = arguments[0];
+var values = {};
+for (var i = 0; i < fields.length; i++) {
+    var element = document.evaluate(fields[i].xpath, document, null,
+                                     XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!element) {
+        values[fields[i].name] = null;
+    } else if (element.tagName === 'SELECT') {
+        values[fields[i].name] = element.selectedIndex < 0 ? '' : element.options[element.selectedIndex].text;
+    } else {
+        values[fields[i].name] = element.value;
+    }
+}
+return values;
+"""
+
+# Сбрасывает значение поля arguments[0] (если arguments[1] истинно) и генерирует события input/keyup/change,
+# на которые подписаны виджеты GWT
+CLEAR_FIELD_SCRIPT = """
+var element = arguments[0];
+if (arguments[1]) {
+    var prototype = element.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, '');
+}
+element.dispatchEvent(new Event('input', {bubbles: true}));
+element.dispatchEvent(new KeyboardEvent('keyup', {bubbles: true}));
+element.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# Ожидание условия в DOM без опроса со стороны Python (execute_async_script).
+# arguments: условие, xpath, параметр условия, таймаут в мс, интервал дополнительной проверки в мс.
+# Условие проверяется сразу, при каждой мутации DOM (MutationObserver) и по короткому интервалу
+# для свойств, изменения которых не видны MutationObserver (value, стили, scrollHeight).
+# Условия: 'located', 'visible', 'clickable', 'invisible' - возвращают элемент (или null);
+# 'text_matches' - текст (или value) элемента полностью совпадает с регулярным выражением, возвращает текст;
+# 'count_at_least' - количество узлов по xpath не меньше N, возвращает количество;
+# 'scroll_height_stable' - scrollHeight элемента не меняется N мс, возвращает scrollHeight.
+# Результат: {ok: true, value: ...}, {ok: false, last: ...} по таймауту или {error: ...}.
+WAIT_FOR_CONDITION_SCRIPT = """
+var condition = arguments[0], xpath = arguments[1], argument = arguments[2];
+var timeout = arguments[3], interval = arguments[4];
+var done = arguments[arguments.length - 1];
+var regex = condition === 'text_matches' ? new RegExp('^(?:' + argument + ')$') : null;
+var last = null, lastHeight = null, stableSince = 0, finished = false;
+function first() {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function visible(element) {
+    if (!element.isConnected) {
+        return false;
+    }
+    var style = window.getComputedStyle(element);
+    if (style.display === 'none' || style.visibility === 'hidden' || parseFloat(style.opacity) === 0) {
+        return false;
+    }
+    var rects = element.getClientRects();
+    return rects.length > 0 && (rects[0].width > 0 || rects[0].height > 0);
+}
+function text(element) {
+    var value = (element.innerText || '').trim();
+    return value || (element.value === undefined ? '' : String(element.value));
+}
+function check() {
+    var element;
+    switch (condition) {
+        case 'located':
+            element = first();
+            return element ? {value: element} : null;
+        case 'visible':
+            element = first();
+            return element && visible(element) ? {value: element} : null;
+        case 'clickable':
+            element = first();
+            return element && visible(element) && !element.disabled ? {value: element} : null;
+        case 'invisible':
+            element = first();
+            return !element || !visible(element) ? {value: null} : null;
+        case 'text_matches':
+            element = first();
+            if (!element) {
+                return null;
+            }
+            last = text(element);
+            return regex.test(last) ? {value: last} : null;
+        case 'count_at_least':
+            last = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null)
+                .snapshotLength;
+            return last >= argument ? {value: last} : null;
+        case 'scroll_height_stable':
+            element = first();
+            if (!element) {
+                return null;
+            }
+            var now = performance.now();
+            last = element.scrollHeight;
+            if (last !== lastHeight) {
+                lastHeight = last;
+                stableSince = now;
+                return null;
+            }
+            return now - stableSince >= argument ? {value: last} : null;
+    }
+    throw new Error('Unsupported wait condition: ' + condition);
+}
+var observer = new MutationObserver(evaluate);
+var poll = setInterval(evaluate, interval);
+var timer = setTimeout(function () { finish({ok: false, last: last}); }, timeout);
+function finish(result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearInterval(poll);
+    clearTimeout(timer);
+    done(result);
+}
+function evaluate() {
+    if (finished) {
+        return;
+    }
+    try {
+        var result = check();
+        if (result) {
+            finish({ok: true, value: result.value});
+        }
+    } catch (error) {
+        finish({error: String(error)});
+    }
+}
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+evaluate();
+"""
+
+# Прокручивает элемент arguments[0] в самый верх и возвращает scrollTop
+SCROLL_TO_TOP_SCRIPT = """
+arguments[0].scrollTo(0, 0);
+return arguments[0].scrollTop;
+"""
+
+# Прокручивает список до конца внутри браузера (execute_async_script), пока не подгрузятся все карточки.
+# arguments: xpath списка, xpath счетчика, ожидаемое количество карточек (или null),
+# регулярное выражение ожидаемого текста счетчика (или null), таймаут в мс, мс без изменений для завершения.
+# Цель по умолчанию - общее количество из счетчика вида "0 - 30 : 250"; если счетчик не разобран,
+# прокрутка завершается, когда количество карточек и высота списка не меняются заданное время.
+# Результат: {ok, reason, pages, count, counter, elapsed_ms} или {error: ...}.
+SCROLL_TO_END_SCRIPT = """
+var listXpath = arguments[0], counterXpath = arguments[1];
+var expectedCount = arguments[2], expectedCounter = arguments[3];
+var timeout = arguments[4], settle = arguments[5];
+var done = arguments[arguments.length - 1];
+function find(xpath) {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+var list = find(listXpath);
+if (!list) {
+    done({error: 'Contact list is not found'});
+    return;
+}
+var counterRegex = expectedCounter ? new RegExp('^(?:' + expectedCounter + ')$') : null;
+var start = performance.now();
+var pages = 0, count = cards(), lastHeight = list.scrollHeight, lastChange = start, finished = false;
+function cards() {
+    return list.querySelectorAll('[__idx]').length;
+}
+function counterText() {
+    var counter = counterXpath ? find(counterXpath) : null;
+    return counter ? (counter.innerText || counter.textContent || '').trim() : null;
+}
+function reached() {
+    if (counterRegex) {
+        return counterRegex.test(counterText() || '');
+    }
+    var target = expectedCount;
+    if (target === null || target === undefined) {
+        var match = /:\\s*(\\d+)\\s*$/.exec(counterText() || '');
+        target = match ? parseInt(match[1], 10) : null;
+    }
+    return target === null ? null : count >= target;
+}
+function finish(ok, reason) {
+    finished = true;
+    observer.disconnect();
+    clearInterval(poll);
+    done({ok: ok, reason: reason, pages: pages, count: count, counter: counterText(),
+          elapsed_ms: performance.now() - start});
+}
+function tick() {
+    if (finished) {
+        return;
+    }
+    var now = performance.now();
+    var current = cards();
+    if (current !== count) {
+        if (current > count) {
+            pages++;
+        }
+        count = current;
+        lastChange = now;
+    }
+    if (list.scrollHeight !== lastHeight) {
+        lastHeight = list.scrollHeight;
+        lastChange = now;
+    }
+    var state = reached();
+    if (state === true) {
+        finish(true, 'target');
+    } else if (state === null && now - lastChange >= settle) {
+        finish(true, 'settled');
+    } else if (now - start >= timeout) {
+        finish(false, 'timeout');
+    } else {
+        list.scrollTop = list.scrollHeight;
+    }
+}
+var observer = new MutationObserver(tick);
+observer.observe(list, {subtree: true, childList: true});
+var poll = setInterval(tick, 20);
+tick();
+"""
+
+# Проверяет, что закэшированный элемент arguments[0] все еще в DOM и удовлетворяет типу ожидания arguments[1]
+ELEMENT_STATE_SCRIPT = """
+var element = arguments[0], waitType = arguments[1];
+if (!element.isConnected) {
+    return false;
+}
+if (waitType === 'located' || waitType === 'find') {
+    return true;
+}
+var style = window.getComputedStyle(element);
+var rects = element.getClientRects();
+var visible = style.display !== 'none' && style.visibility !== 'hidden' && parseFloat(style.opacity) !== 0
+    && rects.length > 0 && (rects[0].width > 0 || rects[0].height > 0);
+return visible && (waitType !== 'clickable' || !element.disabled);
+"""
+
+# Общий фрагмент извлечения карточек: cardColumns(list) возвращает столбцы отрисованных карточек списка
+# {idx, names, addresses, classes} с нормализованными пробелами (как в WebElement.text); classes - атрибут class
+# карточек (выделение). Один фрагмент для snapshot_contacts и проверки сброса страницы.
+_CARD_COLUMNS_JS = """
+function clean(node) {
+    return node ? node.textContent.replace(/\\s+/g, ' ').trim() : '';
+}
+function cardColumns(list) {
+    var cards = list.querySelectorAll('[__idx]');
+    var columns = {idx: [], names: [], addresses: [], classes: []};
+    for (var c = 0; c < cards.length; c++) {
+        var nameCell = cards[c].querySelector("td[style='font-size:95%;']");
+        var nameRow = nameCell ? nameCell.closest('tr') : null;
+        var addressRow = nameRow ? nameRow.nextElementSibling : null;
+        columns.idx.push(parseInt(cards[c].getAttribute('__idx'), 10));
+        columns.names.push(clean(nameCell));
+        columns.addresses.push(clean(addressRow ? addressRow.querySelector('td') : null));
+        columns.classes.push(cards[c].className);
+    }
+    return columns;
+}
+"""
+
+# Извлекает все отрисованные карточки контактов списка arguments[0] (xpath) одной командой.
+# Возвращает столбцы cardColumns (_CARD_COLUMNS_JS) или null, если список не найден.
+SNAPSHOT_CONTACTS_SCRIPT = _CARD_COLUMNS_JS + """
+var list = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+    .singleNodeValue;
+return list ? cardColumns(list) : null;
+"""
+
+# Возвращает outerHTML элемента arguments[0] (xpath) или null, если элемент не найден
+OUTER_HTML_SCRIPT = """
+var element = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+    .singleNodeValue;
+return element ? element.outerHTML : null;
+"""
+
+# Возвращает записи Performance API страницы: навигацию и загрузку ресурсов (toJSON каждой записи)
+RESOURCE_TIMINGS_SCRIPT = """
+function entries(type) {
+    return performance.getEntriesByType(type).map(function (entry) { return entry.toJSON(); });
+}
+return {url: location.href, timeOrigin: performance.timeOrigin, navigation: entries('navigation'),
+        resources: entries('resource')};
+"""
+
+# Создает контакты пакетом: для каждой записи заполняет поля формы (fillField, как FILL_FIELDS_SCRIPT), нажимает кнопку
+# создания и ждет, пока общее количество в счетчике не увеличится на единицу.
+# Аргументы: fields [{name, xpath, enter}], rows (значения полей по порядку fields, null - не заполнять),
+# xpath кнопки создания, xpath счетчика, таймаут одной записи в мс.
+# Возвращает {ok, created, before, total, counter, elapsed_ms} или {ok: false, error|reason, created, ...}.
+CREATE_CONTACTS_SCRIPT = _FILL_FIELD_JS + """
+var fields = arguments[0], rows = arguments[1], buttonXpath = arguments[2], counterXpath = arguments[3];
+var timeout = arguments[4];
+var done = arguments[arguments.length - 1];
+function find(xpath) {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+var elements = [];
+for (var f = 0; f < fields.length; f++) {
+    elements.push(find(fields[f].xpath));
+    if (!elements[f]) {
+        done({ok: false, error: "Element '" + fields[f].name + "' is not found", created: 0});
+        return;
+    }
+}
+var button = find(buttonXpath), counter = find(counterXpath);
+if (!button || !counter) {
+    done({ok: false, error: 'Create button or counter is not found', created: 0});
+    return;
+}
+function total() {
+    var match = /:\\s*(\\d+)\\s*$/.exec(counter.textContent);
+    return match ? parseInt(match[1], 10) : -1;
+}
+function fill(row) {
+    for (var i = 0; i < fields.length; i++) {
+        var value = row[i];
+        if (value === null || value === undefined) {
+            continue;
+        }
+        if (!fillField(elements[i], value, fields[i].enter)) {
+            return fields[i].name + " option '" + value + "' is not found";
+        }
+    }
+    return null;
+}
+var start = performance.now(), before = total(), created = 0;
+function finish(result) {
+    result.created = created;
+    result.before = before;
+    result.total = total();
+    result.counter = counter.textContent;
+    result.elapsed_ms = performance.now() - start;
+    done(result);
+}
+function next() {
+    while (created < rows.length) {
+        var expected = total() + 1;
+        var error = fill(rows[created]);
+        if (error) {
+            finish({ok: false, error: error});
+            return;
+        }
+        button.click();
+        if (total() !== expected) {
+            wait(expected, performance.now() + timeout);
+            return;
+        }
+        created++;
+    }
+    finish({ok: true});
+}
+function wait(expected, deadline) {
+    if (total() === expected) {
+        created++;
+        next();
+    } else if (performance.now() > deadline) {
+        finish({ok: false, reason: 'Counter did not increase after record ' + created});
+    } else {
+        setTimeout(function () { wait(expected, deadline); }, 10);
+    }
+}
+next();
+"""
+
+# Нажимает кнопку генерации контактов, пока общее количество в счетчике не достигнет цели, дожидаясь обновления
+# счетчика после каждого нажатия. Аргументы: xpath кнопки, xpath счетчика, целевое количество, таймаут одного
+# нажатия в мс. Возвращает {ok, clicks, before, total, counter, elapsed_ms, update_ms} (update_ms - время от нажатия
+# до отрисовки кадра с обновленным текстом счетчика для каждого нажатия) или {ok: false, error|reason, ...}.
+GENERATE_CONTACTS_SCRIPT = """
+var button = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+    .singleNodeValue;
+var counter = document.evaluate(arguments[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+    .singleNodeValue;
+var target = arguments[2], timeout = arguments[3];
+var done = arguments[arguments.length - 1];
+if (!button || !counter) {
+    done({ok: false, error: 'Generate button or counter is not found', clicks: 0});
+    return;
+}
+function total() {
+    var match = /:\\s*(\\d+)\\s*$/.exec(counter.textContent);
+    return match ? parseInt(match[1], 10) : -1;
+}
+var start = performance.now(), before = total(), clicks = 0, updates = [];
+function finish(result) {
+    result.clicks = clicks;
+    result.before = before;
+    result.total = total();
+    result.counter = counter.textContent;
+    result.elapsed_ms = performance.now() - start;
+    result.update_ms = updates;
+    done(result);
+}
+function next() {
+    if (total() >= target) {
+        finish({ok: true});
+        return;
+    }
+    var previous = total(), clicked = performance.now();
+    button.click();
+    clicks++;
+    wait(previous, clicked);
+}
+function wait(previous, clicked) {
+    var now = performance.now();
+    if (total() > previous) {
+        painted(clicked);
+    } else if (now - clicked > timeout) {
+        finish({ok: false, reason: 'Counter did not change after click ' + clicks});
+    } else {
+        setTimeout(function () { wait(previous, clicked); }, 0);
+    }
+}
+function painted(clicked) {
+    // Текст счетчика может смениться еще в обработчике нажатия: замер завершается в задаче после
+    // кадра (requestAnimationFrame), в котором отрисован новый текст
+    var settled = false;
+    requestAnimationFrame(function () {
+        setTimeout(function () {
+            if (settled) {
+                return;
+            }
+            settled = true;
+            updates.push(performance.now() - clicked);
+            next();
+        }, 0);
+    });
+    setTimeout(function () {
+        if (!settled) {
+            settled = true;
+            finish({ok: false, reason: 'Counter update was not painted after click ' + clicks});
+        }
+    }, Math.max(0, clicked + timeout - performance.now()));
+}
+next();
+"""
+
+# Сбрасывает открытую страницу CellList к начальному состоянию без перезагрузки.
+# Аргументы: ожидаемый адрес страницы, xpath полей формы, xpath списка, xpath счетчика, xpath первой карточки.
+# Если открыта другая страница, возвращает {reset: false, reason}. Иначе вызывает window.cellListDemo.reset(),
+# если страница его предоставляет (локальная копия), очищает поля формы (первая опция для select),
+# прокручивает список к началу и возвращает {reset: true, hook, counter, first_card, cards} для проверки;
+# cards - столбцы отрисованных карточек cardColumns (_CARD_COLUMNS_JS), как в SNAPSHOT_CONTACTS_SCRIPT.
+RESET_PAGE_SCRIPT = _CARD_COLUMNS_JS + """
+var url = arguments[0], fieldXpaths = arguments[1], listXpath = arguments[2], counterXpath = arguments[3];
+var firstCardXpath = arguments[4];
+function find(xpath) {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+if (location.href !== url) {
+    return {reset: false, reason: 'Another page is open: ' + location.href};
+}
+var hook = !!(window.cellListDemo && typeof window.cellListDemo.reset === 'function');
+if (hook) {
+    window.cellListDemo.reset();
+}
+for (var i = 0; i < fieldXpaths.length; i++) {
+    var element = find(fieldXpaths[i]);
+    if (!element) {
+        return {reset: false, reason: 'Form field is not found: ' + fieldXpaths[i]};
+    }
+    if (element.tagName === 'SELECT') {
+        if (element.selectedIndex !== 0) {
+            element.selectedIndex = 0;
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+    } else if (element.value !== '') {
+        var prototype = element.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, '');
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+}
+var list = find(listXpath);
+if (list) {
+    list.scrollTop = 0;
+}
+var counter = find(counterXpath);
+return {reset: true, hook: hook, scroll_top: list ? list.scrollTop : null,
+        counter: counter ? (counter.innerText || counter.textContent || '').trim() : null,
+        first_card: !!find(firstCardXpath),
+        cards: list ? cardColumns(list) : {idx: [], names: [], addresses: [], classes: []}};
+"""
+
+# Возвращает время первой отрисовки содержимого страницы (first-contentful-paint, мс от начала навигации),
+# дожидаясь ее не дольше таймаута в мс (аргумент); null, если отрисовки не было или Paint Timing недоступен.
+FIRST_PAINT_SCRIPT = """
+var timeout = arguments[0];
+var done = arguments[arguments.length - 1];
+function find() {
+    var entries = performance.getEntriesByName('first-contentful-paint');
+    return entries.length ? entries[0].startTime : null;
+}
+var start = performance.now();
+(function poll() {
+    var value = find();
+    if (value !== null || performance.now() - start > timeout) {
+        done(value);
+    } else {
+        setTimeout(poll, 20);
+    }
+})();
+"""
@@ -0,0 +1,194 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, List, Optional
+
+import allure
+
+# Уровни событий: подробности, обычные сообщения и границы шагов
+DEBUG, INFO, STEP = 10, 20, 30
+
+# Режимы журнала: 'debug' - все события, 'info' - шаги и сообщения, 'quiet' - только шаги и их время
+LOG_MODES = {'debug': DEBUG, 'info': INFO, 'quiet': STEP}
+
+
+class StepLogger:
+    """
+    Журнал шагов и событий методов Base и CellList с уровнями.
+
+    События буферизуются в рамках теста и выводятся одним блоком в консоль и во вложение Allure
+    при завершении теста (flush). Сообщения хранятся как шаблон и аргументы в стиле logging
+    и форматируются только при выводе, события ниже текущего уровня не сохраняются.
+    Вне теста события выводятся в консоль по завершении шага верхнего уровня.
+    """
+    
+    def __init__(self, mode: str = 'info') -> None:
+        """
+        Инициализирует журнал.
+
+        Parameters
+        ----------
+        mode : str, optional
+            Режим журнала из LOG_MODES. По умолчанию 'info'.
+        """
+        self.level = INFO
+        self.set_mode(mode)
+        self.test_name: Optional[str] = None
+        self._events: List[list] = []
+        self._depth = 0
+        self._origin = time.perf_counter()
+    
+    def set_mode(self, mode: str) -> None:
+        """
+        Переключает режим журнала.
+
+        Parameters
+        ----------
+        mode : str
+            'debug', 'info' или 'quiet'.
+        """
+        if mode not in LOG_MODES:
+            raise ValueError(f"Unsupported step log mode: {mode}. Available: {', '.join(LOG_MODES)}")
+        self.level = LOG_MODES[mode]
+    
+    def is_enabled(self, level: int) -> bool:
+        """
+        Проверяет, сохраняются ли события уровня level.
+
+        Parameters
+        ----------
+        level : int
+            Уровень события: DEBUG, INFO или STEP.
+
+        Returns
+        -------
+        bool
+            True, если событие будет сохранено.
+        """
+        return level >= self.level
+    
+    """ Events """
+    
+    def debug(self, message: str, *args: Any) -> None:
+        """
+        Сохраняет подробное событие (только в режиме 'debug').
+
+        Parameters
+        ----------
+        message : str
+            Шаблон сообщения в стиле %-форматирования.
+        *args
+            Аргументы шаблона.
+        """
+        if DEBUG >= self.level:
+            self._add(['event', self._depth, time.perf_counter(), message, args, None, None])
+    
+    def info(self, message: str, *args: Any) -> None:
+        """
+        Сохраняет обычное событие (в режимах 'debug' и 'info').
+
+        Parameters
+        ----------
+        message : str
+            Шаблон сообщения в стиле %-форматирования.
+        *args
+            Аргументы шаблона.
+        """
+        if INFO >= self.level:
+            self._add(['event', self._depth, time.perf_counter(), message, args, None, None])
+    
+    @contextmanager
+    def step(self, message: str, *args: Any):
+        """
+        Шаг: сохраняется во всех режимах вместе со временем выполнения и признаком ошибки.
+
+        Parameters
+        ----------
+        message : str
+            Шаблон названия шага в стиле %-форматирования.
+        *args
+            Аргументы шаблона.
+        """
+        start = time.perf_counter()
+        event = ['step', self._depth, start, message, args, None, None]
+        self._events.append(event)
+        self._depth += 1
+        try:
+            yield
+        except BaseException as error:
+            event[6] = f"{type(error).__name__}"
+            raise
+        finally:
+            self._depth -= 1
+            event[5] = time.perf_counter() - start
+            if self.test_name is None and self._depth == 0:
+                self._print()
+    
+    def _add(self, event: list) -> None:
+        self._events.append(event)
+        if self.test_name is None and self._depth == 0:
+            self._print()
+    
+    """ Test boundaries """
+    
+    def start_test(self, test_name: str) -> None:
+        """
+        Начинает буферизацию событий теста; события, накопленные вне теста, выводятся.
+
+        Parameters
+        ----------
+        test_name : str
+            Идентификатор теста (nodeid).
+        """
+        self._print()
+        self.test_name = test_name
+        self._origin = time.perf_counter()
+    
+    def flush(self) -> str:
+        """
+        Выводит события теста одним блоком в консоль и во вложение Allure и очищает буфер.
+
+        Returns
+        -------
+        str
+            Отформатированный журнал теста.
+        """
+        text = self.format()
+        self._events = []
+        self.test_name = None
+        if text:
+            print(text)
+            allure.attach(text, name="Step log", attachment_type=allure.attachment_type.TEXT)
+        return text
+    
+    """ Format """
+    
+    def format(self) -> str:
+        """
+        Форматирует накопленные события: смещение от начала теста, вложенность, сообщение и время шага.
+
+        Returns
+        -------
+        str
+            Журнал, по строке на событие.
+        """
+        lines = []
+        for kind, depth, start, message, args, elapsed, error in self._events:
+            text = message % args if args else message
+            offset = (start - self._origin) * 1000
+            if kind == 'step':
+                duration = f"{elapsed * 1000:.1f} ms" if elapsed is not None else "running"
+                status = f" FAILED ({error})" if error else ""
+                lines.append(f"{offset:10.1f} ms {'  ' * depth}> {text} [{duration}]{status}")
+            else:
+                lines.append(f"{offset:10.1f} ms {'  ' * depth}  {text}")
+        return "\n".join(lines)
+    
+    def _print(self) -> None:
+        if self._events:
+            print(self.format())
+            self._events = []
+
+
+# Общий журнал шагов процесса (воркера xdist), режим задается переменной окружения CELLLIST_STEP_LOG
+step_log = StepLogger(os.environ.get('CELLLIST_STEP_LOG', 'info'))
@@ -0,0 +1,274 @@
+import json
+import os
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from base.file_lock import file_lock
+from base.metrics import percentile
+
+# Таймауты get_element по умолчанию для типов ожидания, секунды (прежние значения)
+DEFAULT_WAIT_TIMEOUTS = {'clickable': 60.0, 'visible': 15.0, 'located': 60.0, 'invisibility': 60.0}
+
+# Режимы адаптивных таймаутов: 'off' - не используются, 'record' - только накапливать историю ожиданий,
+# 'on' - накапливать историю и выбирать таймауты по ней
+ADAPTIVE_MODES = ('off', 'record', 'on')
+
+# Файл истории ожиданий по локаторам, задается переменной окружения CELLLIST_TIMEOUT_HISTORY
+DEFAULT_HISTORY_PATH = os.environ.get('CELLLIST_TIMEOUT_HISTORY', 'timeout_history.json')
+
+
+def parse_timeouts(text: Optional[str]) -> Dict[str, float]:
+    """
+    Разбирает таймауты типов ожидания из строки вида "clickable=10,visible=5".
+
+    Parameters
+    ----------
+    text : str or None
+        Строка с таймаутами.
+
+    Returns
+    -------
+    dict
+        Тип ожидания -> таймаут в секундах.
+
+    Raises
+    ------
+    ValueError
+        Если тип ожидания неизвестен или значение не число.
+    """
+    timeouts = {}
+    for item in (text or '').split(','):
+        if not item.strip():
+            continue
+        wait_type, _, value = item.partition('=')
+        wait_type = wait_type.strip()
+        if wait_type not in DEFAULT_WAIT_TIMEOUTS:
+            raise ValueError(f"Unsupported wait type in timeouts: {wait_type}. "
+                             f"Available: {', '.join(DEFAULT_WAIT_TIMEOUTS)}")
+        timeouts[wait_type] = float(value)
+    return timeouts
+
+
+class TimeoutPolicy:
+    """
+    Политика таймаутов get_element.
+
+    Таймаут выбирается в порядке: ключ "timeout" локатора (число или словарь по типам ожидания),
+    адаптивный таймаут по истории ожиданий локатора (режим 'on'), таймаут типа ожидания по умолчанию.
+    Адаптивный таймаут - p99 успешных ожиданий локатора из прошлых прогонов, умноженный на multiplier,
+    не меньше min_timeout и не больше таймаута по умолчанию, поэтому сломанный локатор падает быстро,
+    а стабильный сохраняет запас. История хранится в JSON-файле по ключу "тип ожидания|xpath".
+    Интервал опроса WebDriverWait задается poll_frequency или ключом "poll" локатора.
+    """
+    
+    def __init__(self, defaults: Optional[Dict[str, float]] = None, poll_frequency: float = 0.5,
+                 adaptive: str = 'off', multiplier: float = 3.0, min_timeout: float = 2.0, min_samples: int = 5,
+                 max_samples: int = 200) -> None:
+        """
+        Инициализирует политику.
+
+        Parameters
+        ----------
+        defaults : dict, optional
+            Таймауты типов ожидания, дополняющие DEFAULT_WAIT_TIMEOUTS.
+        poll_frequency : float, optional
+            Интервал опроса WebDriverWait в секундах. По умолчанию 0.5.
+        adaptive : str, optional
+            Режим адаптивных таймаутов из ADAPTIVE_MODES. По умолчанию 'off'.
+        multiplier : float, optional
+            Множитель p99 для адаптивного таймаута. По умолчанию 3.0.
+        min_timeout : float, optional
+            Нижняя граница адаптивного таймаута в секундах. По умолчанию 2.0.
+        min_samples : int, optional
+            Сколько ожиданий локатора нужно в истории, чтобы использовать адаптивный таймаут. По умолчанию 5.
+        max_samples : int, optional
+            Сколько последних ожиданий локатора хранится в истории. По умолчанию 200.
+        """
+        self.defaults = dict(DEFAULT_WAIT_TIMEOUTS, **(defaults or {}))
+        self.poll_frequency = poll_frequency
+        self.multiplier = multiplier
+        self.min_timeout = min_timeout
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.adaptive = 'off'
+        self.set_adaptive(adaptive)
+        # "тип ожидания|xpath" -> время успешных ожиданий в секундах: прошлые прогоны и текущий прогон
+        self.history: Dict[str, List[float]] = {}
+        self.recorded: Dict[str, List[float]] = defaultdict(list)
+        self.names: Dict[str, str] = {}
+        self._adaptive_cache: Dict[str, Optional[float]] = {}
+    
+    def set_adaptive(self, mode: str) -> None:
+        """
+        Переключает режим адаптивных таймаутов.
+
+        Parameters
+        ----------
+        mode : str
+            'off', 'record' или 'on'.
+        """
+        if mode not in ADAPTIVE_MODES:
+            raise ValueError(f"Unsupported adaptive timeout mode: {mode}. Available: {', '.join(ADAPTIVE_MODES)}")
+        self.adaptive = mode
+    
+    @staticmethod
+    def _key(element_info: Dict[str, Any], wait_type: str) -> str:
+        return f"{wait_type}|{element_info['xpath']}"
+    
+    """ Choose timeout """
+    
+    def timeout(self, element_info: Dict[str, Any], wait_type: str) -> float:
+        """
+        Возвращает таймаут ожидания элемента.
+
+        Parameters
+        ----------
+        element_info : dict
+            Информация о локаторе элемента; необязательный ключ "timeout" - число или словарь по типам ожидания.
+        wait_type : str
+            Тип ожидания.
+
+        Returns
+        -------
+        float
+            Таймаут в секундах.
+        """
+        override = element_info.get('timeout')
+        if isinstance(override, dict):
+            override = override.get(wait_type)
+        if override is not None:
+            return float(override)
+        
+        default = self.defaults.get(wait_type, DEFAULT_WAIT_TIMEOUTS['clickable'])
+        if self.adaptive == 'on':
+            learned = self.adaptive_timeout(element_info, wait_type)
+            if learned is not None:
+                return min(default, learned)
+        return default
+    
+    def poll(self, element_info: Dict[str, Any]) -> float:
+        """
+        Возвращает интервал опроса WebDriverWait: ключ "poll" локатора или poll_frequency.
+
+        Parameters
+        ----------
+        element_info : dict
+            Информация о локаторе элемента.
+
+        Returns
+        -------
+        float
+            Интервал опроса в секундах.
+        """
+        return float(element_info.get('poll', self.poll_frequency))
+    
+    def adaptive_timeout(self, element_info: Dict[str, Any], wait_type: str) -> Optional[float]:
+        """
+        Возвращает адаптивный таймаут по истории ожиданий локатора.
+
+        Parameters
+        ----------
+        element_info : dict
+            Информация о локаторе элемента.
+        wait_type : str
+            Тип ожидания.
+
+        Returns
+        -------
+        float or None
+            p99 * multiplier, но не меньше min_timeout; None, если в истории меньше min_samples ожиданий.
+        """
+        key = self._key(element_info, wait_type)
+        if key not in self._adaptive_cache:
+            samples = self.history.get(key, [])
+            self._adaptive_cache[key] = (max(self.min_timeout, percentile(sorted(samples), 0.99) * self.multiplier)
+                                         if len(samples) >= self.min_samples else None)
+        return self._adaptive_cache[key]
+    
+    """ Record waits """
+    
+    def record(self, element_info: Dict[str, Any], wait_type: str, elapsed: float) -> None:
+        """
+        Сохраняет время успешного ожидания локатора (в режимах 'record' и 'on').
+        Адаптивный таймаут в рамках прогона не меняется: он считается по истории прошлых прогонов.
+
+        Parameters
+        ----------
+        element_info : dict
+            Информация о локаторе элемента.
+        wait_type : str
+            Тип ожидания.
+        elapsed : float
+            Время ожидания в секундах.
+        """
+        if self.adaptive == 'off':
+            return
+        key = self._key(element_info, wait_type)
+        self.recorded[key].append(elapsed)
+        self.names[key] = element_info.get('name', '')
+    
+    """ History file """
+    
+    @staticmethod
+    def _read(path: str) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding='utf-8') as file:
+            return json.load(file).get('locators', {})
+    
+    def load(self, path: str) -> int:
+        """
+        Загружает историю ожиданий прошлых прогонов из JSON-файла.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу истории.
+
+        Returns
+        -------
+        int
+            Количество локаторов в истории.
+        """
+        for key, entry in self._read(path).items():
+            self.history[key] = list(entry['samples'])
+            self.names[key] = entry.get('name', '')
+        self._adaptive_cache.clear()
+        return len(self.history)
+    
+    def save(self, path: str) -> None:
+        """
+        Дописывает ожидания текущего прогона в JSON-файл истории (последние max_samples на локатор)
+        вместе с p99 и адаптивным таймаутом локатора. Каждый воркер xdist сохраняет историю в конце своей
+        сессии: чтение, слияние и замена файла выполняются под файловой блокировкой, чтобы воркеры не
+        затирали ожидания друг друга.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу истории.
+        """
+        with file_lock(path):
+            locators = self._read(path)
+            for key, samples in self.recorded.items():
+                entry = locators.setdefault(key, {'samples': []})
+                entry['name'] = self.names.get(key, '')
+                entry['samples'] = (entry['samples'] + [round(value, 4) for value in samples])[-self.max_samples:]
+                p99 = percentile(sorted(entry['samples']), 0.99)
+                entry['p99_s'] = round(p99, 4)
+                entry['adaptive_timeout_s'] = round(max(self.min_timeout, p99 * self.multiplier), 2)
+            
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, 'w', encoding='utf-8') as file:
+                json.dump({'multiplier': self.multiplier, 'min_timeout_s': self.min_timeout,
+                           'locators': dict(sorted(locators.items()))}, file, indent=2)
+            os.replace(temporary_path, path)
+
+
+# Общая политика таймаутов процесса (воркера xdist), настраивается переменными окружения
+# CELLLIST_WAIT_TIMEOUTS ("clickable=10,visible=5"), CELLLIST_POLL_FREQUENCY и CELLLIST_ADAPTIVE_TIMEOUTS
+timeout_policy = TimeoutPolicy(defaults=parse_timeouts(os.environ.get('CELLLIST_WAIT_TIMEOUTS')),
+                               poll_frequency=float(os.environ.get('CELLLIST_POLL_FREQUENCY', '0.5')),
+                               adaptive=os.environ.get('CELLLIST_ADAPTIVE_TIMEOUTS', 'off'))
@@ -0,0 +1,439 @@
+import json
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:  # psutil не обязателен: без него подбор числа воркеров и контроль памяти отключены
+    psutil = None
+
+from base.base_class import Base
+from base.driver_service import DriverServiceManager, service_manager
+from base.launch_profile import LaunchProfile
+from base.step_log import step_log
+
+# Файл калибровки: пиковая память и загрузка CPU браузера на типичном сценарии
+DEFAULT_CALIBRATION_PATH = os.environ.get('CELLLIST_WORKER_CALIBRATION', 'worker_calibration.json')
+
+MIB = 1024 ** 2
+
+
+def service_pid(manager: DriverServiceManager) -> Optional[int]:
+    """
+    Возвращает pid процесса chromedriver менеджера: браузеры сессий - его дочерние процессы.
+
+    Parameters
+    ----------
+    manager : DriverServiceManager
+        Менеджер сервиса chromedriver.
+
+    Returns
+    -------
+    int or None
+        pid или None, если сервис не запущен.
+    """
+    return manager.service.process.pid if manager.is_running() else None
+
+
+class ProcessTreeSampler:
+    """
+    Фоновый замер памяти (сумма RSS) и процессорного времени дерева процессов: дочерних процессов
+    root_pid (браузеры chromedriver) и, по желанию, самого root_pid и текущего процесса Python.
+    Процессорное время завершившихся процессов (закрытые вкладки) учитывается по последнему замеру.
+    """
+    
+    def __init__(self, root_pid: Callable[[], Optional[int]], interval: float = 0.2,
+                 include_root: bool = False, include_self: bool = False) -> None:
+        """
+        Инициализирует замер.
+
+        Parameters
+        ----------
+        root_pid : callable
+            Функция, возвращающая pid корня дерева (None - дерево еще не запущено).
+        interval : float, optional
+            Интервал замеров в секундах. По умолчанию 0.2.
+        include_root : bool, optional
+            Учитывать сам корневой процесс. По умолчанию False.
+        include_self : bool, optional
+            Учитывать текущий процесс Python. По умолчанию False.
+        """
+        self.root_pid = root_pid
+        self.interval = interval
+        self.include_root = include_root
+        self.include_self = include_self
+        self.rss = 0
+        self.peak_rss = 0
+        self._cpu: Dict[int, float] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._callbacks: List[Callable[[int], None]] = []
+    
+    """ Sample """
+    
+    def sample(self) -> int:
+        """
+        Выполняет замер дерева процессов.
+
+        Returns
+        -------
+        int
+            Сумма RSS процессов дерева в байтах.
+        """
+        processes = []
+        pid = self.root_pid()
+        if pid is not None:
+            try:
+                root = psutil.Process(pid)
+                processes = root.children(recursive=True) + ([root] if self.include_root else [])
+            except psutil.Error:
+                processes = []
+        if self.include_self:
+            processes.append(psutil.Process())
+        
+        rss = 0
+        for process in processes:
+            try:
+                with process.oneshot():
+                    rss += process.memory_info().rss
+                    times = process.cpu_times()
+                    self._cpu[process.pid] = times.user + times.system
+            except psutil.Error:
+                continue
+        self.rss = rss
+        self.peak_rss = max(self.peak_rss, rss)
+        for callback in self._callbacks:
+            callback(rss)
+        return rss
+    
+    @property
+    def cpu_seconds(self) -> float:
+        return sum(self._cpu.values())
+    
+    def on_sample(self, callback: Callable[[int], None]) -> None:
+        self._callbacks.append(callback)
+    
+    """ Background thread """
+    
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='process-tree-sampler', daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.sample()
+    
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+
+class WorkerBudget:
+    """
+    Подбор числа воркеров xdist по ресурсам машины.
+
+    Калибровка запускает браузер через Base.get_driver, выполняет типичный сценарий CellList и замеряет
+    пиковую память (RSS) и среднюю загрузку CPU дерева процессов браузера. Число воркеров - меньшее из:
+    сколько воркеров (браузеры пула и процесс Python) помещается в memory_fraction свободной памяти
+    и сколько помещается на ядрах при измеренной загрузке CPU. Калибровка сохраняется в файл
+    и повторно используется на той же машине с тем же профилем запуска.
+    """
+    
+    def __init__(self, enabled: bool = False, memory_fraction: float = 0.8, min_cpu_per_worker: float = 0.5,
+                 python_cpu: float = 0.1) -> None:
+        """
+        Инициализирует подбор.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Подбирать число воркеров для -n auto и контролировать память воркеров. По умолчанию False.
+        memory_fraction : float, optional
+            Доля свободной памяти, которую могут занять воркеры. По умолчанию 0.8.
+        min_cpu_per_worker : float, optional
+            Нижняя граница загрузки CPU на воркер в ядрах. По умолчанию 0.5.
+        python_cpu : float, optional
+            Загрузка CPU процессом Python воркера в ядрах. По умолчанию 0.1.
+        """
+        self.enabled = enabled
+        self.memory_fraction = memory_fraction
+        self.min_cpu_per_worker = min_cpu_per_worker
+        self.python_cpu = python_cpu
+        self.calibration: Optional[Dict[str, Any]] = None
+        # Выбранное число воркеров с пояснением для заголовка прогона
+        self.decision: Optional[str] = None
+    
+    @staticmethod
+    def available() -> bool:
+        return psutil is not None
+    
+    """ Calibrate """
+    
+    def calibrate(self, profile: LaunchProfile, flow: Callable[[Base], None],
+                  manager: Optional[DriverServiceManager] = None) -> Dict[str, Any]:
+        """
+        Запускает браузер, выполняет сценарий и замеряет ресурсы дерева процессов браузера.
+        Сервис chromedriver останавливается после калибровки.
+
+        Parameters
+        ----------
+        profile : LaunchProfile
+            Профиль запуска браузера.
+        flow : callable
+            Типичный сценарий: принимает экземпляр Base с запущенным браузером.
+        manager : DriverServiceManager, optional
+            Менеджер сервиса chromedriver. По умолчанию общий менеджер процесса.
+
+        Returns
+        -------
+        dict
+            Пиковая память браузера и процесса Python в МиБ, средняя и пиковая загрузка CPU браузера в ядрах,
+            длительность сценария и параметры машины.
+        """
+        manager = manager or service_manager
+        with step_log.step("Calibrate worker resources with launch profile '%s'", profile.name):
+            base = Base.get_driver(manager, profile)
+            sampler = ProcessTreeSampler(lambda: service_pid(manager))
+            peak_cpu = 0.0
+            
+            def track_cpu(_: int) -> None:
+                nonlocal peak_cpu, last
+                now, cpu = time.perf_counter(), sampler.cpu_seconds
+                if now - last[0] >= 1.0:
+                    peak_cpu = max(peak_cpu, (cpu - last[1]) / (now - last[0]))
+                    last = (now, cpu)
+            
+            sampler.sample()
+            cpu_start, start = sampler.cpu_seconds, time.perf_counter()
+            last = (start, cpu_start)
+            sampler.on_sample(track_cpu)
+            sampler.start()
+            try:
+                flow(base)
+            finally:
+                sampler.stop()
+                elapsed = time.perf_counter() - start
+                base.test_finish()
+                manager.stop()
+        
+        cpu_cores = (sampler.cpu_seconds - cpu_start) / elapsed if elapsed else 0.0
+        self.calibration = {
+            'host': socket.gethostname(),
+            'profile': profile.name,
+            'cpu_count': psutil.cpu_count(),
+            'total_memory_mb': round(psutil.virtual_memory().total / MIB),
+            'browser_peak_rss_mb': round(sampler.peak_rss / MIB, 1),
+            'python_rss_mb': round(psutil.Process().memory_info().rss / MIB, 1),
+            'browser_cpu_cores': round(cpu_cores, 2),
+            'browser_peak_cpu_cores': round(max(peak_cpu, cpu_cores), 2),
+            'flow_seconds': round(elapsed, 2),
+            'calibrated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        step_log.info("Calibration: browser peak %s MiB, %s cores average (%s peak) over %s s",
+                      self.calibration['browser_peak_rss_mb'], self.calibration['browser_cpu_cores'],
+                      self.calibration['browser_peak_cpu_cores'], self.calibration['flow_seconds'])
+        return self.calibration
+    
+    """ Choose worker count """
+    
+    def choose(self, browsers_per_worker: int = 1, max_workers: Optional[int] = None) -> Tuple[int, str]:
+        """
+        Выбирает число воркеров по калибровке, свободной памяти и числу ядер.
+
+        Parameters
+        ----------
+        browsers_per_worker : int, optional
+            Сколько браузеров одновременно держит воркер (размер пула). По умолчанию 1.
+        max_workers : int, optional
+            Верхняя граница числа воркеров.
+
+        Returns
+        -------
+        tuple
+            Число воркеров и пояснение выбора.
+        """
+        calibration = self.calibration
+        worker_mb = calibration['browser_peak_rss_mb'] * max(1, browsers_per_worker) + calibration['python_rss_mb']
+        free_mb = psutil.virtual_memory().available / MIB
+        by_memory = int(free_mb * self.memory_fraction // worker_mb)
+        
+        cores = psutil.cpu_count() or os.cpu_count() or 1
+        worker_cpu = max(self.min_cpu_per_worker, calibration['browser_cpu_cores'] + self.python_cpu)
+        by_cpu = int(cores // worker_cpu)
+        
+        count = max(1, min(by_memory, by_cpu, max_workers or by_cpu))
+        reason = (f"memory allows {by_memory} ({free_mb / 1024:.1f} GiB free, {worker_mb:.0f} MiB per worker), "
+                  f"CPU allows {by_cpu} ({cores} cores, {worker_cpu:.2f} cores per worker)")
+        return count, reason
+    
+    def min_free_mb(self) -> float:
+        """
+        Порог свободной памяти, ниже которого воркеры предупреждают и приостанавливаются:
+        полтора пиковых объема браузера по калибровке (запас на запуск еще одного браузера), без калибровки 1 ГиБ.
+
+        Returns
+        -------
+        float
+            Порог в МиБ.
+        """
+        if self.calibration is None:
+            return 1024.0
+        return self.calibration['browser_peak_rss_mb'] * 1.5
+    
+    """ Calibration file """
+    
+    def load(self, path: str, profile: LaunchProfile) -> bool:
+        """
+        Загружает калибровку из файла, если она сделана на этой машине с тем же профилем запуска.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу калибровки.
+        profile : LaunchProfile
+            Профиль запуска браузера.
+
+        Returns
+        -------
+        bool
+            True, если калибровка загружена.
+        """
+        if not os.path.exists(path):
+            return False
+        with open(path, encoding='utf-8') as file:
+            calibration = json.load(file)
+        if (calibration.get('host') != socket.gethostname() or calibration.get('profile') != profile.name
+                or calibration.get('cpu_count') != psutil.cpu_count()):
+            return False
+        self.calibration = calibration
+        return True
+    
+    def save(self, path: str) -> None:
+        """
+        Записывает калибровку в JSON-файл.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу калибровки.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.calibration, file, indent=2)
+
+
+class ResourceMonitor:
+    """
+    Контроль памяти воркера во время прогона: фоновый замер памяти браузеров воркера (дерево процессов
+    его chromedriver) и процесса Python, и свободной памяти машины. Если свободной памяти меньше порога,
+    перед очередным тестом выдается предупреждение, и воркер ждет освобождения памяти до throttle_timeout
+    секунд, не запуская новых загрузок страниц, пока другие воркеры завершают свои тесты.
+    """
+    
+    def __init__(self, interval: float = 1.0, min_free_mb: float = 1024.0, throttle_timeout: float = 60.0) -> None:
+        """
+        Инициализирует контроль.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Интервал фоновых замеров в секундах. По умолчанию 1.0.
+        min_free_mb : float, optional
+            Порог свободной памяти машины в МиБ. По умолчанию 1024.
+        throttle_timeout : float, optional
+            Сколько секунд воркер ждет освобождения памяти перед тестом; 0 - только предупреждать.
+            По умолчанию 60.
+        """
+        self.interval = interval
+        self.min_free_mb = min_free_mb
+        self.throttle_timeout = throttle_timeout
+        self.sampler: Optional[ProcessTreeSampler] = None
+        self.min_seen_free_mb: Optional[float] = None
+        self.pressure_tests = 0
+        self.throttled_seconds = 0.0
+    
+    """ Start and stop """
+    
+    def start(self, manager: Optional[DriverServiceManager] = None) -> None:
+        """
+        Запускает фоновый замер памяти воркера.
+
+        Parameters
+        ----------
+        manager : DriverServiceManager, optional
+            Менеджер сервиса chromedriver воркера. По умолчанию общий менеджер процесса.
+        """
+        manager = manager or service_manager
+        self.sampler = ProcessTreeSampler(lambda: service_pid(manager), interval=self.interval,
+                                          include_root=True, include_self=True)
+        self.sampler.on_sample(lambda _: self.free_mb())
+        self.sampler.start()
+    
+    def stop(self) -> None:
+        if self.sampler is not None:
+            self.sampler.stop()
+    
+    """ Memory pressure """
+    
+    def free_mb(self) -> float:
+        """
+        Возвращает свободную память машины и обновляет ее минимум за прогон.
+
+        Returns
+        -------
+        float
+            Свободная память в МиБ.
+        """
+        free = psutil.virtual_memory().available / MIB
+        self.min_seen_free_mb = free if self.min_seen_free_mb is None else min(self.min_seen_free_mb, free)
+        return free
+    
+    def throttle(self) -> Optional[float]:
+        """
+        Проверяет свободную память перед тестом и при ее нехватке ждет освобождения до throttle_timeout.
+
+        Returns
+        -------
+        float or None
+            Свободная память в МиБ, если был недостаток памяти; None - памяти достаточно.
+        """
+        free = self.free_mb()
+        if free >= self.min_free_mb:
+            return None
+        self.pressure_tests += 1
+        start = time.perf_counter()
+        deadline = start + self.throttle_timeout
+        while free < self.min_free_mb and time.perf_counter() < deadline:
+            time.sleep(1.0)
+            free = self.free_mb()
+        self.throttled_seconds += time.perf_counter() - start
+        return free
+    
+    def summary(self) -> str:
+        """
+        Сводка памяти воркера за прогон.
+
+        Returns
+        -------
+        str
+            Пиковая память воркера, минимум свободной памяти, тесты под нехваткой памяти и время ожидания.
+        """
+        worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        peak = self.sampler.peak_rss / MIB if self.sampler is not None else 0.0
+        free = f"{self.min_seen_free_mb:.0f} MiB" if self.min_seen_free_mb is not None else "n/a"
+        return (f"Worker {worker} memory: peak {peak:.0f} MiB, min free {free} (threshold {self.min_free_mb:.0f} MiB), "
+                f"{self.pressure_tests} tests under memory pressure, throttled {self.throttled_seconds:.1f} s")
+
+
+# Общие подбор числа воркеров и контроль памяти процесса, включаются переменной окружения CELLLIST_WORKER_BUDGET=1
+worker_budget = WorkerBudget(enabled=os.environ.get('CELLLIST_WORKER_BUDGET') == '1')
+resource_monitor = ResourceMonitor()
@@ -1,15 +1,63 @@
+import math
 import time
-import allure
+from typing import Any, Dict, Iterable, List, Optional, Union
+from selenium.common import NoSuchElementException, TimeoutException, WebDriverException
 from base.base_class import Base
+from base.metrics import timed
+from base.profile_template import profile_template
+from base.request_filter import RequestFilterProfile
+from base.contact_factory import ContactRecord
+from base.scripts import (CREATE_CONTACTS_SCRIPT, GENERATE_CONTACTS_SCRIPT, RESET_PAGE_SCRIPT, SCROLL_TO_END_SCRIPT,
+                          SCROLL_TO_TOP_SCRIPT, SNAPSHOT_CONTACTS_SCRIPT)
+from base.step_log import step_log
+from pages.contact_snapshot import ContactSnapshot
+
+# Поля формы контакта в порядке заполнения
+CONTACT_FIELDS = ('first_name', 'last_name', 'category', 'birthday', 'address')
+
+# Профиль блокировки запросов для CellList: тестам нужен только модуль GWT (nocache/cache.js, фрагменты deferredjs)
+# и стили; изображения, шрифты и аналитика не влияют на работу списка и формы
+CELL_LIST_REQUEST_PROFILE = RequestFilterProfile(
+    'cell_list',
+    deny=('*.png', '*.gif', '*.jpg', '*.jpeg', '*.svg', '*.ico', '*.woff', '*.woff2', '*.ttf',
+          '*google-analytics.com/*', '*googletagmanager.com/*', '*doubleclick.net/*',
+          '*fonts.googleapis.com/*', '*fonts.gstatic.com/*'),
+    allow=('*.nocache.js', '*.cache.js', '*/deferredjs/*', '*.css', '*/Showcase.html*'),
+)
 
 
 class CellList(Base):
+    # Адрес страницы в GWT Showcase
+    live_url = 'https://samples.gwtproject.org/samples/Showcase/Showcase.html#!CwCellList'
+    # Адрес локальной копии страницы (resource/cell_list); если задан, используется вместо live_url
+    local_url: Optional[str] = None
+    # Сколько мс список должен не меняться, чтобы считать подгрузку завершенной, если цель прокрутки неизвестна
+    scroll_settle_ms: int = 100
+    # Счетчик начального состояния страницы: первая страница из 30 карточек, всего 250 контактов
+    initial_counter: str = "0 - 30 : 250"
+    # Блокировка запросов при открытии страницы (--request-filter)
+    request_profile = CELL_LIST_REQUEST_PROFILE
+    
     def __init__(self, driver):
         super().__init__(driver)
         self.driver = driver
-        self.url = 'https://samples.gwtproject.org/samples/Showcase/Showcase.html#!CwCellList'
+        self.url = self.local_url or self.live_url
+    
+    """ Switch to local replica """
+    
+    @classmethod
+    def use_local_replica(cls, base_url: Optional[str]) -> None:
+        """
+        Переключает страницу на локальную копию CellList или обратно на GWT Showcase.
+
+        Parameters
+        ----------
+        base_url : str or None
+            Базовый адрес сервера с локальной копией (LocalPageServer.url). None - вернуться к GWT Showcase.
+        """
+        cls.local_url = f"{base_url}/Showcase.html#!CwCellList" if base_url else None
     
-    # Locators
+    # Locators ("mutates_dom": клик перестраивает DOM и очищает кэш элементов)
     first_name_input = {
         "xpath": "(//input[@class='gwt-TextBox'])[1]",
         "name": 'First Name field'
@@ -32,15 +80,18 @@ class CellList(Base):
     }
     update_contact_button = {
         "xpath": "//button[@class='gwt-Button' and text()='Update Contact']",
-        "name": 'Update Contact button'
+        "name": 'Update Contact button',
+        "mutates_dom": True
     }
     create_contact_button = {
         "xpath": "//button[@class='gwt-Button' and text()='Create Contact']",
-        "name": 'Create Contact button'
+        "name": 'Create Contact button',
+        "mutates_dom": True
     }
     generate_50_contacts_button = {
         "xpath": "//button[@class='gwt-Button' and text()='Generate 50 Contacts']",
-        "name": 'Generate 50 Contacts button'
+        "name": 'Generate 50 Contacts button',
+        "mutates_dom": True
     }
     contact_counter_text = {
         "xpath": "(//div[@class='gwt-HTML'])[2]",
@@ -52,7 +103,8 @@ class CellList(Base):
     }
     first_contact_card = {
         "xpath": "//div[@__idx='0']",
-        "name": 'First contact card'
+        "name": 'First contact card',
+        "mutates_dom": True
     }
     first_contact_names = {
         "xpath": "(//td[@style='font-size:95%;'])[1]",
@@ -64,7 +116,8 @@ class CellList(Base):
     }
     new_contact_card = {
         "xpath": "//div[@__idx='250']",
-        "name": 'New contact card'
+        "name": 'New contact card',
+        "mutates_dom": True
     }
     new_contact_names = {
         "xpath": "(//td[@style='font-size:95%;'])[251]",
@@ -78,23 +131,344 @@ class CellList(Base):
     # Methods
     """ Open page """
     
+    @timed('open_page')
     def open_page(self) -> None:
         """
-        Открывает страницу CellList.
+        Открывает страницу CellList. С page_reset_enabled уже открытая страница сбрасывается
+        без перезагрузки (reset_page), при неудачном сбросе выполняется полная навигация.
+        Навигация блокирует запросы по request_profile, если включен фильтр запросов (Base.navigate).
+        """
+        if self.page_reset_enabled and self.reset_page():
+            return
+        with step_log.step("Open CellList page: %s", self.url):
+            self.invalidate_element_cache()
+            # Профиль с фиксированным размером окна не требует разворачивания окна
+            profile = getattr(self.driver, 'launch_profile', None)
+            if profile is None or profile.maximize:
+                self.driver.maximize_window()
+            
+            start = time.perf_counter()
+            self.navigate(self.url, ready=self.wait_initial_state)
+            if profile is not None and not self.driver.navigated:
+                elapsed = time.perf_counter() - start
+                profile.record_first_navigation(elapsed)
+                if profile_template.enabled:
+                    profile_template.record_first_render(self.driver, elapsed)
+                self.driver.navigated = True
+            if self.page_reset_enabled:
+                self.record_reset_baseline()
+    
+    def wait_initial_state(self) -> None:
+        """
+        Проверяет начальное состояние страницы: счетчик initial_counter и видимая первая карточка.
+
+        Raises
+        ------
+        AssertionError
+            Если счетчик не совпадает или первая карточка не видна.
+        """
+        self.flexible_assert_word(self.contact_counter_text, self.initial_counter)
+        assert self.get_element(self.first_contact_card, wait_type='visible')['element'] is not None, \
+            f"Element '{self.first_contact_card['name']}' is not visible"
+    
+    """ Reset page without reload """
+    
+    def record_reset_baseline(self) -> None:
+        """
+        Сохраняет в драйвере отрисованные карточки только что загруженной страницы (данные и атрибут class,
+        по которому видно выделение): эталон, с которым reset_page сравнивает страницу после сброса.
+        """
+        columns = self.driver.execute_script(SNAPSHOT_CONTACTS_SCRIPT, self.contact_list['xpath'])
+        self.driver.reset_baseline = {'url': self.url, 'cards': columns} if columns is not None else None
+    
+    @staticmethod
+    def _card_rows(columns: Dict[str, List[Any]]) -> List[tuple]:
+        # Столбцы карточек (SNAPSHOT_CONTACTS_SCRIPT) -> строки (__idx, имя, адрес, class) для сравнения
+        return list(zip(columns['idx'], columns['names'], columns['addresses'], columns['classes']))
+    
+    @timed('reset_page')
+    def reset_page(self) -> bool:
+        """
+        Сбрасывает уже открытую страницу CellList к начальному состоянию без перезагрузки одной командой
+        execute_script: данные списка и выделение (если страница предоставляет window.cellListDemo.reset,
+        как локальная копия), пустая форма и прокрутка списка в начало. Сброс проверяется по счетчику
+        initial_counter, первой карточке и по отрисованным карточкам: их имена, адреса и выделение должны
+        совпасть с эталоном первой загрузки страницы (record_reset_baseline). Без хука сброса измененные,
+        созданные или выделенные тестом контакты не совпадают с эталоном, и страница загружается заново.
+
+        Returns
+        -------
+        bool
+            True, если страница сброшена и проверка пройдена; False - нужна полная навигация
+            (открыта другая страница, нет эталона, данные или выделение изменены тестом).
+        """
+        baseline = self.driver.reset_baseline
+        if baseline is None or baseline['url'] != self.url:
+            step_log.info("Page reset skipped: no baseline of the first page load")
+            return False
+        with step_log.step("Reset CellList page in place"):
+            fields = [locator['xpath'] for locator in self.contact_form_fields().values()]
+            try:
+                result = self.driver.execute_script(RESET_PAGE_SCRIPT, self.url, fields, self.contact_list['xpath'],
+                                                    self.contact_counter_text['xpath'],
+                                                    self.first_contact_card['xpath'])
+            except WebDriverException as error:
+                result = {'reset': False, 'reason': f"{type(error).__name__}: {error}"}
+            self.invalidate_element_cache()
+            
+            if not result['reset']:
+                step_log.info("Page reset skipped: %s", result['reason'])
+                return False
+            if result['counter'] != self.initial_counter or not result['first_card'] or result['scroll_top']:
+                step_log.info("Page reset verification failed (counter '%s', first card %s, scrollTop %s), "
+                              "falling back to navigation", result['counter'], result['first_card'],
+                              result['scroll_top'])
+                return False
+            current, expected = self._card_rows(result['cards']), self._card_rows(baseline['cards'])
+            if current != expected:
+                changed = sum(1 for card, card_baseline in zip(current, expected) if card != card_baseline)
+                changed += abs(len(current) - len(expected))
+                step_log.info("Page reset verification failed: %s of %s cards differ from the first page load "
+                              "(data or selection changed), falling back to navigation", changed,
+                              len(current))
+                return False
+            step_log.info("Page reset in place (reset hook: %s), counter '%s'", result['hook'], result['counter'])
+            return True
+    
+    """ Fill contact form """
+    
+    def contact_form_fields(self) -> Dict[str, Dict[str, str]]:
+        """
+        Возвращает словари локаторов полей формы контакта по ключам CONTACT_FIELDS.
+
+        Returns
+        -------
+        dict
+            Ключ поля контакта -> словарь с информацией о поле.
+        """
+        return {
+            'first_name': self.first_name_input,
+            'last_name': self.last_name_input,
+            'category': self.category_select,
+            'birthday': self.birthday_input,
+            'address': self.address_input,
+        }
+    
+    @timed('fill_contact')
+    def fill_contact(self, contact: Dict[str, str], mode: str = 'batched', clear: bool = False) -> Dict[str, str]:
+        """
+        Заполняет форму контакта и возвращает значения, оказавшиеся в полях.
+
+        Parameters
+        ----------
+        contact : dict
+            Данные контакта по ключам CONTACT_FIELDS; отсутствующие ключи и None пропускаются.
+        mode : str, optional
+            'batched' - все поля одной командой execute_script с генерацией событий GWT;
+            'keyboard' - ввод с клавиатуры по одному полю, как в input_in_field. По умолчанию 'batched'.
+        clear : bool, optional
+            Только для 'keyboard': очищать поля перед вводом (для редактирования контакта). По умолчанию False.
+
+        Returns
+        -------
+        dict
+            Значения полей формы после заполнения по ключам контакта (для категории - текст опции);
+            пустой словарь, если у контакта нет заполняемых полей.
+        """
+        locators = self.contact_form_fields()
+        keys = [key for key in CONTACT_FIELDS if contact.get(key) is not None]
+        if mode not in ('batched', 'keyboard'):
+            raise ValueError(f"Unsupported fill mode: {mode}")
+        if not keys:
+            # Нечего заполнять: форма не трогается
+            step_log.info("Contact has no fields to fill: %s", contact)
+            return {}
+        
+        with step_log.step("Fill contact form (%s)", mode):
+            if mode == 'batched':
+                # Дожидаемся формы один раз, затем заполняем все поля одной командой
+                self.get_element(locators[keys[0]])
+                values = self.fill_fields([(locators[key], contact[key]) for key in keys],
+                                          press_enter=[self.birthday_input])
+            else:
+                for key in keys:
+                    if key == 'category':
+                        self.select_option(locators[key], contact[key], by='text')
+                    elif clear:
+                        self.backspace_all_and_input(locators[key], contact[key], press_enter=key == 'birthday')
+                    else:
+                        self.input_in_field(locators[key], contact[key], press_enter=key == 'birthday')
+                values = self.read_fields([locators[key] for key in keys])
+            
+            step_log.info("Filled contact form (%s): %s", mode, values)
+            return {key: values[locators[key]['name']] for key in keys}
+    
+    """ Create contacts in bulk """
+    
+    @timed('create_contacts')
+    def create_contacts(self, records: Iterable[Union[ContactRecord, Dict[str, str]]], chunk_size: int = 200,
+                        verify: bool = True, record_timeout: float = 5) -> Dict[str, Any]:
+        """
+        Создает пакет контактов: каждый фрагмент из chunk_size записей заполняется и создается внутри браузера
+        одной командой execute_async_script. После создания весь пакет проверяется одной прокруткой до конца
+        списка (счетчик "0 - N : N") и одним снимком карточек.
+
+        Parameters
+        ----------
+        records : iterable
+            Записи ContactRecord или словари по ключам CONTACT_FIELDS (None и отсутствующие ключи пропускаются).
+        chunk_size : int, optional
+            Количество записей на одну команду. По умолчанию 200.
+        verify : bool, optional
+            Проверять счетчик и наличие всех карточек пакета. По умолчанию True.
+        record_timeout : float, optional
+            Таймаут увеличения счетчика после создания одной записи в секундах. По умолчанию 5.
+
+        Returns
+        -------
+        dict
+            Статистика: created - создано контактов, total - итоговое количество, round_trips - команд
+            execute_async_script, elapsed_ms - время создания в мс, contacts_per_second - скорость создания,
+            verify_ms - время проверки в мс (при verify).
+
+        Raises
+        ------
+        NoSuchElementException
+            Если поле формы, кнопка или счетчик не найдены.
+        TimeoutException
+            Если счетчик не увеличился после создания записи (например, запись без даты рождения).
+        AssertionError
+            Если после создания счетчик или карточки списка не соответствуют пакету.
+        """
+        contacts = [record.form() if isinstance(record, ContactRecord) else record for record in records]
+        locators = self.contact_form_fields()
+        fields = [{'name': locators[key]['name'], 'xpath': locators[key]['xpath'], 'enter': key == 'birthday'}
+                  for key in CONTACT_FIELDS]
+        rows = [[contact.get(key) for key in CONTACT_FIELDS] for contact in contacts]
+        stats: Dict[str, Any] = {'created': 0, 'total': None, 'round_trips': 0, 'elapsed_ms': 0.0}
+        
+        with step_log.step("Create %s contacts in chunks of %s", len(rows), chunk_size):
+            # Дожидаемся формы один раз, затем создаем фрагменты без ожиданий на стороне Python
+            self.get_element(locators[CONTACT_FIELDS[0]])
+            for offset in range(0, len(rows), chunk_size):
+                chunk = rows[offset:offset + chunk_size]
+                result = self.run_async_script(
+                    CREATE_CONTACTS_SCRIPT, fields, chunk, self.create_contact_button['xpath'],
+                    self.contact_counter_text['xpath'], int(record_timeout * 1000),
+                    timeout=len(chunk) * record_timeout)
+                stats['round_trips'] += 1
+                stats['created'] += result['created']
+                stats['elapsed_ms'] += result.get('elapsed_ms', 0.0)
+                stats['total'] = result.get('total')
+                
+                if 'error' in result:
+                    raise NoSuchElementException(result['error'])
+                if not result['ok']:
+                    raise TimeoutException(f"Contact {offset + result['created']} was not created: {result}")
+            # Список перестроен: ранее найденные элементы устарели
+            self.invalidate_element_cache()
+            
+            seconds = stats['elapsed_ms'] / 1000
+            stats['contacts_per_second'] = round(stats['created'] / seconds, 1) if seconds else None
+            step_log.info("Created %s contacts in %.0f ms (%s contacts/s, %s round trips), total %s",
+                          stats['created'], stats['elapsed_ms'], stats['contacts_per_second'],
+                          stats['round_trips'], stats['total'])
+            
+            if verify and contacts:
+                start = time.perf_counter()
+                self.verify_created(contacts, stats['total'])
+                stats['verify_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            return stats
+    
+    def verify_created(self, contacts: List[Dict[str, str]], total: int) -> None:
+        """
+        Проверяет созданный пакет: прокрутка до конца списка, счетчик "0 - total : total" и наличие карточки
+        с именем и адресом каждого контакта пакета в одном снимке списка.
+
+        Parameters
+        ----------
+        contacts : list
+            Данные созданных контактов по ключам CONTACT_FIELDS.
+        total : int
+            Ожидаемое общее количество контактов.
+
+        Raises
+        ------
+        AssertionError
+            Если счетчик не совпадает или карточки части контактов не найдены.
+        """
+        with step_log.step("Verify %s created contacts", len(contacts)):
+            stats = self.scroll_to_end(expected_count=total)
+            expected_counter = f"0 - {total} : {total}"
+            assert stats['counter'].strip() == expected_counter, \
+                f"Unexpected counter '{stats['counter']}', expected '{expected_counter}'"
+            
+            expected = [(f"{contact.get('first_name') or ''} {contact.get('last_name') or ''}",
+                         (contact.get('address') or '').replace('\n', ' ')) for contact in contacts]
+            missing = self.snapshot_contacts().missing(expected)
+            assert not missing, f"{len(missing)} of {len(contacts)} created contacts are not in the list: {missing[:5]}"
+            step_log.info("All %s created contacts are in the list, counter '%s'", len(contacts), expected_counter)
+    
+    """ Generate contacts up to total """
+    
+    @timed('generate_contacts')
+    def generate_contacts(self, total: int, click_timeout: float = 10) -> Dict[str, Any]:
+        """
+        Нажимает "Generate 50 Contacts" внутри браузера одной командой execute_async_script, пока общее
+        количество контактов в счетчике не достигнет total, и замеряет время от нажатия до отрисовки
+        обновленного счетчика.
+
+        Parameters
+        ----------
+        total : int
+            Целевое общее количество контактов.
+        click_timeout : float, optional
+            Таймаут обновления счетчика после одного нажатия в секундах. По умолчанию 10.
+
+        Returns
+        -------
+        dict
+            Статистика: clicks - количество нажатий, before и total - количество контактов до и после,
+            counter - текст счетчика, elapsed_ms - общее время в мс, update_ms - время от нажатия
+            до отрисовки кадра с новым текстом счетчика для каждого нажатия в мс.
+
+        Raises
+        ------
+        NoSuchElementException
+            Если кнопка или счетчик не найдены.
+        TimeoutException
+            Если счетчик не обновился после нажатия.
         """
-        with allure.step("Open CellList page"):
-            self.driver.maximize_window()
-            self.driver.get(self.url)
-            print(f"Opening CellList page: {self.url}")
+        with step_log.step("Generate contacts up to %s", total):
+            self.get_element(self.generate_50_contacts_button)
+            stats = self.run_async_script(
+                GENERATE_CONTACTS_SCRIPT, self.generate_50_contacts_button['xpath'], self.contact_counter_text['xpath'],
+                total, int(click_timeout * 1000), timeout=math.ceil(total / 50) * click_timeout)
+            self.invalidate_element_cache()
+            
+            if 'error' in stats:
+                raise NoSuchElementException(stats['error'])
+            if not stats['ok']:
+                raise TimeoutException(f"Contacts were not generated up to {total}: {stats}")
+            
+            step_log.info("Generated contacts from %s to %s: %s clicks in %.0f ms", stats['before'], stats['total'],
+                          stats['clicks'], stats['elapsed_ms'])
+            return stats
     
     """ Scroll to bottom """
     
+    @timed('scroll_to_bottom')
     def scroll_to_bottom(self) -> None:
         """
         Скроллит список контактов до самого низа, пока не будет достигнут конец списка.
+        С движком ожидания 'observer' прокрутка выполняется внутри браузера методом scroll_to_end().
         """
-        with allure.step("Scroll to the bottom of the contact list"):
-            print("Scroll to the bottom of the contact list")
+        if self.wait_engine == 'observer':
+            # Прокрутка до конца внутри браузера одной командой
+            self.scroll_to_end()
+            return
+        
+        with step_log.step("Scroll to the bottom of the contact list"):
             contact_list_element = self.get_element(self.contact_list, wait_type="visible")['element']
             last_height = self.driver.execute_script("return arguments[0].scrollHeight", contact_list_element)
             
@@ -104,32 +478,102 @@ class CellList(Base):
                 new_height = self.driver.execute_script("return arguments[0].scrollHeight", contact_list_element)
                 
                 if new_height == last_height:
-                    print("Reached the bottom of the contact list.")
-                    with allure.step("Reached the bottom of the contact list"):
-                        pass
+                    step_log.info("Reached the bottom of the contact list")
                     break
                 
                 else:
                     last_height = new_height
     
+    """ Scroll to end inside browser """
+    
+    @timed('scroll_to_end')
+    def scroll_to_end(self, expected_count: Optional[int] = None, expected_counter: Optional[str] = None,
+                      timeout: float = 60) -> Dict[str, Any]:
+        """
+        Прокручивает список контактов до конца внутри браузера одной командой execute_async_script,
+        пока не подгрузятся все карточки. По умолчанию цель - общее количество контактов из счетчика.
+
+        Parameters
+        ----------
+        expected_count : int, optional
+            Ожидаемое количество карточек __idx.
+        expected_counter : str, optional
+            Регулярное выражение ожидаемого текста счетчика, например "0 - 251 : 251".
+        timeout : float, optional
+            Таймаут в секундах. По умолчанию 60.
+
+        Returns
+        -------
+        dict
+            Статистика прокрутки: pages - количество подгрузок, count - итоговое количество карточек,
+            counter - текст счетчика, elapsed_ms - время в мс, reason - 'target' или 'settled'.
+
+        Raises
+        ------
+        TimeoutException
+            Если цель не достигнута за timeout.
+        """
+        with step_log.step("Scroll to the end of the contact list"):
+            self.get_element(self.contact_list, wait_type="visible")
+            stats = self.run_async_script(
+                SCROLL_TO_END_SCRIPT, self.contact_list['xpath'], self.contact_counter_text['xpath'],
+                expected_count, expected_counter, int(timeout * 1000), self.scroll_settle_ms, timeout=timeout)
+            
+            if 'error' in stats:
+                raise NoSuchElementException(stats['error'])
+            if not stats['ok']:
+                raise TimeoutException(f"Contact list did not reach the end in {timeout}s: {stats}")
+            
+            step_log.info("Reached the end of the contact list: %s cards, %s pages loaded in %.0f ms, counter '%s'",
+                          stats['count'], stats['pages'], stats['elapsed_ms'], stats['counter'])
+            return stats
+    
+    """ Snapshot contacts """
+    
+    @timed('snapshot_contacts')
+    def snapshot_contacts(self) -> ContactSnapshot:
+        """
+        Извлекает все отрисованные карточки списка (__idx, полное имя, адрес) одной командой execute_script.
+
+        Returns
+        -------
+        ContactSnapshot
+            Снимок карточек с индексами по __idx и по имени.
+
+        Raises
+        ------
+        NoSuchElementException
+            Если список контактов не найден.
+        """
+        with step_log.step("Snapshot contact list"):
+            columns = self.driver.execute_script(SNAPSHOT_CONTACTS_SCRIPT, self.contact_list['xpath'])
+            if columns is None:
+                raise NoSuchElementException(f"Element '{self.contact_list['name']}' is not found")
+            snapshot = ContactSnapshot(columns['idx'], columns['names'], columns['addresses'])
+            step_log.info("Snapshot contact list: %s cards", len(snapshot))
+            return snapshot
+    
     """ Scroll to top """
     
+    @timed('scroll_to_top')
     def scroll_to_top(self) -> None:
         """
         Скроллит список контактов до самого верха, пока не будет достигнут верх списка.
         """
-        with allure.step("Scroll to the bottom of the contact list"):
-            print("Scroll to the bottom of the contact list")
+        with step_log.step("Scroll to the top of the contact list"):
             contact_list_element = self.get_element(self.contact_list, wait_type="visible")['element']
             scroll_position = self.driver.execute_script("return arguments[0].scrollTop", contact_list_element)
             
             while scroll_position > 0:
-                self.driver.execute_script("arguments[0].scrollTo(0, 0);", contact_list_element)
-                time.sleep(0.1)
-                scroll_position = self.driver.execute_script("return arguments[0].scrollTop", contact_list_element)
+                if self.wait_engine == 'observer':
+                    # Прокрутка и чтение позиции одной командой, без паузы
+                    scroll_position = self.driver.execute_script(SCROLL_TO_TOP_SCRIPT, contact_list_element)
+                else:
+                    self.driver.execute_script("arguments[0].scrollTo(0, 0);", contact_list_element)
+                    time.sleep(0.1)
+                    scroll_position = self.driver.execute_script("return arguments[0].scrollTop",
+                                                                 contact_list_element)
                 
                 if scroll_position == 0:
-                    print("Reached the top of the contact list.")
-                    with allure.step("Reached the top of the contact list"):
-                        pass
+                    step_log.info("Reached the top of the contact list")
                     break
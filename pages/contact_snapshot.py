@@ -0,0 +1,132 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class ContactCard:
+    """
+    Карточка контакта из снимка списка.
+    """
+    __slots__ = ('idx', 'name', 'address')
+    
+    def __init__(self, idx: int, name: str, address: str) -> None:
+        """
+        Инициализирует карточку.
+
+        Parameters
+        ----------
+        idx : int
+            Значение атрибута __idx карточки.
+        name : str
+            Полное имя контакта.
+        address : str
+            Адрес контакта в одну строку.
+        """
+        self.idx = idx
+        self.name = name
+        self.address = address
+    
+    def __repr__(self) -> str:
+        return f"ContactCard(idx={self.idx}, name={self.name!r}, address={self.address!r})"
+
+
+class ContactSnapshot:
+    """
+    Снимок отрисованных карточек списка контактов, хранящийся столбцами (индексы, имена, адреса)
+    с индексами по __idx и по имени для проверок в памяти.
+    """
+    __slots__ = ('idx', 'names', 'addresses', '_by_idx', '_by_name')
+    
+    def __init__(self, idx: List[int], names: List[str], addresses: List[str]) -> None:
+        """
+        Инициализирует снимок из столбцов одинаковой длины.
+
+        Parameters
+        ----------
+        idx : list
+            Значения __idx карточек в порядке отображения.
+        names : list
+            Полные имена контактов.
+        addresses : list
+            Адреса контактов.
+        """
+        self.idx = idx
+        self.names = names
+        self.addresses = addresses
+        self._by_idx: Dict[int, int] = {value: position for position, value in enumerate(idx)}
+        self._by_name: Dict[str, List[int]] = {}
+        for position, name in enumerate(names):
+            self._by_name.setdefault(name, []).append(position)
+    
+    def __len__(self) -> int:
+        return len(self.idx)
+    
+    def __iter__(self) -> Iterator[ContactCard]:
+        for position in range(len(self.idx)):
+            yield self._card(position)
+    
+    def _card(self, position: int) -> ContactCard:
+        return ContactCard(self.idx[position], self.names[position], self.addresses[position])
+    
+    """ Lookup """
+    
+    def get(self, idx: int) -> Optional[ContactCard]:
+        """
+        Возвращает карточку по значению __idx.
+
+        Parameters
+        ----------
+        idx : int
+            Значение __idx.
+
+        Returns
+        -------
+        ContactCard or None
+            Карточка или None, если ее нет в снимке.
+        """
+        position = self._by_idx.get(idx)
+        return None if position is None else self._card(position)
+    
+    def find_by_name(self, name: str) -> List[ContactCard]:
+        """
+        Возвращает все карточки с указанным полным именем.
+
+        Parameters
+        ----------
+        name : str
+            Полное имя контакта.
+
+        Returns
+        -------
+        list
+            Карточки с этим именем в порядке отображения.
+        """
+        return [self._card(position) for position in self._by_name.get(name, [])]
+    
+    """ Bulk checks """
+    
+    def has_contiguous_idx(self) -> bool:
+        """
+        Проверяет, что значения __idx идут подряд от 0 без пропусков и повторов.
+
+        Returns
+        -------
+        bool
+            True, если idx == [0, 1, ..., len - 1].
+        """
+        return all(value == position for position, value in enumerate(self.idx))
+    
+    def missing(self, expected: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        Возвращает ожидаемые контакты, которых нет в снимке.
+
+        Parameters
+        ----------
+        expected : iterable
+            Пары (полное имя, адрес в одну строку).
+
+        Returns
+        -------
+        list
+            Пары, для которых не найдена карточка с таким именем и адресом.
+        """
+        return [(name, address) for name, address in expected
+                if not any(self.addresses[position] == address for position in self._by_name.get(name, []))]
@@ -0,0 +1,147 @@
+import json
+import os
+import random
+import statistics
+from typing import Dict, List, Optional, Tuple
+
+
+def bootstrap_change_interval(baseline: List[float], current: List[float], iterations: int = 2000,
+                              confidence: float = 0.95, seed: int = 0) -> Tuple[float, float]:
+    """
+    Доверительный интервал относительного изменения медианы (current / baseline - 1) методом bootstrap.
+
+    Parameters
+    ----------
+    baseline : list
+        Замеры эталонного прогона.
+    current : list
+        Замеры текущего прогона.
+    iterations : int, optional
+        Количество повторных выборок. По умолчанию 2000.
+    confidence : float, optional
+        Уровень доверия. По умолчанию 0.95.
+    seed : int, optional
+        Зерно генератора, чтобы результат сравнения был воспроизводимым. По умолчанию 0.
+
+    Returns
+    -------
+    tuple
+        Нижняя и верхняя граница относительного изменения, например (0.12, 0.30) - медленнее на 12-30%.
+    """
+    generator = random.Random(seed)
+    changes = []
+    for _ in range(iterations):
+        base_median = statistics.median(generator.choices(baseline, k=len(baseline)))
+        current_median = statistics.median(generator.choices(current, k=len(current)))
+        changes.append(current_median / base_median - 1 if base_median else 0.0)
+    changes.sort()
+    tail = (1 - confidence) / 2
+    return changes[int(tail * iterations)], changes[min(iterations - 1, int((1 - tail) * iterations))]
+
+
+class FlowSamples:
+    """
+    Замеры одного сценария по раундам: время в секундах, количество команд WebDriver и размер кучи JS в байтах.
+    """
+    
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wall: List[float] = []
+        self.commands: List[int] = []
+        self.heap: List[float] = []
+    
+    def add(self, wall: float, commands: int, heap: float) -> None:
+        self.wall.append(wall)
+        self.commands.append(commands)
+        self.heap.append(heap)
+    
+    def to_dict(self) -> Dict[str, List[float]]:
+        return {'wall': self.wall, 'commands': self.commands, 'heap': self.heap}
+    
+    def describe(self) -> str:
+        return (f"{self.name}: {len(self.wall)} rounds, wall median {statistics.median(self.wall) * 1000:.1f} ms "
+                f"(min {min(self.wall) * 1000:.1f}, max {max(self.wall) * 1000:.1f}), "
+                f"commands median {statistics.median(self.commands):.0f}, "
+                f"JS heap median {statistics.median(self.heap) / 1024 ** 2:.2f} MiB")
+
+
+class BaselineStore:
+    """
+    Эталонные замеры сценариев в JSON-файле и сравнение с ними новых прогонов.
+
+    Регрессия фиксируется, если нижняя граница доверительного интервала изменения медианы времени
+    или памяти превышает допуск, или если медиана количества команд стала больше максимума эталона
+    (количество команд не зависит от шума, поэтому любой рост - регрессия).
+    """
+    
+    def __init__(self, path: str, wall_tolerance: float = 0.10, heap_tolerance: float = 0.20) -> None:
+        """
+        Инициализирует хранилище.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу с эталонами.
+        wall_tolerance : float, optional
+            Допустимое замедление медианы времени. По умолчанию 0.10 (10%).
+        heap_tolerance : float, optional
+            Допустимый рост медианы размера кучи JS. По умолчанию 0.20 (20%).
+        """
+        self.path = path
+        self.wall_tolerance = wall_tolerance
+        self.heap_tolerance = heap_tolerance
+        self.flows: Dict[str, Dict[str, List[float]]] = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                self.flows = json.load(file).get('flows', {})
+    
+    """ Compare """
+    
+    def compare(self, samples: FlowSamples) -> Optional[List[str]]:
+        """
+        Сравнивает замеры сценария с эталоном.
+
+        Parameters
+        ----------
+        samples : FlowSamples
+            Замеры текущего прогона.
+
+        Returns
+        -------
+        list or None
+            Описания регрессий (пустой список - регрессий нет) или None, если эталона для сценария нет.
+        """
+        baseline = self.flows.get(samples.name)
+        if baseline is None:
+            return None
+        
+        regressions = []
+        low, high = bootstrap_change_interval(baseline['wall'], samples.wall)
+        if low > self.wall_tolerance:
+            regressions.append(f"wall time +{low:.0%}..+{high:.0%} (tolerance {self.wall_tolerance:.0%})")
+        if statistics.median(samples.commands) > max(baseline['commands']):
+            regressions.append(f"WebDriver commands {statistics.median(samples.commands):.0f} > "
+                               f"baseline {max(baseline['commands'])}")
+        if all(baseline['heap']) and all(samples.heap):
+            low, high = bootstrap_change_interval(baseline['heap'], samples.heap)
+            if low > self.heap_tolerance:
+                regressions.append(f"JS heap +{low:.0%}..+{high:.0%} (tolerance {self.heap_tolerance:.0%})")
+        return regressions
+    
+    """ Save """
+    
+    def save(self, results: Dict[str, FlowSamples]) -> None:
+        """
+        Записывает замеры как новый эталон. Сценарии, которых нет в results, сохраняют прежний эталон.
+
+        Parameters
+        ----------
+        results : dict
+            Имя сценария -> замеры.
+        """
+        for name, samples in results.items():
+            self.flows[name] = samples.to_dict()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as file:
+            json.dump({'flows': self.flows}, file, indent=2)
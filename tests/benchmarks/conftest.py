@@ -0,0 +1,153 @@
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import allure
+import pytest
+from base.base_class import Base
+from base.command_tracer import CommandTrace, CommandTracer
+from base.launch_profile import get_profile
+from base.step_log import step_log
+from pages.cell_list_page import CellList
+from tests.benchmarks.baseline import BaselineStore, FlowSamples
+from tests.benchmarks.scaling import ScalingTable
+
+# Профиль браузера для сценарных бенчмарков: headless, без фоновых сетевых запросов
+BENCHMARK_PROFILE = 'headless-fast'
+
+
+class CommandCounter:
+    """
+    Считает команды WebDriver, отправленные драйвером (трассировщиком CommandTracer), и время выполнения блока кода.
+    """
+    
+    # Отдельный трассировщик бенчмарков: подключается к драйверу один раз и не сбивает трассу теста в command_tracer
+    tracer = CommandTracer()
+    
+    def __init__(self, driver) -> None:
+        self.driver = driver
+        self.commands = 0
+        self.elapsed = 0.0
+        self.trace: Optional[CommandTrace] = None
+    
+    @contextmanager
+    def measure(self):
+        self.tracer.attach(self.driver)
+        self.tracer.start_test('benchmark')
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.elapsed = time.perf_counter() - start
+            self.trace = self.tracer.finish_test()
+            self.commands = self.trace.total_commands
+
+
+class BenchmarkResults:
+    """
+    Результаты замеров сессии: имя замера -> (количество команд WebDriver, время в секундах),
+    а также замеры сценариев по раундам (FlowSamples).
+    """
+    
+    def __init__(self) -> None:
+        self.results = {}
+        self.flows = {}
+    
+    def record(self, name: str, counter: CommandCounter) -> None:
+        step_log.info("%s: %s commands, %.1f ms", name, counter.commands, counter.elapsed * 1000)
+        self.results[name] = (counter.commands, counter.elapsed)
+    
+    def record_flow(self, samples: FlowSamples) -> None:
+        step_log.info("%s", samples.describe())
+        self.flows[samples.name] = samples
+    
+    def summary(self) -> str:
+        lines = [f"{name}: {commands} commands, {elapsed * 1000:.1f} ms"
+                 for name, (commands, elapsed) in sorted(self.results.items())]
+        lines += [samples.describe() for _, samples in sorted(self.flows.items())]
+        return "\n".join(["Benchmark results:"] + lines)
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    results = BenchmarkResults()
+    
+    yield results
+    
+    # Выводим сводную таблицу замеров в конце сессии
+    if results.results or results.flows:
+        step_log.info("%s", results.summary())
+
+
+@pytest.fixture
+def command_counter(base_fixture):
+    # Счетчик команд WebDriver для браузера текущего теста
+    return CommandCounter(base_fixture.driver)
+
+
+@pytest.fixture(scope="session")
+def baseline_store(request, benchmark_results):
+    # Эталонные замеры сценариев; с флагом --benchmark-save текущий прогон сохраняется как новый эталон
+    store = BaselineStore(request.config.getoption("--benchmark-baseline"),
+                          wall_tolerance=request.config.getoption("--benchmark-tolerance"))
+    
+    yield store
+    
+    if request.config.getoption("--benchmark-save") and benchmark_results.flows:
+        store.save(benchmark_results.flows)
+        step_log.info("Benchmark baseline saved to %s", store.path)
+
+
+@pytest.fixture(scope="session")
+def benchmark_browser(driver_service):
+    # Отдельный headless-браузер для сценарных бенчмарков, не зависящий от пула и --launch-profile
+    base = Base.get_driver(profile=get_profile(BENCHMARK_PROFILE))
+    
+    yield base
+    
+    base.test_finish()
+
+
+@pytest.fixture
+def benchmark_page(benchmark_browser, cell_list_server):
+    # Страница CellList всегда открывается с локальной копии, без обращения к сети
+    page = CellList(benchmark_browser.driver)
+    page.url = f"{cell_list_server.url}/Showcase.html#!CwCellList"
+    return page
+
+
+@pytest.fixture
+def benchmark_counter(benchmark_page):
+    # Счетчик команд WebDriver для браузера сценарных бенчмарков
+    return CommandCounter(benchmark_page.driver)
+
+
+def pytest_generate_tests(metafunc):
+    # Размеры стресс-замеров задаются опцией --stress-sizes
+    if "stress_size" in metafunc.fixturenames:
+        sizes = sorted({int(size) for size in metafunc.config.getoption("--stress-sizes").split(',') if size.strip()})
+        metafunc.parametrize("stress_size", sizes)
+
+
+@pytest.fixture(scope="session")
+def scaling_table(request):
+    # Таблица масштабирования списка: выводится, прикладывается к отчету и сохраняется в конце сессии
+    table = ScalingTable()
+    
+    yield table
+    
+    if table.rows:
+        path = request.config.getoption("--stress-report")
+        text = table.format(previous=ScalingTable.load(path))
+        step_log.info("%s", text)
+        allure.attach(text, name="Contact list scaling", attachment_type=allure.attachment_type.TEXT)
+        table.save(path)
+        step_log.info("Scaling table saved to %s", path)
+
+
+@pytest.fixture
+def stress_page(benchmark_browser, cell_list_server):
+    # Локальная копия без задержки подгрузки: замеряется отрисовка списка, а не искусственная задержка сервера
+    page = CellList(benchmark_browser.driver)
+    page.url = f"{cell_list_server.url}/Showcase.html?delay=0#!CwCellList"
+    return page
@@ -0,0 +1,128 @@
+import json
+import os
+from typing import Dict, Optional
+
+# Столбцы таблицы масштабирования: ключ замера -> (заголовок, единица)
+SCALING_COLUMNS = {
+    'counter_update_ms': ('counter update', 'ms'),
+    'scroll_bottom_ms': ('scroll bottom', 'ms'),
+    'scroll_top_ms': ('scroll top', 'ms'),
+    'heap_mb': ('JS heap', 'MiB'),
+}
+
+
+class ScalingTable:
+    """
+    Замеры списка контактов при разном количестве контактов и таблица масштабирования.
+    Строки хранятся по запрошенному количеству; фактическое количество - замер 'total'.
+
+    Для каждого замера кроме значения выводится коэффициент масштабирования относительно наименьшего
+    размера: (значение / значение_0) / (размер / размер_0). Около 1 - рост линейный, заметно больше 1 -
+    рост сверхлинейный. С таблицей предыдущего прогона выводится и изменение относительно нее.
+    """
+    
+    def __init__(self) -> None:
+        self.rows: Dict[int, Dict[str, float]] = {}
+    
+    def add(self, size: int, **metrics: float) -> None:
+        self.rows[size] = metrics
+    
+    def scale(self, size: int, key: str) -> Optional[float]:
+        """
+        Коэффициент масштабирования замера key для размера size относительно наименьшего размера.
+
+        Parameters
+        ----------
+        size : int
+            Количество контактов.
+        key : str
+            Ключ замера из SCALING_COLUMNS.
+
+        Returns
+        -------
+        float or None
+            Коэффициент или None, если его нельзя посчитать.
+        """
+        first = min(self.rows)
+        base_value, value = self.rows[first].get(key), self.rows[size].get(key)
+        if not base_value or value is None:
+            return None
+        # Фактическое количество контактов может быть больше запрошенного (генерация по 50)
+        return (value / base_value) / (self.rows[size].get('total', size) / self.rows[first].get('total', first))
+    
+    """ Format """
+    
+    def format(self, previous: Optional['ScalingTable'] = None) -> str:
+        """
+        Форматирует таблицу: строка на размер, для каждого замера - значение и коэффициент масштабирования.
+
+        Parameters
+        ----------
+        previous : ScalingTable, optional
+            Таблица предыдущего прогона для сравнения.
+
+        Returns
+        -------
+        str
+            Таблица масштабирования.
+        """
+        header = f"{'contacts':>8}" + "".join(f" | {title + ', ' + unit:>19} {'scale':>5}"
+                                             for title, unit in SCALING_COLUMNS.values())
+        lines = ["Contact list scaling:", header, "-" * len(header)]
+        for size in sorted(self.rows):
+            cells = []
+            for key in SCALING_COLUMNS:
+                value, scale = self.rows[size].get(key), self.scale(size, key)
+                text = f"{value:.1f}" if value is not None else "-"
+                if previous is not None and previous.rows.get(size, {}).get(key):
+                    text += f" ({value / previous.rows[size][key] - 1:+.0%})" if value is not None else ""
+                cells.append(f" | {text:>19} {scale:>5.2f}" if scale is not None else f" | {text:>19} {'-':>5}")
+            lines.append(f"{size:>8}" + "".join(cells))
+        if previous is not None:
+            lines.append("In parentheses: change against the previous run")
+        return "\n".join(lines)
+    
+    """ Load and save """
+    
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {str(size): metrics for size, metrics in sorted(self.rows.items())}
+    
+    @classmethod
+    def load(cls, path: str) -> Optional['ScalingTable']:
+        """
+        Загружает таблицу предыдущего прогона из JSON-файла.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу.
+
+        Returns
+        -------
+        ScalingTable or None
+            Таблица или None, если файла нет.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as file:
+            rows = json.load(file).get('sizes', {})
+        table = cls()
+        for size, metrics in rows.items():
+            table.add(int(size), **metrics)
+        return table
+    
+    def save(self, path: str) -> None:
+        """
+        Записывает таблицу в JSON-файл для сравнения со следующими прогонами.
+
+        Parameters
+        ----------
+        path : str
+            Путь к JSON-файлу.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'sizes': self.to_dict(),
+                       'scale': {str(size): {key: self.scale(size, key) for key in SCALING_COLUMNS}
+                                 for size in sorted(self.rows)}}, file, indent=2)
@@ -0,0 +1,42 @@
+import allure
+import pytest
+from base.base_class import CLEAR_STRATEGIES
+from pages.cell_list_page import CellList
+
+# Данные для редактирования: длинный адрес, как у Faker, чтобы была видна разница в числе команд
+edited_contact = {
+    'first_name': 'Benchmark',
+    'last_name': 'Strategy',
+    'birthday': 'March 7, 1985',
+    'address': '7788 Alexander Throughway Apt. 123\nNorth Kimberlyborough, NM 61702',
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("strategy", CLEAR_STRATEGIES)
+@allure.story("Производительность")
+@allure.feature('Очистка полей')
+@allure.description('Бенчмарк способов очистки поля на сценарии редактирования контакта (test_update_contact): '
+                    'число команд WebDriver и время редактирования четырех полей.')
+def test_clear_strategy_benchmark(base_fixture, command_counter, benchmark_results, strategy):
+    base = base_fixture  # Получаем объект base из фикстуры
+    cell_list_page = CellList(base.driver)  # Инициализация класса CellList
+    
+    # Открываем страницу и выбираем первый контакт для редактирования
+    cell_list_page.open_page()
+    cell_list_page.click_button(cell_list_page.first_contact_card)
+    fields = cell_list_page.contact_form_fields()
+    
+    # Редактируем поля выбранным способом очистки и считаем команды WebDriver
+    with command_counter.measure():
+        for key, value in edited_contact.items():
+            cell_list_page.backspace_all_and_input(fields[key], value, press_enter=key == 'birthday',
+                                                   clear_strategy=strategy)
+    benchmark_results.record(f"clear strategy '{strategy}'", command_counter)
+    
+    # Проверяем, что поля содержат только новые значения
+    values = cell_list_page.read_fields([fields[key] for key in edited_contact])
+    with allure.step(f"Assert edited values: {values}"):
+        for key, value in edited_contact.items():
+            assert values[fields[key]['name']] == value, \
+                f"Expected '{value}' in {fields[key]['name']}, but found '{values[fields[key]['name']]}'."
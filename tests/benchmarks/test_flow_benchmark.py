@@ -0,0 +1,74 @@
+import allure
+import pytest
+from base.step_log import step_log
+from tests.benchmarks.baseline import FlowSamples
+
+# Данные контакта для сценариев создания и редактирования
+benchmark_contact = {
+    'first_name': 'Benchmark',
+    'last_name': 'Flow',
+    'category': 'Coworkers',
+    'birthday': 'March 7, 1985',
+    'address': '7788 Alexander Throughway Apt. 123 North Kimberlyborough, NM 61702',
+}
+
+
+def create_flow(page):
+    page.fill_contact(benchmark_contact)
+    page.click_button(page.create_contact_button)
+    page.flexible_assert_word(page.contact_counter_text, "0 - 30 : 251")
+
+
+def update_flow(page):
+    page.click_button(page.first_contact_card)
+    page.fill_contact(benchmark_contact)
+    page.click_button(page.update_contact_button)
+    page.flexible_assert_word(page.first_contact_names, "Benchmark Flow")
+
+
+def generate_flow(page):
+    page.click_button(page.generate_50_contacts_button)
+    page.flexible_assert_word(page.contact_counter_text, "0 - 30 : 300")
+
+
+def scroll_round_trip_flow(page):
+    page.scroll_to_bottom()
+    page.flexible_assert_word(page.contact_counter_text, "0 - 250 : 250")
+    page.scroll_to_top()
+
+
+# Сценарии бенчмарка: имя -> функция, выполняющая сценарий на открытой странице
+FLOWS = {
+    'create': create_flow,
+    'update': update_flow,
+    'generate_50': generate_flow,
+    'scroll_round_trip': scroll_round_trip_flow,
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("flow", FLOWS)
+@allure.story("Производительность")
+@allure.feature('Сценарии CellList')
+@allure.description('Бенчмарк сценариев CellList на локальной копии страницы в headless-браузере: '
+                    'время, число команд WebDriver и размер кучи JS по раундам, сравнение с эталоном.')
+def test_flow_benchmark(request, benchmark_page, benchmark_counter, benchmark_results, baseline_store, flow):
+    samples = FlowSamples(flow)
+    
+    for _ in range(request.config.getoption("--benchmark-rounds")):
+        # Каждый раунд начинается с чистой страницы, открытие страницы не входит в замер
+        benchmark_page.open_page()
+        with benchmark_counter.measure():
+            FLOWS[flow](benchmark_page)
+        heap = benchmark_page.browser_metrics(collect_garbage=True)['JSHeapUsedSize']
+        samples.add(benchmark_counter.elapsed, benchmark_counter.commands, heap)
+    
+    benchmark_results.record_flow(samples)
+    
+    # Сравниваем с эталоном: без эталона замеры только сохраняются (--benchmark-save)
+    regressions = baseline_store.compare(samples)
+    with step_log.step("Compare '%s' with baseline: %s", flow, regressions):
+        if regressions is None:
+            step_log.info("No baseline for '%s' in %s", flow, baseline_store.path)
+            return
+        assert not regressions, f"Benchmark '{flow}' regressed: {'; '.join(regressions)}"
@@ -0,0 +1,41 @@
+import statistics
+import time
+
+import allure
+import pytest
+from base.step_log import step_log
+
+
+@pytest.mark.benchmark
+@allure.story("Производительность")
+@allure.feature('Масштабирование списка')
+@allure.description('Стресс-замер списка контактов: список доводится до N контактов нажатиями "Generate 50 Contacts", '
+                    'замеряются время обновления счетчика, полная прокрутка вниз и вверх и размер кучи JS. '
+                    'Размеры задаются --stress-sizes, таблица масштабирования сохраняется в --stress-report.')
+def test_scale_stress(stress_page, scaling_table, stress_size):
+    # Каждый размер начинается с чистой страницы, чтобы прокрутка вниз подгружала весь список
+    stress_page.open_page()
+    
+    # Доводим список до stress_size контактов; время обновления счетчика - медиана последних нажатий
+    generated = stress_page.generate_contacts(stress_size)
+    total = generated['total']
+    updates = generated['update_ms'][-5:]
+    
+    # Полная прокрутка вниз: таймаут растет с размером списка
+    start = time.perf_counter()
+    stress_page.scroll_to_end(expected_count=total, timeout=max(60, total / 100))
+    scroll_bottom = time.perf_counter() - start
+    stress_page.flexible_assert_word(stress_page.contact_counter_text, f"0 - {total} : {total}")
+    
+    # Прокрутка вверх
+    start = time.perf_counter()
+    stress_page.scroll_to_top()
+    scroll_top = time.perf_counter() - start
+    
+    heap = stress_page.browser_metrics(collect_garbage=True)['JSHeapUsedSize']
+    scaling_table.add(stress_size, total=total, counter_update_ms=statistics.median(updates) if updates else None,
+                      scroll_bottom_ms=scroll_bottom * 1000, scroll_top_ms=scroll_top * 1000,
+                      heap_mb=heap / 1024 ** 2)
+    
+    step_log.info("%s contacts: scroll bottom %.0f ms, scroll top %.0f ms, JS heap %.1f MiB", total,
+                  scroll_bottom * 1000, scroll_top * 1000, heap / 1024 ** 2)
@@ -1,26 +1,517 @@
+import os
+import uuid
+import warnings
+import allure
 import pytest
-from base.base_class import Base
+from base.base_class import Base, CLEAR_STRATEGIES, WAIT_ENGINES
+from base.command_tracer import command_tracer
+from base.contact_factory import ContactFactory
+from base.driver_pool import DriverPool
+from base.driver_service import service_manager
+from base.duration_schedule import DEFAULT_DURATIONS_PATH, DurationScheduling, duration_store
+from base.forensics import DEFAULT_FORENSICS_BUDGET, FailureForensics
+from base.launch_profile import DEFAULT_PROFILE_NAME, get_profile
+from base.local_server import LocalPageServer
+from base.metrics import latency
+from base.profile_template import profile_template
+from base.request_filter import DEFAULT_FILTER_REPORT, FILTER_MODES, request_filter
+from base.screenshot_writer import screenshot_writer
+from base.step_log import LOG_MODES, step_log
+from base.worker_budget import DEFAULT_CALIBRATION_PATH, resource_monitor, worker_budget
+from base.timeout_policy import ADAPTIVE_MODES, DEFAULT_HISTORY_PATH, parse_timeouts, timeout_policy
+from pages.cell_list_page import CellList
+
+
+# Опции командной строки: пул браузеров, профиль запуска, офлайн-режим, очистка полей, ожидания и таймауты, кэш,
+# бенчмарки, отчет о задержках и трассировка команд WebDriver
+def pytest_addoption(parser):
+    parser.addoption("--pool-size", type=int, default=1,
+                     help="Количество простаивающих браузеров в пуле на один воркер (0 - без пула)")
+    parser.addoption("--pool-max-uses", type=int, default=20,
+                     help="Количество тестов, после которого браузер из пула пересоздается")
+    parser.addoption("--launch-profile", default=DEFAULT_PROFILE_NAME,
+                     help="Профиль запуска браузера: default, headless-fast или debug-headed")
+    parser.addoption("--startup-budget", type=float, default=None,
+                     help="Допустимое время запуска драйвера в секундах (переопределяет бюджет профиля)")
+    parser.addoption("--offline", action="store_true", default=os.environ.get('CELLLIST_OFFLINE') == '1',
+                     help="Запускать тесты на локальной копии страницы CellList вместо GWT Showcase")
+    parser.addoption("--clear-strategy", choices=CLEAR_STRATEGIES, default=None,
+                     help="Способ очистки полей по умолчанию (переопределяет CELLLIST_CLEAR_STRATEGY)")
+    parser.addoption("--wait-engine", choices=WAIT_ENGINES, default=None,
+                     help="Движок ожидания: observer или webdriver (переопределяет CELLLIST_WAIT_ENGINE)")
+    parser.addoption("--element-cache", action="store_true", default=None,
+                     help="Кэшировать найденные элементы страниц (как CELLLIST_ELEMENT_CACHE=1)")
+    parser.addoption("--page-reset", action="store_true", default=None,
+                     help="Сбрасывать открытую страницу между тестами без перезагрузки (как CELLLIST_PAGE_RESET=1)")
+    parser.addoption("--profile-template", action="store_true", default=None,
+                     help="Запускать браузеры с копией прогретого шаблона профиля Chrome "
+                          "(как CELLLIST_PROFILE_TEMPLATE=1)")
+    parser.addoption("--request-filter", choices=FILTER_MODES, default=None,
+                     help="Блокировка запросов страниц через CDP: off, on или verify - замер без фильтра "
+                          "и проверка страницы с фильтром при первом открытии (переопределяет CELLLIST_REQUEST_FILTER)")
+    parser.addoption("--request-filter-report", default=DEFAULT_FILTER_REPORT,
+                     help="JSON-файл с замерами страниц без фильтра и сэкономленными запросами")
+    parser.addoption("--wait-timeouts", default=None,
+                     help="Таймауты get_element по типам ожидания, например clickable=10,visible=5 "
+                          "(переопределяет CELLLIST_WAIT_TIMEOUTS)")
+    parser.addoption("--poll-frequency", type=float, default=None,
+                     help="Интервал опроса WebDriverWait в секундах (переопределяет CELLLIST_POLL_FREQUENCY)")
+    parser.addoption("--adaptive-timeouts", choices=ADAPTIVE_MODES, default=None,
+                     help="Адаптивные таймауты get_element: off, record - только накапливать историю ожиданий, "
+                          "on - таймаут по p99 истории локатора (переопределяет CELLLIST_ADAPTIVE_TIMEOUTS)")
+    parser.addoption("--timeout-history", default=DEFAULT_HISTORY_PATH,
+                     help="JSON-файл истории ожиданий локаторов для адаптивных таймаутов")
+    parser.addoption("--duration-schedule", action="store_true", default=None,
+                     help="Распределять тесты по воркерам xdist от длинных к коротким по истории длительности "
+                          "(как CELLLIST_DURATION_SCHEDULE=1)")
+    parser.addoption("--durations-store", default=DEFAULT_DURATIONS_PATH,
+                     help="JSON-файл истории длительности тестов")
+    parser.addoption("--worker-budget", action="store_true", default=None,
+                     help="Подбирать число воркеров для -n auto по калибровке памяти и CPU браузера и контролировать "
+                          "память воркеров (как CELLLIST_WORKER_BUDGET=1, нужен psutil)")
+    parser.addoption("--worker-calibration", default=DEFAULT_CALIBRATION_PATH,
+                     help="JSON-файл калибровки ресурсов браузера")
+    parser.addoption("--recalibrate", action="store_true", default=False,
+                     help="Повторить калибровку, даже если есть калибровка этой машины")
+    parser.addoption("--min-free-memory", type=float, default=None,
+                     help="Порог свободной памяти в МиБ для предупреждений и ожидания воркеров "
+                          "(по умолчанию полтора пиковых объема браузера по калибровке)")
+    parser.addoption("--memory-throttle", type=float, default=60.0,
+                     help="Сколько секунд воркер ждет освобождения памяти перед тестом, 0 - только предупреждать")
+    parser.addoption("--benchmark", action="store_true", default=False,
+                     help="Запускать бенчмарки (тесты с маркером benchmark)")
+    parser.addoption("--benchmark-rounds", type=int, default=5,
+                     help="Количество повторов каждого сценария в бенчмарках")
+    parser.addoption("--benchmark-baseline", default="benchmark_baseline.json",
+                     help="JSON-файл с эталонными замерами сценариев")
+    parser.addoption("--benchmark-save", action="store_true", default=False,
+                     help="Сохранить замеры текущего прогона как эталон")
+    parser.addoption("--benchmark-tolerance", type=float, default=0.10,
+                     help="Допустимое замедление медианы времени сценария относительно эталона (0.10 - 10%%)")
+    parser.addoption("--stress-sizes", default="1000,5000,10000",
+                     help="Количества контактов для стресс-замеров списка через запятую")
+    parser.addoption("--stress-report", default="stress_report.json",
+                     help="JSON-файл с таблицей масштабирования списка для сравнения прогонов")
+    parser.addoption("--latency-report", default=os.environ.get('CELLLIST_LATENCY_REPORT', 'latency_report.json'),
+                     help="JSON-файл со статистикой задержек методов (воркер xdist добавляет свой суффикс)")
+    parser.addoption("--forensics-budget", type=float, default=DEFAULT_FORENSICS_BUDGET,
+                     help="Бюджет сбора артефактов упавшего теста в секундах (0 - только скриншот)")
+    parser.addoption("--step-log", choices=list(LOG_MODES), default=None,
+                     help="Режим журнала шагов: debug, info или quiet - только шаги и их время "
+                          "(переопределяет CELLLIST_STEP_LOG)")
+    parser.addoption("--data-seed", type=int,
+                     default=int(os.environ['CELLLIST_DATA_SEED']) if os.environ.get('CELLLIST_DATA_SEED') else None,
+                     help="Зерно генерации тестовых контактов (по умолчанию случайное, выводится в начале сессии)")
+    parser.addoption("--trace-commands", action="store_true", default=None,
+                     help="Трассировать команды WebDriver во всех тестах (как CELLLIST_TRACE_COMMANDS=1)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "isolated_browser: тест получает отдельный браузер вне пула")
+    config.addinivalue_line("markers", "benchmark: бенчмарк, запускается только с --benchmark")
+    config.addinivalue_line("markers", "round_trip_budget(limit): тест падает, если отправил больше limit "
+                                       "команд WebDriver")
+    
+    clear_strategy = config.getoption("--clear-strategy")
+    if clear_strategy:
+        Base.clear_strategy = clear_strategy
+    wait_engine = config.getoption("--wait-engine")
+    if wait_engine:
+        Base.wait_engine = wait_engine
+    if config.getoption("--element-cache"):
+        Base.element_cache_enabled = True
+    if config.getoption("--page-reset"):
+        Base.page_reset_enabled = True
+    if config.getoption("--profile-template"):
+        profile_template.enabled = True
+    if not hasattr(config, 'workerinput'):
+        # Папку шаблона задает контроллер: воркеры наследуют окружение и сохраняют в нее замеры для сводки
+        os.environ.setdefault('CELLLIST_PROFILE_TEMPLATE_RUN', uuid.uuid4().hex)
+        profile_template.set_run(os.environ['CELLLIST_PROFILE_TEMPLATE_RUN'])
+    profile_template.warm_up = warm_up_profile
+    filter_mode = config.getoption("--request-filter")
+    if filter_mode:
+        request_filter.set_mode(filter_mode)
+    if request_filter.mode == 'on':
+        request_filter.load(config.getoption("--request-filter-report"))
+    step_log_mode = config.getoption("--step-log")
+    if step_log_mode:
+        step_log.set_mode(step_log_mode)
+    if config.getoption("--trace-commands"):
+        command_tracer.enabled = True
+    wait_timeouts = config.getoption("--wait-timeouts")
+    if wait_timeouts:
+        timeout_policy.defaults.update(parse_timeouts(wait_timeouts))
+    poll_frequency = config.getoption("--poll-frequency")
+    if poll_frequency:
+        timeout_policy.poll_frequency = poll_frequency
+    if config.getoption("--worker-budget"):
+        worker_budget.enabled = True
+    if worker_budget.enabled and worker_budget.available():
+        # Порог свободной памяти воркеров берется из калибровки (контроллер записал ее до запуска воркеров)
+        worker_budget.load(config.getoption("--worker-calibration"), get_profile(config.getoption("--launch-profile")))
+        resource_monitor.min_free_mb = config.getoption("--min-free-memory") or worker_budget.min_free_mb()
+        resource_monitor.throttle_timeout = config.getoption("--memory-throttle")
+    # Длительности тестов записывает контроллер xdist (или процесс без воркеров), воркеры только выполняют тесты
+    if config.getoption("--duration-schedule"):
+        duration_store.enabled = True
+    if hasattr(config, 'workerinput'):
+        duration_store.enabled = False
+    elif duration_store.enabled:
+        duration_store.load(config.getoption("--durations-store"))
+    adaptive = config.getoption("--adaptive-timeouts")
+    if adaptive:
+        timeout_policy.set_adaptive(adaptive)
+    if timeout_policy.adaptive == 'on':
+        timeout_policy.load(config.getoption("--timeout-history"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    # Планировщик xdist по длительности тестов; без --duration-schedule используется планировщик --dist
+    if not duration_store.enabled:
+        return None
+    return DurationScheduling(config, log, duration_store)
+
+
+def pytest_runtest_logreport(report):
+    if duration_store.enabled:
+        duration_store.record(report)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    # Первая отрисовка по замерам всех воркеров (пустой профиль есть только у воркера, собравшего шаблон);
+    # папка шаблона сессии удаляется
+    if profile_template.enabled and not hasattr(config, 'workerinput') and profile_template.merge_samples():
+        for line in profile_template.summary().splitlines():
+            terminalreporter.write_line(line)
+        profile_template.remove()
+    
+    # Предсказанное и фактическое время выполнения; длительности прогона дописываются в историю
+    if not duration_store.enabled or not duration_store.current:
+        return
+    path = config.getoption("--durations-store")
+    duration_store.save(path)
+    for line in duration_store.summary().splitlines():
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"Test durations saved to {path}")
+
+
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_auto_num_workers(config):
+    # С --worker-budget число воркеров для -n auto подбирается по калибровке браузера (хук вызывается до configure)
+    if not (worker_budget.enabled or config.getoption("--worker-budget")):
+        return None
+    if not worker_budget.available():
+        worker_budget.decision = "Worker budget: psutil is not installed, using the default worker count"
+        return None
+    profile = get_profile(config.getoption("--launch-profile"))
+    path = config.getoption("--worker-calibration")
+    calibrated = config.getoption("--recalibrate") or not worker_budget.load(path, profile)
+    if calibrated:
+        worker_budget.calibrate(profile, lambda base: calibration_flow(config, base))
+        worker_budget.save(path)
+    count, reason = worker_budget.choose(browsers_per_worker=config.getoption("--pool-size"))
+    worker_budget.decision = (f"Worker budget: {count} workers; {reason}; "
+                              f"calibration {'saved to' if calibrated else 'loaded from'} {path}")
+    return count
+
+
+def pytest_report_header(config):
+    # Выбор числа воркеров выводится в заголовке прогона (хук -n auto вызывается до настройки вывода)
+    return worker_budget.decision
+
+
+def calibration_flow(config, base):
+    # Типичный сценарий для калибровки: открытие страницы, генерация контактов и прокрутка списка
+    server = None
+    if config.getoption("--offline"):
+        server = LocalPageServer()
+        server.start()
+        CellList.use_local_replica(server.url)
+    try:
+        page = CellList(base.driver)
+        page.open_page()
+        page.click_button(page.generate_50_contacts_button)
+        page.flexible_assert_word(page.contact_counter_text, "0 - 30 : 300")
+        page.scroll_to_bottom()
+        page.scroll_to_top()
+    finally:
+        if server is not None:
+            CellList.use_local_replica(None)
+            server.stop()
+
+
+def warm_up_profile(base):
+    # Прогрев шаблона профиля: открытие страницы CellList заполняет HTTP-кэш и кэш кода JS
+    CellList(base.driver).open_page()
+
+
+def pytest_collection_modifyitems(config, items):
+    # Бенчмарки пропускаются без флага --benchmark
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="Бенчмарки запускаются с --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def latency_report(request):
+    # Статистика задержек за сессию, завершается последней, чтобы учесть закрытие браузеров
+    yield latency
+    
+    if not latency.enabled:
+        return
+    path = request.config.getoption("--latency-report")
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    if worker:
+        root, extension = os.path.splitext(path)
+        path = f"{root}_{worker}{extension}"
+    latency.export_json(path)
+    
+    table = latency.format_table(latency.session_summary())
+    allure.attach(table, name="Latency summary", attachment_type=allure.attachment_type.TEXT)
+    step_log.info("Latency report saved to %s\n%s", path, table)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def request_filter_report(request):
+    # Сводка блокировки запросов; замеры режима verify дописываются в общий файл отчета
+    yield request_filter
+    
+    if request_filter.mode == 'off':
+        return
+    step_log.info("%s", request_filter.summary())
+    if request_filter.measured:
+        path = request.config.getoption("--request-filter-report")
+        request_filter.save(path)
+        step_log.info("Request filter report saved to %s", path)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def profile_template_report():
+    # Замеры первой отрисовки воркера сохраняются для общей сводки; копии воркера удаляются в конце сессии
+    yield profile_template
+    
+    if not profile_template.enabled:
+        return
+    summary = profile_template.summary()
+    allure.attach(summary, name="Profile template", attachment_type=allure.attachment_type.TEXT)
+    step_log.info("%s", summary)
+    profile_template.save_samples()
+    profile_template.cleanup()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_memory():
+    # Фоновый замер памяти браузеров и процесса воркера с --worker-budget
+    if not worker_budget.enabled or not worker_budget.available():
+        yield None
+        return
+    resource_monitor.start()
+    
+    yield resource_monitor
+    
+    resource_monitor.stop()
+    step_log.info("%s", resource_monitor.summary())
+
+
+@pytest.fixture(autouse=True)
+def memory_pressure(worker_memory):
+    # При нехватке свободной памяти тест ждет ее освобождения, чтобы не упасть по таймауту ожиданий
+    if worker_memory is not None:
+        free = worker_memory.throttle()
+        if free is not None:
+            message = (f"Memory pressure: {free:.0f} MiB free, threshold {worker_memory.min_free_mb:.0f} MiB, "
+                       f"throttled {worker_memory.throttled_seconds:.1f} s in total")
+            step_log.info("%s", message)
+            warnings.warn(message)
+    yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def timeout_history(request):
+    # История ожиданий локаторов дописывается в общий файл в конце сессии (режимы record и on)
+    yield timeout_policy
+    
+    if timeout_policy.adaptive == 'off' or not timeout_policy.recorded:
+        return
+    path = request.config.getoption("--timeout-history")
+    timeout_policy.save(path)
+    step_log.info("Timeout history saved to %s: %s locators", path, len(timeout_policy.recorded))
+
+
+@pytest.fixture(autouse=True)
+def step_log_per_test(request):
+    # Журнал шагов теста выводится одним блоком в консоль и в Allure после завершения теста
+    step_log.start_test(request.node.nodeid)
+    
+    yield step_log
+    
+    step_log.flush()
+
+
+@pytest.fixture(autouse=True)
+def latency_per_test(request):
+    # Задержки методов в рамках одного теста
+    latency.start_test(request.node.nodeid)
+    
+    yield
+    
+    summary = latency.finish_test()
+    if summary:
+        allure.attach(latency.format_table(summary), name="Latency",
+                      attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def screenshots():
+    # Скриншоты записываются на диск в фоне; в конце сессии дожидаемся записи очереди
+    yield screenshot_writer
+    
+    screenshot_writer.flush()
+    step_log.info("Screenshots written: %s, duplicates skipped: %s", screenshot_writer.written,
+                  screenshot_writer.duplicates)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def driver_service():
+    # Один процесс chromedriver на воркер xdist, сессии браузера открываются на нем по требованию
+    yield service_manager
+    
+    # Останавливаем chromedriver в конце сессии
+    service_manager.stop()
+
+
+@pytest.fixture(scope="session")
+def cell_list_server():
+    # Локальный HTTP-сервер с копией страницы CellList, один на воркер
+    server = LocalPageServer()
+    server.start()
+    
+    yield server
+    
+    server.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cell_list_target(request):
+    # В офлайн-режиме страница CellList открывается с локального сервера
+    if not request.config.getoption("--offline"):
+        yield CellList.live_url
+        return
+    
+    server = request.getfixturevalue("cell_list_server")
+    CellList.use_local_replica(server.url)
+    
+    yield CellList.local_url
+    
+    CellList.use_local_replica(None)
+
+
+@pytest.fixture(scope="session")
+def contact_factory(request):
+    # Фабрика тестовых контактов одна на воркер; зерно выводится, чтобы прогон можно было повторить
+    factory = ContactFactory(seed=request.config.getoption("--data-seed"))
+    step_log.info("Contact data seed: %s (repeat with --data-seed %s)", factory.seed, factory.seed)
+    return factory
 
 
 @pytest.fixture
-def base_fixture():
-    # Инициализация драйвера через метод Base.get_driver()
-    base = Base.get_driver()
+def contact_data(request, contact_factory):
+    # Записи контактов теста: зависят только от зерна и идентификатора теста
+    return contact_factory.for_test(request.node.nodeid)
+
+
+@pytest.fixture(scope="session")
+def launch_profile(request):
+    # Профиль запуска, выбранный через --launch-profile
+    profile = get_profile(request.config.getoption("--launch-profile"))
+    startup_budget = request.config.getoption("--startup-budget")
+    if startup_budget is not None:
+        profile.startup_budget = startup_budget
+    
+    yield profile
+    
+    # Выводим измеренное время запуска и первой навигации
+    step_log.info("%s", profile.summary())
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, driver_service, launch_profile):
+    # Пул создается один раз на воркер xdist (session-фикстура выполняется в каждом воркере)
+    pool = DriverPool(size=request.config.getoption("--pool-size"),
+                      max_uses=request.config.getoption("--pool-max-uses"),
+                      factory=lambda: Base.get_driver(profile=launch_profile))
+    
+    yield pool
+    
+    # Закрываем все браузеры пула в конце сессии
+    pool.close()
+
+
+@pytest.fixture
+def base_fixture(request, driver_pool, launch_profile):
+    # Тесты с маркером isolated_browser или запуск с --pool-size 0 получают отдельный браузер
+    isolated = driver_pool.size == 0 or request.node.get_closest_marker("isolated_browser") is not None
+    
+    # Инициализация драйвера через метод Base.get_driver() или выдача браузера из пула
+    base = Base.get_driver(profile=launch_profile) if isolated else driver_pool.checkout()
+    
+    # Трассировка команд WebDriver включается для всех тестов или для тестов с бюджетом команд
+    if command_tracer.enabled or request.node.get_closest_marker("round_trip_budget") is not None:
+        command_tracer.attach(base.driver)
     
     # Возвращаем экземпляр Base для использования в тестах
     yield base
     
-    # Завершаем тест и закрываем драйвер
-    base.test_finish()
+    # Завершаем тест: закрываем отдельный браузер или возвращаем браузер в пул
+    if isolated:
+        base.test_finish()
+    else:
+        driver_pool.checkin(base)
 
 
-# Хук для сохранения скриншота в случае провала теста
+# Хук трассировки команд WebDriver: считает команды тела теста и проверяет бюджет round_trip_budget
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    budget_marker = item.get_closest_marker("round_trip_budget")
+    if not command_tracer.enabled and budget_marker is None:
+        return (yield)
+    
+    command_tracer.start_test(item.nodeid)
+    try:
+        result = yield
+    finally:
+        trace = command_tracer.finish_test()
+        allure.attach(trace.format_table(), name="WebDriver commands",
+                      attachment_type=allure.attachment_type.TEXT)
+    
+    if budget_marker is not None:
+        limit = budget_marker.args[0]
+        if trace.total_commands > limit:
+            per_method = ", ".join(f"{method}: {count}" for method, count in
+                                   sorted(trace.by_method().items(), key=lambda item: -item[1]))
+            pytest.fail(f"Round-trip budget exceeded: {trace.total_commands} WebDriver commands, "
+                        f"budget {limit} ({per_method})", pytrace=False)
+    return result
+
+
+# Хук для сохранения скриншота и артефактов в случае провала теста
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     # Вызов теста и получение его результата
     outcome = yield
     report = outcome.get_result()
     
+    # Зерно и записи тестовых данных упавшего теста, чтобы его можно было воспроизвести
+    contact_data = item.funcargs.get('contact_data', None)
+    if contact_data is not None and report.failed:
+        report.sections.append(("contact data", contact_data.describe()))
+        step_log.info("%s", contact_data.describe())
+    
     # Получаем кортеж (base) через фикстуру
     base_fixture = item.funcargs.get('base_fixture', None)
     
@@ -31,4 +522,9 @@ def pytest_runtest_makereport(item, call):
         if report.when == "call" and report.failed and base:
             # Получаем имя теста
             test_name = item.nodeid.replace("::", "_").replace("/", "_")
-            base.get_screenshot(test_name)  # Передаем имя теста в метод скриншота
+            budget = item.config.getoption("--forensics-budget")
+            if budget > 0:
+                # Скриншот, DOM списка, логи консоли и тайминги ресурсов одним архивом
+                FailureForensics(base, CellList.contact_list['xpath'], budget=budget).attach(test_name)
+            else:
+                base.get_screenshot(test_name)  # Передаем имя теста в метод скриншота
@@ -1,50 +1,38 @@
-import random
 import re
 import allure
+from base.command_tracer import round_trip_budget
 from pages.cell_list_page import CellList
-from faker import Faker
-
-# Список возможных значений для типа контакта
-contact_types = ["Family", "Friends", "Coworkers", "Businesses", "Contacts"]
 
 
+# Бюджет команд WebDriver: открытие страницы (около 5), форма одной командой fill_fields (2), создание и проверки
+# счетчика и нового контакта (около 10), прокрутка до конца (2 в движке observer, около 30 циклом в движке
+# webdriver); 100 - запас над движком webdriver
+@round_trip_budget(100)
 @allure.story("Позитивные тесты")
 @allure.feature('Создание контакта')
 @allure.description('Тест создания нового контакта со всеми полями: '
                     'имя, фамилия, дата рождения и адрес - Случайные, тип контакта - Случайный выбор')
-def test_create_contact_full(base_fixture):
+def test_create_contact_full(base_fixture, contact_data):
     base = base_fixture  # Получаем объект base из фикстуры
     cell_list_page = CellList(base.driver)  # Инициализация класса CellList
     
     # Открываем страницу
     cell_list_page.open_page()
     
-    # Создаем объект Faker для генерации случайных данных
-    fake = Faker()
-    
-    # Генерация случайных данных: имя, фамилия и адрес
-    first_name = fake.first_name()
-    last_name = fake.last_name()
-    address = fake.address()
-    
-    # Генерация случайной даты рождения в формате "Month DD, YYYY"
-    birthday = fake.date_of_birth(minimum_age=18, maximum_age=70).strftime('%B %d, %Y')
-    
-    # Выбор случайного типа контакта
-    random_contact_type = random.choice(contact_types)
+    # Берем случайный контакт из фабрики тестовых данных: имя, фамилия, дата рождения, адрес и тип контакта
+    contact = contact_data.next()
     
-    # Вводим данные для нового контакта
-    cell_list_page.input_in_field(cell_list_page.first_name_input, first_name)
-    cell_list_page.input_in_field(cell_list_page.last_name_input, last_name)
+    # Заполняем форму нового контакта одной командой
+    form_values = cell_list_page.fill_contact(contact.form())
     
-    # Выбираем случайный тип контакта
-    cell_list_page.select_option(cell_list_page.category_select, random_contact_type, by="text")
-    
-    # Вводим дату рождения
-    cell_list_page.input_in_field(cell_list_page.birthday_input, birthday, press_enter=True)
-    
-    # Вводим адрес
-    cell_list_page.input_in_field(cell_list_page.address_input, address)
+    # Проверяем значения, оказавшиеся в полях формы (дата рождения - без ведущего нуля в дне)
+    with allure.step(f"Assert form values: {form_values}"):
+        assert form_values['first_name'] == contact.first_name
+        assert form_values['last_name'] == contact.last_name
+        assert form_values['category'] == contact.category
+        assert form_values['address'] == contact.address
+        assert re.sub(r'(?<=\s)0(\d,)', r'\1', form_values['birthday']) == contact.birthday, \
+            f"Unexpected birthday '{form_values['birthday']}'."
     
     # Нажимаем на кнопку "Create Contact"
     cell_list_page.click_button(cell_list_page.create_contact_button)
@@ -53,8 +41,8 @@ def test_create_contact_full(base_fixture):
     cell_list_page.flexible_assert_word(cell_list_page.contact_counter_text, "0 - 30 : 251")
     
     # Добавляем информацию о созданном контакте в отчёт Allure
-    with allure.step(f"Создан контакт: {first_name} {last_name}, {birthday}, {address}, {random_contact_type}"):
-        print(f"Создан контакт: {first_name} {last_name}, {birthday}, {address}, {random_contact_type}")
+    with allure.step(f"Создан контакт: {contact}"):
+        print(f"Создан контакт: {contact}")
     
     # Скроллим до конца списка после создания контакта
     cell_list_page.scroll_to_bottom()
@@ -62,44 +50,29 @@ def test_create_contact_full(base_fixture):
     # Добавляем проверку счетчика контактов после скролла
     cell_list_page.flexible_assert_word(cell_list_page.contact_counter_text, "0 - 251 : 251")
     
-    # Склеиваем сгенерированные имя и фамилию
-    expected_full_name = f"{first_name} {last_name}"
-    
     # Сравниваем имя нового контакта с ожидаемым
-    cell_list_page.flexible_assert_word(cell_list_page.new_contact_names, expected_full_name)
-    
-    # Форматируем адрес: убираем символы новой строки для корректного сравнения
-    expected_address = address.replace('\n', ' ')
+    cell_list_page.flexible_assert_word(cell_list_page.new_contact_names, contact.full_name)
     
-    # Сравниваем адрес нового контакта с ожидаемым
-    cell_list_page.flexible_assert_word(cell_list_page.new_contact_address, expected_address)
+    # Сравниваем адрес нового контакта с ожидаемым (без символов новой строки)
+    cell_list_page.flexible_assert_word(cell_list_page.new_contact_address, contact.address_flat)
 
 
 @allure.story("Позитивные тесты")
 @allure.feature('Создание контакта')
 @allure.description('Тест создания нового контакта с минимальным набором полей: '
                     'дата рождения - Случайная, тип контакта - Случайный выбор')
-def test_create_contact_min(base_fixture):
+def test_create_contact_min(base_fixture, contact_data):
     base = base_fixture  # Получаем объект base из фикстуры
     cell_list_page = CellList(base.driver)  # Инициализация класса CellList
     
     # Открываем страницу
     cell_list_page.open_page()
     
-    # Создаем объект Faker для генерации случайных данных
-    fake = Faker()
+    # Берем случайный контакт из фабрики: дата рождения в формате "Month DD, YYYY" и тип контакта
+    contact = contact_data.next()
     
-    # Генерация случайной даты рождения в формате "Month DD, YYYY"
-    birthday = fake.date_of_birth(minimum_age=18, maximum_age=70).strftime('%B %d, %Y')
-    
-    # Выбор случайного типа контакта
-    random_contact_type = random.choice(contact_types)
-    
-    # Выбираем случайный тип контакта
-    cell_list_page.select_option(cell_list_page.category_select, random_contact_type, by="text")
-    
-    # Вводим дату рождения
-    cell_list_page.input_in_field(cell_list_page.birthday_input, birthday, press_enter=True)
+    # Выбираем тип контакта и вводим дату рождения с клавиатуры
+    cell_list_page.fill_contact({'category': contact.category, 'birthday': contact.birthday_input}, mode='keyboard')
     
     # Нажимаем на кнопку "Create Contact"
     cell_list_page.click_button(cell_list_page.create_contact_button)
@@ -108,8 +81,8 @@ def test_create_contact_min(base_fixture):
     cell_list_page.flexible_assert_word(cell_list_page.contact_counter_text, "0 - 30 : 251")
     
     # Добавляем информацию о созданном контакте в отчёт Allure
-    with allure.step(f"Создан контакт: {birthday}, {random_contact_type}"):
-        print(f"Создан контакт: {birthday}, {random_contact_type}")
+    with allure.step(f"Создан контакт: {contact.birthday_input}, {contact.category}"):
+        print(f"Создан контакт: {contact.birthday_input}, {contact.category}")
     
     # Скроллим до конца списка после создания контакта
     cell_list_page.scroll_to_bottom()
@@ -120,44 +93,24 @@ def test_create_contact_min(base_fixture):
     # Выбираем новый контакт из списка для проверки
     cell_list_page.click_button(cell_list_page.new_contact_card)
     
-    # Удаляем ведущие нули перед одноцифровыми днями в дате
-    formatted_birthday = re.sub(r'(?<=\s)0(\d,)', r'\1', birthday)
-    
-    # Сравниваем дату рождения нового контакта с ожидаемой
-    cell_list_page.flexible_assert_word(cell_list_page.birthday_input, formatted_birthday)
+    # Сравниваем дату рождения нового контакта с ожидаемой (формат GWT без ведущего нуля в дне)
+    cell_list_page.flexible_assert_word(cell_list_page.birthday_input, contact.birthday)
 
 
 @allure.story("Негативные тесты")
 @allure.feature('Создание контакта')
 @allure.description('Тест создания контакта без указания даты рождения: '
                     'имя, фамилия и адрес - Случайные, тип контакта - Случайный выбор')
-def test_create_contact_neg(base_fixture):
+def test_create_contact_neg(base_fixture, contact_data):
     base = base_fixture  # Получаем объект base из фикстуры
     cell_list_page = CellList(base.driver)  # Инициализация класса CellList
     
     # Открываем страницу
     cell_list_page.open_page()
     
-    # Создаем объект Faker для генерации случайных данных
-    fake = Faker()
-    
-    # Генерация случайных данных: имя, фамилия и адрес
-    first_name = fake.first_name()
-    last_name = fake.last_name()
-    address = fake.address()
-    
-    # Выбор случайного типа контакта
-    random_contact_type = random.choice(contact_types)
-    
-    # Вводим данные для нового контакта
-    cell_list_page.input_in_field(cell_list_page.first_name_input, first_name)
-    cell_list_page.input_in_field(cell_list_page.last_name_input, last_name)
-    
-    # Выбираем случайный тип контакта
-    cell_list_page.select_option(cell_list_page.category_select, random_contact_type, by="text")
-    
-    # Вводим адрес
-    cell_list_page.input_in_field(cell_list_page.address_input, address)
+    # Берем случайный контакт из фабрики и заполняем форму без даты рождения одной командой
+    contact = contact_data.next()
+    cell_list_page.fill_contact(contact.form(birthday=False))
     
     # Нажимаем на кнопку "Create Contact"
     cell_list_page.click_button(cell_list_page.create_contact_button)
@@ -175,4 +128,27 @@ def test_create_contact_neg(base_fixture):
     with allure.step("New contact card is invisible"):
         cell_list_page.get_element(cell_list_page.new_contact_card, "invisibility")
         print("New contact not found")
-        
\ No newline at end of file
+
+
+@allure.story("Позитивные тесты")
+@allure.feature('Создание контакта')
+@allure.description('Тест пакетного создания 100 контактов со всеми полями из фабрики тестовых данных: '
+                    'проверка счетчика и наличия всех карточек одной выборкой списка')
+def test_create_contacts_bulk(base_fixture, contact_data):
+    base = base_fixture  # Получаем объект base из фикстуры
+    cell_list_page = CellList(base.driver)  # Инициализация класса CellList
+    
+    # Открываем страницу
+    cell_list_page.open_page()
+    
+    # Берем 100 контактов из фабрики и создаем их пакетом; метод сам проверяет счетчик и карточки
+    contacts = [contact_data.next() for _ in range(100)]
+    stats = cell_list_page.create_contacts(contacts)
+    
+    # Проверяем итоговое количество контактов
+    assert stats['created'] == 100, f"Unexpected created count: {stats}"
+    assert stats['total'] == 350, f"Unexpected contacts total: {stats}"
+    
+    # Добавляем скорость создания в отчёт Allure
+    with allure.step(f"Создано контактов: {stats['created']}, {stats['contacts_per_second']} контактов/с"):
+        print(f"Создано контактов: {stats['created']}, {stats['contacts_per_second']} контактов/с")
@@ -1,7 +1,12 @@
 import allure
+from base.command_tracer import round_trip_budget
 from pages.cell_list_page import CellList
 
 
+# Бюджет команд WebDriver: открытие страницы (около 5), генерация и проверки счетчика (около 6), прокрутка до
+# конца (2 в движке observer, около 40 циклом в движке webdriver для 300 контактов) и проверка списка одним
+# снимком (1); 80 - запас над движком webdriver, проверка карточек по одной превысит его
+@round_trip_budget(80)
 @allure.story("Позитивные тесты")
 @allure.feature('Генерация контактов')
 @allure.description('Тест генерации: генерируем 50 контактов.')
@@ -23,4 +28,12 @@ def test_generate_contact(base_fixture):
     
     # Проверяем количество контактов после скролла
     cell_list_page.flexible_assert_word(cell_list_page.contact_counter_text, "0 - 300 : 300")
+    
+    # Проверяем весь список одним снимком: 300 карточек подряд, у каждой есть имя и адрес
+    snapshot = cell_list_page.snapshot_contacts()
+    with allure.step(f"Assert snapshot of {len(snapshot)} contacts"):
+        assert len(snapshot) == 300, f"Expected 300 contact cards, but found {len(snapshot)}."
+        assert snapshot.has_contiguous_idx(), "Contact cards __idx are not contiguous."
+        empty = [card for card in snapshot if not card.name or not card.address]
+        assert not empty, f"Contacts without name or address: {empty[:5]}"
     
\ No newline at end of file
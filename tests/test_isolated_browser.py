@@ -0,0 +1,23 @@
+import allure
+import pytest
+from pages.cell_list_page import CellList
+
+
+@allure.story("Позитивные тесты")
+@allure.feature('Пул браузеров')
+@allure.description('Тест маркера isolated_browser: тест получает новый браузер вне пула, который еще не открывал '
+                    'страниц, и работает со страницей CellList.')
+@pytest.mark.isolated_browser
+def test_isolated_browser(base_fixture, driver_pool):
+    base = base_fixture  # Получаем объект base из фикстуры
+    
+    # Проверяем, что браузер не выдан пулом и запущен для этого теста
+    with allure.step("Browser is fresh and not pooled"):
+        assert not driver_pool.owns(base), "Isolated test got a browser from the pool"
+        assert not base.driver.navigated, "Isolated browser has already opened a page"
+        assert base.driver.reset_baseline is None, "Isolated browser has a page reset baseline"
+    
+    # Открываем страницу и проверяем количество контактов
+    cell_list_page = CellList(base.driver)  # Инициализация класса CellList
+    cell_list_page.open_page()
+    cell_list_page.flexible_assert_word(cell_list_page.contact_counter_text, "0 - 30 : 250")
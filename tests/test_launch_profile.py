@@ -0,0 +1,32 @@
+import allure
+import pytest
+from base.base_class import Base
+from pages.cell_list_page import CellList
+
+
+@allure.story("Производительность")
+@allure.feature('Профиль запуска')
+@allure.description('Тест бюджета запуска: запускаем отдельный браузер с выбранным профилем, открываем страницу '
+                    'и проверяем, что время запуска драйвера не превышает бюджет профиля.')
+def test_launch_profile_startup_budget(launch_profile, driver_service):
+    if launch_profile.startup_budget is None:
+        pytest.skip(f"Launch profile '{launch_profile.name}' has no startup budget")
+    
+    # Запускаем отдельный браузер вне пула, чтобы измерить холодный старт
+    base = Base.get_driver(profile=launch_profile)
+    try:
+        # Открываем страницу, чтобы измерить первую навигацию
+        cell_list_page = CellList(base.driver)
+        cell_list_page.open_page()
+    finally:
+        base.test_finish()
+    
+    startup_time = launch_profile.startup_times[-1]
+    navigation_time = launch_profile.first_navigation_times[-1]
+    
+    # Проверяем время запуска драйвера
+    with allure.step(f"Startup {startup_time:.3f}s, first navigation {navigation_time:.3f}s, "
+                     f"budget {launch_profile.startup_budget}s"):
+        print(launch_profile.summary())
+        assert startup_time <= launch_profile.startup_budget, \
+            f"Driver startup took {startup_time:.3f}s, budget is {launch_profile.startup_budget}s."
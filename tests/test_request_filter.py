@@ -0,0 +1,28 @@
+import allure
+from base.request_filter import request_filter
+from pages.cell_list_page import CellList
+
+
+@allure.story("Производительность")
+@allure.feature('Фильтрация запросов')
+@allure.description('Тест профиля блокировки запросов CellList в режиме verify: страница загружается без фильтра '
+                    'для замера, затем с фильтром, и проверяется, что список и счетчик работают.')
+def test_request_filter_verify(base_fixture, monkeypatch):
+    base = base_fixture  # Получаем объект base из фикстуры
+    cell_list_page = CellList(base.driver)  # Инициализация класса CellList
+    
+    # Включаем режим verify только для этого теста; сброс страницы без перезагрузки (--page-reset)
+    # отключается, чтобы страница открылась навигацией через фильтр
+    monkeypatch.setattr(request_filter, 'mode', 'verify')
+    monkeypatch.setattr(cell_list_page, 'page_reset_enabled', False)
+    
+    # Открываем страницу: замер без фильтра, загрузка с фильтром и проверка начального состояния
+    cell_list_page.open_page()
+    
+    # Проверяем, что страница работает с фильтром, и выводим сэкономленное
+    page = request_filter.pages.get(cell_list_page.url)
+    assert page is not None and 'verified' in page, f"Page {cell_list_page.url} was not verified with request filter"
+    with allure.step(f"Request filter '{page['profile']}' saved {page['blocked']['requests']} requests, "
+                     f"{page['blocked']['bytes']} bytes of {page['requests']} requests, {page['bytes']} bytes"):
+        print(f"Blocked: {page['blocked']['urls']}")
+        assert page['verified'], f"Page does not work with request filter: {page}"
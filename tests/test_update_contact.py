@@ -1,17 +1,17 @@
-import random
 import allure
+from base.command_tracer import round_trip_budget
 from pages.cell_list_page import CellList
-from faker import Faker
-
-# Список всех возможных категорий
-contact_types = ["Family", "Friends", "Coworkers", "Businesses", "Contacts"]
 
 
+# Бюджет команд WebDriver: открытие страницы и выбор контакта (около 8), очистка и ввод каждого поля одной
+# командой send_keys (8), выбор категории через Select (около 6), сохранение и проверки (около 8); в движке
+# webdriver ожидания втрое дороже. Очистка 'backspace' отправляет команду на каждый символ и превысит 100
+@round_trip_budget(100)
 @allure.story("Позитивные тесты")
 @allure.feature('Редактирование контакта')
 @allure.description('Тест редактирования существующего контакта: редактируем первый в списке. '
                     'Имя, фамилия, дата рождения и адрес — случайные. Тип контакта — случайный выбор.')
-def test_update_contact(base_fixture):
+def test_update_contact(base_fixture, contact_data):
     base = base_fixture  # Получаем объект base из фикстуры
     cell_list_page = CellList(base.driver)  # Инициализация класса CellList
     
@@ -21,26 +21,19 @@ def test_update_contact(base_fixture):
     # Выбираем первый контакт из списка для редактирования
     cell_list_page.click_button(cell_list_page.first_contact_card)
     
-    # Создаем объект Faker для генерации случайных данных
-    fake = Faker()
-    
-    # Генерация случайных данных: имя, фамилия и адрес
-    first_name = fake.first_name()
-    last_name = fake.last_name()
-    address = fake.address()
-    
-    # Генерация случайной даты рождения в формате "Month DD, YYYY"
-    birthday = fake.date_of_birth(minimum_age=18, maximum_age=70).strftime('%B %d, %Y')
+    # Берем случайный контакт из фабрики тестовых данных: имя, фамилия, дата рождения и адрес
+    contact = contact_data.next()
+    first_name = contact.first_name
+    last_name = contact.last_name
+    address = contact.address
+    birthday = contact.birthday_input
     
     # Извлекаем текущую выбранную категорию для контакта
     selected_category_element = cell_list_page.get_element(cell_list_page.category_select, "visible")['element']
     selected_category = selected_category_element.get_attribute('value')
     
-    # Исключаем текущую категорию из списка
-    available_contact_types = [contact_type for contact_type in contact_types if contact_type != selected_category]
-    
-    # Выбираем случайную новую категорию из оставшихся
-    new_contact_type = random.choice(available_contact_types)
+    # Выбираем новую категорию, отличную от текущей
+    new_contact_type = contact.category_other_than(selected_category)
     
     # Редактируем имя контакта
     cell_list_page.backspace_all_and_input(cell_list_page.first_name_input, first_name)
@@ -67,15 +60,9 @@ def test_update_contact(base_fixture):
     with allure.step(f"Обновленный контакт: {first_name} {last_name}, {birthday}, {address}, {new_contact_type}"):
         print(f"Обновленный контакт: {first_name} {last_name}, {birthday}, {address}, {new_contact_type}")
     
-    # Склеиваем сгенерированные имя и фамилию
-    expected_full_name = f"{first_name} {last_name}"
-    
     # Сравниваем имя обновленного контакта с ожидаемым
-    cell_list_page.flexible_assert_word(cell_list_page.first_contact_names, expected_full_name)
-    
-    # Форматируем адрес: убираем символы новой строки для корректного сравнения
-    expected_address = address.replace('\n', ' ')
+    cell_list_page.flexible_assert_word(cell_list_page.first_contact_names, contact.full_name)
     
-    # Сравниваем адрес обновленного контакта с ожидаемым
-    cell_list_page.flexible_assert_word(cell_list_page.first_contact_address, expected_address)
+    # Сравниваем адрес обновленного контакта с ожидаемым (без символов новой строки)
+    cell_list_page.flexible_assert_word(cell_list_page.first_contact_address, contact.address_flat)
     
\ No newline at end of file